@@ -0,0 +1,55 @@
+"""
+Compares the exact (sorting) and approximate (quantile sketch) modes
+of FrequencyBinner, in terms of run-time and deviation from equal
+bin sizes.
+
+Usage: python benchmarks/frequency_binner.py [--num-items N] [--num-bins B] [--relative-error E]
+"""
+import argparse
+from random import Random
+from time import perf_counter
+
+import numpy as np
+
+from wai.bynning import BinItem
+from wai.bynning.binners import FrequencyBinner
+from wai.bynning.extraction import IdentityExtractor
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--num-items", type=int, default=1_000_000)
+    parser.add_argument("--num-bins", type=int, default=10)
+    parser.add_argument("--relative-error", type=float, default=0.01)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    keys = np.random.default_rng(args.seed).lognormal(size=args.num_items)
+    ideal_size = args.num_items / args.num_bins
+
+    def report(name: str, seconds: float, sizes):
+        worst = max(abs(size - ideal_size) for size in sizes) / args.num_items
+        print(f"{name:<32} {seconds:8.3f}s   max size error {worst:.4%} of items")
+
+    # Exact mode, binning wrapped items
+    start = perf_counter()
+    binning = FrequencyBinner(args.num_bins).bin(BinItem.extract_from(IdentityExtractor(), keys.tolist()))
+    report("exact (bin)", perf_counter() - start, [len(bin) for bin in binning])
+
+    # Approximate mode, binning wrapped items
+    start = perf_counter()
+    binning = FrequencyBinner(args.num_bins,
+                              relative_error=args.relative_error,
+                              rand=Random(args.seed)).bin(BinItem.extract_from(IdentityExtractor(), keys.tolist()))
+    report("approximate (bin)", perf_counter() - start, [len(bin) for bin in binning])
+
+    # Approximate mode, binning the key array
+    start = perf_counter()
+    labels = FrequencyBinner(args.num_bins,
+                             relative_error=args.relative_error,
+                             rand=Random(args.seed)).bin_array(keys)
+    report("approximate (bin_array)", perf_counter() - start, np.bincount(labels, minlength=args.num_bins))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,341 @@
+"""
+Benchmark suite covering the binners and operations of wai.bynning.
+
+Each case is run for every combination of number of items and input kind
+(a list of items, a single-use generator of items, or a NumPy-backed batch),
+reporting the best run-time over a number of repeats, the throughput, and
+the peak memory allocated during a separate (traced) run.
+
+Results can be saved as a baseline (by default benchmarks/baseline.json,
+which is not version-controlled as timings are machine-specific), and later
+runs compared against it, so that regressions can be detected locally. See
+frequency_binner.py for the bin-size accuracy of FrequencyBinner's modes.
+
+Usage: python benchmarks/suite.py [--sizes 1e3,1e4,1e5] [--kinds list,generator,array]
+                                  [--bins B] [--folds F] [--ratios R1,R2,...] [--filter SUBSTRING]
+                                  [--repeat R] [--no-memory]
+                                  [--save-baseline [FILE] | --compare [FILE] [--tolerance T]]
+"""
+import argparse
+import json
+import sys
+import os
+import tracemalloc
+from collections import deque
+from random import Random
+from time import perf_counter
+from typing import Callable, Any, Dict, List, NamedTuple, Tuple, Iterable
+
+import numpy as np
+
+from wai.bynning import BinItem, BinItemBatch
+from wai.bynning.binners import (
+    CrossValidationFoldBinner, EdgesBinner, EqualWidthBinner, FreedmanDiaconisChoiceBinning, FrequencyBinner,
+    GridBinner, KeyBinner, MinSizeBinner, RiceRuleBinner, ScottsNormalReferenceRuleBinner, SplitBinner,
+    SquareRootChoiceBinner, StratifyingBinner, SturgesFormulaBinner
+)
+from wai.bynning.operations import (
+    group, group_indices, randomised_stratified_cross_validation_fold_indices,
+    randomised_stratified_cross_validation_folds, split, split_indices, stratify, stratify_indices
+)
+
+# The kinds of input the cases can be given
+KINDS = ("list", "generator", "array")
+
+# The kind reported for cases which don't take items
+NO_KIND = "none"
+
+# The default location of the baseline results
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+class Parameters(NamedTuple):
+    """
+    The non-size parameters of the cases.
+    """
+    num_bins: int
+    num_folds: int
+    ratios: Tuple[int, ...]
+
+
+class Data:
+    """
+    The randomly-generated keys for a given number of items.
+    """
+    def __init__(self, num_items: int, seed: int = 0):
+        rng = np.random.default_rng(seed)
+        self.num_items: int = num_items
+        self.reals: np.ndarray = rng.lognormal(size=num_items)
+        self.sizes: np.ndarray = rng.integers(1, 100, size=num_items)
+        self.points: np.ndarray = rng.normal(size=(num_items, 2))
+
+    def items(self, key_column: str, kind: str) -> Iterable:
+        """
+        Creates the input for a binner case.
+
+        :param key_column:  The name of the key column to bin by.
+        :param kind:        The kind of input to create.
+        :return:            The input.
+        """
+        keys = getattr(self, key_column)
+        payloads = range(self.num_items)
+
+        if kind == "array":
+            return BinItemBatch(keys, payloads)
+
+        key_list = list(map(tuple, keys.tolist())) if keys.ndim == 2 else keys.tolist()
+        items = [BinItem(key, payload) for key, payload in zip(key_list, payloads)]
+
+        return items if kind == "list" else (item for item in items)
+
+    def payloads(self, kind: str) -> Iterable:
+        """
+        Creates the input for an operation case.
+
+        :param kind:    The kind of input to create.
+        :return:        The input.
+        """
+        if kind == "array":
+            return self.reals
+
+        payloads = self.reals.tolist()
+
+        return payloads if kind == "list" else (payload for payload in payloads)
+
+
+class Case(NamedTuple):
+    """
+    A benchmark case. The prepare function creates the (untimed) input for
+    a run, and the run function performs the timed work on it. Cases which
+    don't take items are only run once per size, rather than once per kind
+    of input.
+    """
+    name: str
+    prepare: Callable[[Data, str], Any]
+    run: Callable[[Any], Any]
+    takes_items: bool = True
+
+
+def consume(result: Any, depth: int):
+    """
+    Fully consumes the (possibly lazy) result of a case.
+
+    :param result:  The result.
+    :param depth:   The depth to which the result is made of nested lazy
+                    iterables (0 if it is already materialised).
+    """
+    if depth == 0:
+        return
+
+    if isinstance(result, dict):
+        result = result.values()
+
+    if depth == 1:
+        deque(result, maxlen=0)
+        return
+
+    for element in result:
+        consume(element, depth - 1)
+
+
+def binner_case(name: str, key_column: str, create_binner: Callable[[], Any]) -> Case:
+    """
+    Creates a case which bins items with a binner.
+
+    :param name:            The name of the case.
+    :param key_column:      The data's key column to bin by.
+    :param create_binner:   Function which creates the binner.
+    :return:                The case.
+    """
+    return Case(name,
+                lambda data, kind: (create_binner(), data.items(key_column, kind)),
+                lambda prepared: prepared[0].bin(prepared[1]))
+
+
+def operation_case(name: str, operation: Callable[[Iterable], Any], depth: int) -> Case:
+    """
+    Creates a case which performs an item-based operation.
+
+    :param name:        The name of the case.
+    :param operation:   The operation, applied to the items.
+    :param depth:       The depth of lazy iterables in the operation's result.
+    :return:            The case.
+    """
+    return Case(name,
+                lambda data, kind: data.payloads(kind),
+                lambda payloads: consume(operation(payloads), depth))
+
+
+def index_case(name: str, operation: Callable[[int], Any], depth: int) -> Case:
+    """
+    Creates a case which performs an index-based operation (independent
+    of the kind of input).
+
+    :param name:        The name of the case.
+    :param operation:   The operation, applied to the number of items.
+    :param depth:       The depth of lazy iterables in the operation's result.
+    :return:            The case.
+    """
+    return Case(name,
+                lambda data, kind: data.num_items,
+                lambda num_items: consume(operation(num_items), depth),
+                takes_items=False)
+
+
+def create_cases(parameters: Parameters) -> List[Case]:
+    """
+    Creates all benchmark cases.
+
+    :param parameters:  The non-size parameters of the cases.
+    :return:            The cases.
+    """
+    num_bins, num_folds, ratios = parameters
+    named_ratios = {f"r{index}": ratio for index, ratio in enumerate(ratios)}
+    edges = np.quantile(np.random.default_rng(0).lognormal(size=1000), np.linspace(0, 1, num_bins + 1)[1:-1])
+
+    return [
+        # Binners
+        binner_case("EqualWidthBinner", "reals", lambda: EqualWidthBinner(num_bins=num_bins)),
+        binner_case("SturgesFormulaBinner", "reals", SturgesFormulaBinner),
+        binner_case("RiceRuleBinner", "reals", RiceRuleBinner),
+        binner_case("SquareRootChoiceBinner", "reals", SquareRootChoiceBinner),
+        binner_case("ScottsNormalReferenceRuleBinner", "reals", ScottsNormalReferenceRuleBinner),
+        binner_case("FreedmanDiaconisChoiceBinning", "reals", FreedmanDiaconisChoiceBinning),
+        binner_case("FrequencyBinner(exact)", "reals", lambda: FrequencyBinner(num_bins)),
+        binner_case("FrequencyBinner(exact,preserve_order)", "reals",
+                    lambda: FrequencyBinner(num_bins, preserve_order=True)),
+        binner_case("FrequencyBinner(approximate)", "reals",
+                    lambda: FrequencyBinner(num_bins, relative_error=0.01, rand=Random(0))),
+        binner_case("EdgesBinner", "reals", lambda: EdgesBinner(edges)),
+        binner_case("GridBinner", "points", lambda: GridBinner(num_bins=num_bins)),
+        binner_case("KeyBinner", "sizes", KeyBinner),
+        binner_case("MinSizeBinner", "sizes", lambda: MinSizeBinner(1000)),
+        binner_case("SplitBinner", "reals", lambda: SplitBinner(*ratios)),
+        binner_case("StratifyingBinner", "reals", lambda: StratifyingBinner(num_folds)),
+        binner_case("CrossValidationFoldBinner", "reals", lambda: CrossValidationFoldBinner(num_folds)),
+        Case("CrossValidationFoldBinner.bin_all_folds",
+             lambda data, kind: (CrossValidationFoldBinner(num_folds), data.items("reals", kind)),
+             lambda prepared: prepared[0].bin_all_folds(prepared[1])),
+        Case("SplitBinner._calculate_schedule",
+             lambda data, kind: tuple(ratio * max(data.num_items // sum(ratios), 1) for ratio in ratios),
+             SplitBinner._calculate_schedule,
+             takes_items=False),
+
+        # Operations
+        operation_case("group", lambda items: group(num_bins, items), 2),
+        operation_case("split", lambda items: split(items, **named_ratios), 2),
+        operation_case("split(randomised)", lambda items: split(items, Random(0), **named_ratios), 2),
+        operation_case("stratify", lambda items: stratify(num_folds, items), 1),
+        operation_case("randomised_stratified_cross_validation_folds",
+                       lambda items: randomised_stratified_cross_validation_folds(items, num_folds, Random(0)), 3),
+        index_case("group_indices", lambda num_items: group_indices(num_bins, num_items), 0),
+        index_case("split_indices", lambda num_items: split_indices(num_items, **named_ratios), 0),
+        index_case("stratify_indices", lambda num_items: stratify_indices(num_folds, num_items), 0),
+        index_case("randomised_stratified_cross_validation_fold_indices",
+                   lambda num_items: randomised_stratified_cross_validation_fold_indices(num_items, num_folds,
+                                                                                         Random(0)), 1),
+    ]
+
+
+def measure(case: Case, data: Data, kind: str, repeat: int, memory: bool) -> Dict[str, float]:
+    """
+    Measures the run-time (and optionally peak memory) of a case.
+
+    :param case:    The case.
+    :param data:    The data to run the case on.
+    :param kind:    The kind of input to give the case.
+    :param repeat:  The number of timed runs.
+    :param memory:  Whether to measure peak memory in a separate traced run.
+    :return:        The measurements.
+    """
+    seconds = float("inf")
+    for _ in range(repeat):
+        prepared = case.prepare(data, kind)
+        start = perf_counter()
+        case.run(prepared)
+        seconds = min(seconds, perf_counter() - start)
+
+    result = {"seconds": seconds, "items_per_second": data.num_items / seconds if seconds > 0 else float("inf")}
+
+    if memory:
+        prepared = case.prepare(data, kind)
+        tracemalloc.start()
+        try:
+            case.run(prepared)
+            result["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1e3,1e4,1e5",
+                        help="comma-separated numbers of items (e.g. 1e3,1e7)")
+    parser.add_argument("--kinds", default=",".join(KINDS),
+                        help="comma-separated kinds of input (list, generator, array)")
+    parser.add_argument("--bins", type=int, default=10)
+    parser.add_argument("--folds", type=int, default=5)
+    parser.add_argument("--ratios", default="1,2,7")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this substring")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-memory", action="store_true", help="skip peak-memory measurement")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--save-baseline", metavar="FILE", nargs="?", const=DEFAULT_BASELINE,
+                       help="save the results as a baseline")
+    group.add_argument("--compare", metavar="FILE", nargs="?", const=DEFAULT_BASELINE,
+                       help="compare the results against a saved baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="fractional slow-down (vs. the baseline) counted as a regression")
+    args = parser.parse_args()
+
+    sizes = [int(float(size)) for size in args.sizes.split(",")]
+    kinds = args.kinds.split(",")
+    for kind in kinds:
+        if kind not in KINDS:
+            parser.error(f"Unknown input kind '{kind}'")
+    parameters = Parameters(args.bins, args.folds, tuple(int(ratio) for ratio in args.ratios.split(",")))
+    cases = [case for case in create_cases(parameters) if args.filter in case.name]
+
+    baseline = {}
+    if args.compare is not None:
+        with open(args.compare) as file:
+            baseline = json.load(file)["results"]
+
+    results: Dict[str, Dict[str, float]] = {}
+    regressions: List[str] = []
+    for size in sizes:
+        data = Data(size)
+        for case in cases:
+            for kind in (kinds if case.takes_items else [NO_KIND]):
+                case_id = f"{case.name}[n={size},kind={kind},bins={args.bins},folds={args.folds},ratios={args.ratios}]"
+                result = results[case_id] = measure(case, data, kind, args.repeat, not args.no_memory)
+
+                line = f"{case_id:<110} {result['seconds']:10.4f}s {result['items_per_second']:14,.0f} items/s"
+                if "peak_bytes" in result:
+                    line += f" {result['peak_bytes'] / 2 ** 20:10.2f} MiB"
+
+                # Flag cases slower than the baseline by more than the tolerance
+                if case_id in baseline:
+                    ratio = result["seconds"] / baseline[case_id]["seconds"]
+                    line += f"   x{ratio:.2f} vs baseline"
+                    if ratio > 1 + args.tolerance:
+                        line += "   REGRESSION"
+                        regressions.append(case_id)
+
+                print(line, flush=True)
+
+    if args.save_baseline is not None:
+        with open(args.save_baseline, "w") as file:
+            json.dump({"parameters": vars(args), "results": results}, file, indent=2)
+
+    if len(regressions) > 0:
+        print(f"\n{len(regressions)} regression(s) against {args.compare}:", file=sys.stderr)
+        for case_id in regressions:
+            print(f"  {case_id}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
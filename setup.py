@@ -53,7 +53,8 @@ setup(
     author='Corey Sterling',
     author_email='coreytsterling@gmail.com',
     install_requires=[
-        "wai.common>=0.0.30"
+        "wai.common>=0.0.30",
+        "numpy"
     ],
     include_package_data=True
 )
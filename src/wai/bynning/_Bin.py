@@ -1,4 +1,5 @@
-from typing import Generic, Iterator, List
+from typing import Generic, Iterator, List, Callable, Dict, Optional, Iterable
+from weakref import WeakMethod
 
 from ._Binnable import Binnable
 from ._typing import LabelType, KeyType, ItemType
@@ -8,9 +9,59 @@ class Bin(Binnable[LabelType], Generic[LabelType, ItemType]):
     """
     Class representing a single bin of binnable items.
     """
+    __slots__ = ("_label", "_items", "_change_listeners", "_key_index", "_keys_unhashable", "_observed")
+
     def __init__(self, label: LabelType):
         self._label: LabelType = label
         self._items: List[ItemType] = []
+        self._change_listeners: List[WeakMethod] = []
+
+        # Lazily-built index from bin-key to the positions of the items with that key,
+        # and whether it can't be built because some item's bin-key isn't hashable
+        self._key_index: Optional[Dict[KeyType, List[int]]] = None
+        self._keys_unhashable: bool = False
+
+        # Whether a key index or change listener needs telling about added items,
+        # so that adding items to unobserved bins costs nothing extra
+        self._observed: bool = False
+
+    def __reduce__(self):
+        # Only the label and items need pickling (not listeners or indices)
+        return _restore_bin, (self._label, list(self._items))
+
+    def _add_change_listener(self, listener: Callable[['Bin[LabelType, ItemType]', int], None]):
+        """
+        Registers a callback to be called whenever items are added to
+        this bin, with the bin and the position of the first added item.
+        Only a weak reference to the callback is kept, so that the bin
+        doesn't keep its owner alive.
+
+        :param listener:    The callback, a bound method.
+        """
+        # Drop the listeners of owners which have since been freed
+        self._change_listeners = [ref for ref in self._change_listeners if ref() is not None]
+
+        self._change_listeners.append(WeakMethod(listener))
+        self._observed = True
+
+    def _notify_change(self, start: int):
+        """
+        Calls all registered change listeners which are still alive.
+
+        :param start:   The position of the first added item.
+        """
+        live_listeners = []
+        for ref in self._change_listeners:
+            listener = ref()
+            if listener is not None:
+                listener(self, start)
+                live_listeners.append(ref)
+
+        self._change_listeners = live_listeners
+
+        # Stop observing once there's nothing left to notify
+        if len(live_listeners) == 0 and self._key_index is None:
+            self._observed = False
 
     def add_item(self, item: ItemType):
         """
@@ -20,6 +71,92 @@ class Bin(Binnable[LabelType], Generic[LabelType, ItemType]):
         """
         self._items.append(item)
 
+        if self._observed:
+            self._on_items_added(len(self._items) - 1)
+
+    def add_items(self, items: Iterable[ItemType]):
+        """
+        Adds a number of items to the bin, in order.
+
+        :param items:   The items.
+        """
+        start = len(self._items)
+        self._items.extend(items)
+
+        if self._observed:
+            self._on_items_added(start)
+
+    def _on_items_added(self, start: int):
+        """
+        Keeps the key index (if built) up-to-date with added items, and
+        notifies any change listeners.
+
+        :param start:   The position of the first added item.
+        """
+        self._index_keys(start)
+
+        if len(self._change_listeners) > 0:
+            self._notify_change(start)
+
+    def _index_keys(self, start: int):
+        """
+        Adds the items from the given position onwards to the key index,
+        if it has been built.
+
+        :param start:   The position of the first item to add.
+        """
+        if self._key_index is None:
+            return
+
+        try:
+            for position in range(start, len(self._items)):
+                self._key_index.setdefault(self._items[position].bin_key, []).append(position)
+        except (TypeError, AttributeError):
+            self._key_index = None
+            self._keys_unhashable = True
+
+    def _get_key_index(self) -> Optional[Dict[KeyType, List[int]]]:
+        """
+        Gets the index from bin-key to the positions of the items in this
+        bin with that key, building it if necessary.
+
+        :return:    The index, or None if the items' bin-keys aren't hashable.
+        """
+        # Items are never removed, so once a bin-key isn't hashable the index can't be built
+        if self._keys_unhashable:
+            return None
+
+        if self._key_index is None:
+            key_index = {}
+            try:
+                for position, item in enumerate(self._items):
+                    key_index.setdefault(item.bin_key, []).append(position)
+            except (TypeError, AttributeError):
+                self._keys_unhashable = True
+                return None
+            self._key_index = key_index
+            self._observed = True
+
+        return self._key_index
+
+    def _key_positions(self, key: KeyType) -> List[int]:
+        """
+        Gets the positions of the items in this bin with the given bin-key.
+
+        :param key:     The bin-key.
+        :return:        The positions of the items.
+        """
+        # Use the key index if possible
+        key_index = self._get_key_index()
+        if key_index is not None:
+            try:
+                return key_index.get(key, [])
+            except TypeError:
+                pass
+
+        # Fall back to searching all items
+        return [position for position, item in enumerate(self._items) if item.bin_key == key]
+
     @property
     def bin_key(self) -> LabelType:
         """
@@ -43,6 +180,13 @@ class Bin(Binnable[LabelType], Generic[LabelType, ItemType]):
         :return:        True if the item is in this bin,
                         False if not.
         """
+        # Only need to check the items with the same bin-key as a binnable
+        if isinstance(item, Binnable) and self._get_key_index() is not None:
+            return any(
+                self._items[position] is item or self._items[position] == item
+                for position in self._key_positions(item.bin_key)
+            )
+
         return item in self._items
 
     def contains_key(self, key: KeyType) -> bool:
@@ -53,7 +197,7 @@ class Bin(Binnable[LabelType], Generic[LabelType, ItemType]):
         :return:        True if an item in the bin has the given bin-key,
                         False if not.
         """
-        return any(item.bin_key == key for item in self._items)
+        return len(self._key_positions(key)) > 0
 
     def __iter__(self) -> Iterator[ItemType]:
         """
@@ -77,7 +221,7 @@ class Bin(Binnable[LabelType], Generic[LabelType, ItemType]):
         :param key:     The key to search for.
         :return:        The items.
         """
-        return (item for item in self._items if item.bin_key == key)
+        return (self._items[position] for position in self._key_positions(key))
 
     def __len__(self) -> int:
         """
@@ -88,3 +232,16 @@ class Bin(Binnable[LabelType], Generic[LabelType, ItemType]):
     def __str__(self) -> str:
         indented_items: str = ',\n  '.join(map(str, self))
         return f"{self._label}:\n  {indented_items}"
+
+
+def _restore_bin(label: LabelType, items: List[ItemType]) -> Bin[LabelType, ItemType]:
+    """
+    Recreates a pickled bin.
+
+    :param label:   The bin's label.
+    :param items:   The bin's items.
+    :return:        The bin.
+    """
+    bin = Bin(label)
+    bin.add_items(items)
+    return bin
@@ -14,6 +14,8 @@ class BinItem(Binnable[KeyType], Generic[KeyType, PayloadType]):
     of respecifying the bin-key of another binnable, by wrapping it in this class with
     an extractor.
     """
+    __slots__ = ("_bin_key", "_payload")
+
     def __init__(self, bin_key: KeyType, item: PayloadType):
         self._bin_key: KeyType = bin_key
         self._payload: PayloadType = item
@@ -40,6 +42,10 @@ class BinItem(Binnable[KeyType], Generic[KeyType, PayloadType]):
     def __str__(self) -> str:
         return f"({self._bin_key}): {self._payload}"
 
+    def __reduce__(self):
+        # Pickle by constructor arguments, which is much faster than via slots
+        return BinItem, (self._bin_key, self._payload)
+
     @staticmethod
     def extract_from(extractor: Extractor[PayloadType, KeyType],
                      items: Iterable[PayloadType]) -> Iterator['BinItem[KeyType, PayloadType]']:
@@ -0,0 +1,96 @@
+from typing import Generic, Sequence, Union, Iterator, Iterable, Optional, List
+
+import numpy as np
+
+from ._BinItem import BinItem, PayloadType
+from ._typing import KeyType
+from .extraction import Extractor
+from .util import conservatively_cache
+
+
+class BinItemBatch(Sequence[BinItem[KeyType, PayloadType]], Generic[KeyType, PayloadType]):
+    """
+    A batch of bin-items stored as two parallel columns: an array of
+    bin-keys and a sequence of payloads. Can be binned directly by
+    Binner.bin, which bins the key array in a single vectorised pass
+    where the binner supports it. Individual bin-items are only created
+    when they are accessed, and are then kept, so that accessing the same
+    item again gives the same bin-item.
+    """
+    __slots__ = ("_keys", "_payloads", "_items")
+
+    def __init__(self, keys: np.ndarray, payloads: Sequence[PayloadType]):
+        """
+        :param keys:        The bin-key of each item.
+        :param payloads:    The items themselves.
+        """
+        keys = np.asarray(keys)
+
+        # Must have a key for every payload
+        if len(keys) != len(payloads):
+            raise ValueError(f"Got {len(keys)} bin-keys for {len(payloads)} payloads")
+
+        self._keys: np.ndarray = keys
+        self._payloads: Sequence[PayloadType] = payloads
+
+        # The bin-items created so far, by index (created on first access)
+        self._items: Optional[List[Optional[BinItem[KeyType, PayloadType]]]] = None
+
+    def __reduce__(self):
+        # The bin-items are recreated on access
+        return BinItemBatch, (self._keys, self._payloads)
+
+    @property
+    def keys(self) -> np.ndarray:
+        """
+        Gets the array of bin-keys of the items.
+        """
+        return self._keys
+
+    @property
+    def payloads(self) -> Sequence[PayloadType]:
+        """
+        Gets the payloads of the items.
+        """
+        return self._payloads
+
+    def __getitem__(self, index: Union[int, slice]) \
+            -> Union[BinItem[KeyType, PayloadType], 'BinItemBatch[KeyType, PayloadType]']:
+        if isinstance(index, slice):
+            return BinItemBatch(self._keys[index], self._payloads[index])
+
+        items = self._items
+        if items is None:
+            items = self._items = [None] * len(self._keys)
+
+        item = items[index]
+        if item is None:
+            item = items[index] = BinItem(self._keys.item(index), self._payloads[index])
+
+        return item
+
+    def __iter__(self) -> Iterator[BinItem[KeyType, PayloadType]]:
+        # Create all the bin-items at once if none have been accessed yet
+        if self._items is None:
+            self._items = list(map(BinItem, self._keys.tolist(), self._payloads))
+            return iter(self._items)
+
+        return map(self.__getitem__, range(len(self._keys)))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @staticmethod
+    def extract_from(extractor: Extractor[PayloadType, KeyType],
+                     items: Iterable[PayloadType]) -> 'BinItemBatch[KeyType, PayloadType]':
+        """
+        Creates a batch of bin-items from the given items, extracting
+        all bin-keys in a single call to the extractor.
+
+        :param extractor:   The extractor to use to extract the bin-keys.
+        :param items:       The items to create the batch for.
+        :return:            The batch of bin-items.
+        """
+        items = conservatively_cache(items, indexable=True)
+
+        return BinItemBatch(extractor.extract_batch(items), items)
@@ -0,0 +1,60 @@
+from typing import Generic, Sequence, Iterator, Union, Iterable
+
+import numpy as np
+
+from ._Bin import Bin
+from ._typing import LabelType, ItemType
+
+
+class BinView(Bin[LabelType, ItemType], Generic[LabelType, ItemType]):
+    """
+    Read-only bin whose items are a selection, by index, of a shared
+    backing sequence of items. Used by columnar binnings so that bins
+    don't have to hold their own lists of items. The indices can be an
+    array, or any other sequence of integers (e.g. a range).
+    """
+    __slots__ = ()
+
+    def __init__(self, label: LabelType, items: Sequence[ItemType], indices: Sequence[int]):
+        super().__init__(label)
+        self._items: Sequence[ItemType] = _IndexedSequence(items, indices)
+
+    @property
+    def indices(self) -> Sequence[int]:
+        """
+        Gets the indices into the backing sequence of the items in this bin.
+        """
+        return self._items.indices
+
+    def _add_change_listener(self, listener):
+        # Views are read-only, so never change
+        pass
+
+    def add_item(self, item: ItemType):
+        raise TypeError(f"Can't add items to a {type(self).__name__}")
+
+    def add_items(self, items: Iterable[ItemType]):
+        raise TypeError(f"Can't add items to a {type(self).__name__}")
+
+
+class _IndexedSequence(Sequence[ItemType]):
+    """
+    Lazy view of the elements of a sequence at a given array of indices.
+    """
+    def __init__(self, items: Sequence[ItemType], indices: Sequence[int]):
+        self._source: Sequence[ItemType] = items
+        self.indices: Sequence[int] = indices
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[ItemType, '_IndexedSequence[ItemType]']:
+        if isinstance(index, slice):
+            return _IndexedSequence(self._source, self.indices[index])
+
+        return self._source[self.indices[index]]
+
+    def __iter__(self) -> Iterator[ItemType]:
+        source = self._source
+        indices = self.indices.tolist() if isinstance(self.indices, np.ndarray) else self.indices
+        return (source[index] for index in indices)
+
+    def __len__(self) -> int:
+        return len(self.indices)
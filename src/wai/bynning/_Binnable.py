@@ -8,6 +8,8 @@ class Binnable(Generic[KeyType]):
     """
     Interface for objects that can be sorted into bins.
     """
+    __slots__ = ()
+
     @property
     @abstractmethod
     def bin_key(self) -> KeyType:
@@ -1,8 +1,12 @@
+from bisect import bisect_right
 from collections import OrderedDict
-from itertools import chain
-from typing import Generic, Iterator, Union, Iterable
+from itertools import chain, accumulate
+from typing import Generic, Iterator, Union, Iterable, Optional, List, Dict
+
+import numpy as np
 
 from ._Bin import Bin
+from ._Binnable import Binnable
 from ._typing import KeyType, ItemType, LabelType
 
 
@@ -15,6 +19,136 @@ class Binning(Generic[ItemType, LabelType]):
             (bin.label, bin) for bin in bins
         )
 
+        # Index of the bins by position, and the cumulative number of items
+        # up to and including each bin. Built lazily when first needed
+        self._bin_list: Optional[List[Bin[LabelType, ItemType]]] = None
+        self._cumulative_sizes: Optional[List[int]] = None
+
+        # Lazily-built index from bin-key to the labels of the bins containing
+        # items with that key, and whether it can't be built because some
+        # item's bin-key isn't hashable
+        self._key_index: Optional[Dict[KeyType, List[LabelType]]] = None
+        self._keys_unhashable: bool = False
+
+        # Whether the bins notify this binning of added items. Only needed
+        # once an index has been built, so unqueried binnings cost nothing
+        self._observing_bins: bool = False
+
+    def __reduce__(self):
+        # Only the bins need pickling (not the indices). Subclasses
+        # with other state should override this method
+        return type(self), (list(self._bins.values()),)
+
+    def _observe_bins(self):
+        """
+        Has the bins notify this binning whenever items are added to them,
+        so that the indices can be kept up-to-date.
+        """
+        if self._observing_bins:
+            return
+
+        for bin in self._bins.values():
+            bin._add_change_listener(self._on_items_added)
+
+        self._observing_bins = True
+
+    def _on_items_added(self, bin: Bin[LabelType, ItemType], start: int):
+        """
+        Updates the indices for items added to one of the bins. The
+        cumulative bin-sizes are rebuilt on next use, while the key
+        index (if built) is updated with the added items' bin-keys.
+
+        :param bin:     The bin the items were added to.
+        :param start:   The position in the bin of the first added item.
+        """
+        self._cumulative_sizes = None
+        self._index_keys(bin, start)
+
+    def _index_keys(self, bin: Bin[LabelType, ItemType], start: int):
+        """
+        Adds the bin-keys of a bin's items from the given position
+        onwards to the key index, if it has been built.
+
+        :param bin:     The bin.
+        :param start:   The position in the bin of the first item to add.
+        """
+        if self._key_index is None:
+            return
+
+        items = iter(bin) if start == 0 else map(bin.__getitem__, range(start, len(bin)))
+        try:
+            for item in items:
+                labels = self._key_index.setdefault(item.bin_key, [])
+                if len(labels) == 0 or labels[-1] != bin.label and bin.label not in labels:
+                    labels.append(bin.label)
+        except (TypeError, AttributeError):
+            self._key_index = None
+            self._keys_unhashable = True
+
+    def _add_bin(self, bin: Bin[LabelType, ItemType]):
+        """
+        Adds a new bin to the end of this binning.
+
+        :param bin:     The bin to add. Must have a label not already in the binning.
+        """
+        self._bins[bin.label] = bin
+        if self._observing_bins:
+            bin._add_change_listener(self._on_items_added)
+
+        # The bin list needs rebuilding as well as the indices
+        self._bin_list = None
+        self._on_items_added(bin, 0)
+
+    def _get_cumulative_sizes(self) -> List[int]:
+        """
+        Gets the cumulative number of items up to and including
+        each bin, (re)building the index if required.
+        """
+        if self._bin_list is None:
+            self._bin_list = list(self._bins.values())
+
+        if self._cumulative_sizes is None:
+            self._observe_bins()
+            self._cumulative_sizes = list(accumulate(map(len, self._bin_list)))
+
+        return self._cumulative_sizes
+
+    def _get_key_index(self) -> Optional[Dict[KeyType, List[LabelType]]]:
+        """
+        Gets the index from bin-key to the labels of the bins containing
+        items with that key, building it if necessary.
+
+        :return:    The index, or None if the items' bin-keys aren't hashable.
+        """
+        # Items are never removed, so once a bin-key isn't hashable the index can't be built
+        if self._keys_unhashable:
+            return None
+
+        # Index the keys directly, so the bins don't each need their own index
+        if self._key_index is None:
+            self._observe_bins()
+            self._key_index = {}
+            for bin in self._bins.values():
+                self._index_keys(bin, 0)
+
+        return self._key_index
+
+    def _bins_with_key(self, key: KeyType) -> Optional[List[Bin[LabelType, ItemType]]]:
+        """
+        Gets the bins which contain items with the given bin-key.
+
+        :param key:     The bin-key.
+        :return:        The bins, or None if the key index can't be used.
+        """
+        key_index = self._get_key_index()
+        if key_index is None:
+            return None
+
+        try:
+            return [self._bins[label] for label in key_index.get(key, [])]
+        except TypeError:
+            return None
+
     def __contains__(self, label: LabelType) -> bool:
         """
         Whether a bin with the given label is in this binning.
@@ -33,7 +167,12 @@ class Binning(Generic[ItemType, LabelType]):
         :return:        True if the item is in this binning,
                         False if not.
         """
-        for bin in self._bins.values():
+        # Only need to search the bins containing items with the same bin-key as a binnable
+        bins = self._bins_with_key(item.bin_key) if isinstance(item, Binnable) else None
+        if bins is None:
+            bins = self._bins.values()
+
+        for bin in bins:
             if item in bin:
                 return True
 
@@ -47,6 +186,11 @@ class Binning(Generic[ItemType, LabelType]):
         :return:        True if an item with the bin-key is in this binning,
                         False if not.
         """
+        # Use the key index if possible
+        bins = self._bins_with_key(key)
+        if bins is not None:
+            return len(bins) > 0
+
         for bin in self._bins.values():
             if bin.contains_key(key):
                 return True
@@ -81,15 +225,73 @@ class Binning(Generic[ItemType, LabelType]):
         :param index:   The index of the item to get.
         :return:        The binnable item.
         """
+        cumulative_sizes = self._get_cumulative_sizes()
+
         # Wrap the index
         index = range(self.num_items())[index]
 
-        # Find the item
-        for bin in self:
-            if index < len(bin):
-                return bin[index]
-            else:
-                index -= len(bin)
+        # Find the bin containing the item
+        bin_index = bisect_right(cumulative_sizes, index)
+        bin_start = cumulative_sizes[bin_index - 1] if bin_index > 0 else 0
+
+        return self._bin_list[bin_index][index - bin_start]
+
+    def get_items(self, indices: Iterable[int]) -> List[ItemType]:
+        """
+        Gets a number of indexed items from amongst all the items in the bins.
+
+        :param indices:     The indices of the items to get.
+        :return:            The binnable items, in the order of the indices.
+        """
+        cumulative_sizes = np.asarray(self._get_cumulative_sizes(), dtype=np.int64)
+        num_items = self.num_items()
+
+        # Wrap the indices
+        indices = np.asarray(indices if isinstance(indices, np.ndarray) else list(indices), dtype=np.int64)
+        indices = np.where(indices < 0, indices + num_items, indices)
+        if len(indices) > 0 and (indices.min() < 0 or indices.max() >= num_items):
+            raise IndexError(f"Item indices must be in [-{num_items},{num_items})")
+
+        # Find the bin containing each item
+        bin_indices = np.searchsorted(cumulative_sizes, indices, side="right")
+        bin_starts = np.concatenate(([0], cumulative_sizes))[bin_indices]
+
+        bins = self._bin_list
+        return [bins[bin_index][offset]
+                for bin_index, offset in zip(bin_indices.tolist(), (indices - bin_starts).tolist())]
+
+    def merge(self, *others: 'Binning[ItemType, LabelType]') -> 'Binning[ItemType, LabelType]':
+        """
+        Creates a new binning by combining this binning with others (e.g.
+        binnings of separate shards of a data-set). Bins with the same label
+        are concatenated, with the items of this binning first, followed by
+        those of the other binnings in the order given. Bins are ordered by
+        the first binning in which their label appears. The merged binnings
+        are not modified.
+
+        :param others:  The binnings to merge with this one.
+        :return:        The merged binning.
+        """
+        bins: OrderedDict[LabelType, Bin[LabelType, ItemType]] = OrderedDict()
+        for binning in (self,) + others:
+            for bin in binning:
+                if bin.label not in bins:
+                    bins[bin.label] = Bin(bin.label)
+                bins[bin.label].add_items(bin)
+
+        return Binning(bins.values())
+
+    def __add__(self, other: 'Binning[ItemType, LabelType]') -> 'Binning[ItemType, LabelType]':
+        """
+        Merges this binning with another. See merge.
+
+        :param other:   The other binning.
+        :return:        The merged binning.
+        """
+        if not isinstance(other, Binning):
+            return NotImplemented
+
+        return self.merge(other)
 
     def __len__(self) -> int:
         """
@@ -101,7 +303,9 @@ class Binning(Generic[ItemType, LabelType]):
         """
         Gets the total number of items across all bins.
         """
-        return sum(map(len, self))
+        cumulative_sizes = self._get_cumulative_sizes()
+
+        return cumulative_sizes[-1] if len(cumulative_sizes) > 0 else 0
 
     def __str__(self):
         return '\n'.join(map(str, self))
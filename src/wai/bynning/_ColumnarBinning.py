@@ -0,0 +1,105 @@
+from typing import Generic, Sequence, Iterator, Iterable, List
+
+import numpy as np
+
+from ._BinView import BinView
+from ._Binning import Binning
+from ._typing import ItemType, LabelType
+
+
+class ColumnarBinning(Binning[ItemType, LabelType], Generic[ItemType, LabelType]):
+    """
+    Binning which stores the bin of each item as an integer code into
+    a table of labels, rather than storing a list of items per bin.
+    Items are grouped by a stable sort of the codes, with the bins
+    being read-only views onto slices of that ordering.
+    """
+    def __init__(self, items: Sequence[ItemType], codes: np.ndarray, labels: Sequence[LabelType]):
+        """
+        :param items:   The binned items.
+        :param codes:   For each item, the index into labels of its bin.
+        :param labels:  The labels of the bins, in the order the bins should appear.
+        """
+        codes = np.asarray(codes, dtype=np.intp)
+
+        # Must have a code for every item
+        if len(codes) != len(items):
+            raise ValueError(f"Got {len(codes)} bin codes for {len(items)} items")
+
+        # Codes must refer to one of the labels
+        if len(codes) > 0 and (codes.min() < 0 or codes.max() >= len(labels)):
+            raise ValueError(f"Bin codes must be in [0,{len(labels)})")
+
+        self._items: Sequence[ItemType] = items
+        self._codes: np.ndarray = codes
+        self._labels: List[LabelType] = list(labels)
+
+        # Group the item indices by bin, preserving their order within each bin
+        self._order: np.ndarray = np.argsort(codes, kind="stable")
+        self._offsets: np.ndarray = np.concatenate(
+            ([0], np.cumsum(np.bincount(codes, minlength=len(labels))))
+        )
+
+        # Create a view for each non-empty bin
+        super().__init__(
+            BinView(label, items, self._order[start:end])
+            for label, start, end in zip(labels, self._offsets[:-1].tolist(), self._offsets[1:].tolist())
+            if end > start
+        )
+
+    def __reduce__(self):
+        # The bins are views, so are recreated from the items and codes
+        return ColumnarBinning, (self._items, self._codes, self._labels)
+
+    @staticmethod
+    def from_labels(items: Sequence[ItemType], labels: np.ndarray) -> 'ColumnarBinning[ItemType, LabelType]':
+        """
+        Creates a columnar binning from the bin label of each item (e.g. the
+        result of Binner.bin_array). Bins are ordered by the first occurrence
+        of their label, as with Binner.bin.
+
+        :param items:   The binned items.
+        :param labels:  The bin label of each item.
+        :return:        The binning.
+        """
+        labels = np.asarray(labels)
+
+        # Object labels (e.g. tuples or None) may not be orderable, so code
+        # them by hashing, which gives first-occurrence order directly
+        if labels.dtype == object:
+            label_codes = {}
+            codes = np.fromiter((label_codes.setdefault(label, len(label_codes)) for label in labels.tolist()),
+                                dtype=np.intp,
+                                count=len(labels))
+            return ColumnarBinning(items, codes, list(label_codes))
+
+        unique_labels, first_indices, codes = np.unique(labels, return_index=True, return_inverse=True)
+
+        # Renumber the codes so that bins are in order of first occurrence
+        order = np.argsort(first_indices, kind="stable")
+        renumbering = np.empty_like(order)
+        renumbering[order] = np.arange(len(order))
+
+        return ColumnarBinning(items, renumbering[codes.reshape(-1)], unique_labels[order].tolist())
+
+    @property
+    def codes(self) -> np.ndarray:
+        """
+        Gets the bin code of each item, in the original item order.
+        """
+        return self._codes
+
+    def item_iterator(self) -> Iterator[ItemType]:
+        items = self._items
+        return (items[index] for index in self._order.tolist())
+
+    def get_item(self, index: int) -> ItemType:
+        return self._items[self._order[index]]
+
+    def get_items(self, indices: Iterable[int]) -> List[ItemType]:
+        items = self._items
+        indices = indices if isinstance(indices, np.ndarray) else list(indices)
+        return [items[index] for index in self._order[indices].tolist()]
+
+    def num_items(self) -> int:
+        return len(self._codes)
@@ -0,0 +1,86 @@
+from copy import copy
+from typing import Generic, Iterable, Tuple, Dict, List
+
+from ._Bin import Bin
+from ._Binning import Binning
+from ._typing import ItemType, KeyType, LabelType
+from .binners import Binner
+
+
+class IncrementalBinning(Binning[ItemType, LabelType], Generic[ItemType, LabelType]):
+    """
+    Binning which can be extended with further items after it is created,
+    without rebinning the items already binned. Binners which hand out
+    labels in sequence (e.g. SplitBinner, StratifyingBinner) continue from
+    where they left off, and binners which bin keys independently bin the
+    further items as usual, so for these the result is the same as binning
+    all the items at once. Two-pass binners keep the configuration from the
+    original items, and bin further items against it.
+
+    MinSizeBinner is the exception: the original items are binned as if
+    they were all the items (so its last bin takes up any remainder), and
+    each extension's items go in the last bin until it is full and the rest
+    of that extension's items can fill a new bin. The bins can therefore
+    differ from binning all the items at once, e.g. with a minimum size of
+    5, binning 5 items of size 3 then extending by 3 more gives bins
+    [[0, 1], [2, 3, 4], [5, 6, 7]], rather than [[0, 1], [2, 3], [4, 5], [6, 7]].
+    """
+    def __init__(self, binner: Binner[KeyType, LabelType], items: Iterable[ItemType]):
+        """
+        :param binner:  The binner to bin the items with. A copy is kept
+                        so that the binner can be used elsewhere.
+        :param items:   The initial items to bin (and configure on).
+        """
+        # Binner must be able to continue binning after the initial items
+        if not binner._bins_incrementally:
+            raise ValueError(f"{type(binner).__name__} can't bin further items incrementally")
+
+        super().__init__(())
+
+        self._binner: Binner[KeyType, LabelType] = copy(binner)
+
+        self._add_labelled_items(self._binner._bin_items(items))
+
+    def __reduce__(self):
+        # The binner's state is needed to continue binning
+        return _restore_incremental_binning, (self._binner, list(self))
+
+    def extend(self, items: Iterable[ItemType]):
+        """
+        Bins further items into this binning.
+
+        :param items:   The further items.
+        """
+        self._add_labelled_items(self._binner._bin_more_items(items))
+
+    def _add_labelled_items(self, labelled_items: Iterable[Tuple[LabelType, ItemType]]):
+        """
+        Adds a series of labelled items to their bins, creating any
+        bins that don't exist yet.
+
+        :param labelled_items:  The bin-labels and their respective items.
+        """
+        # Group the items so each bin is only extended once
+        groups: Dict[LabelType, List[ItemType]] = {}
+        for label, item in labelled_items:
+            groups.setdefault(label, []).append(item)
+
+        for label, items in groups.items():
+            if label not in self:
+                self._add_bin(Bin(label))
+            self[label].add_items(items)
+
+
+def _restore_incremental_binning(binner: Binner[KeyType, LabelType],
+                                 bins: List[Bin[LabelType, ItemType]]) -> IncrementalBinning[ItemType, LabelType]:
+    """
+    Recreates a pickled incremental binning.
+
+    :param binner:  The binning's binner, in the state left by its last binning.
+    :param bins:    The binning's bins.
+    :return:        The incremental binning.
+    """
+    binning = IncrementalBinning.__new__(IncrementalBinning)
+    Binning.__init__(binning, bins)
+    binning._binner = binner
+    return binning
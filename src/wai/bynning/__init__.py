@@ -1,5 +1,9 @@
 from ._Bin import Bin
 from ._BinItem import BinItem
+from ._BinItemBatch import BinItemBatch
 from ._Binnable import Binnable
 from ._Binning import Binning
+from ._BinView import BinView
+from ._ColumnarBinning import ColumnarBinning
+from ._IncrementalBinning import IncrementalBinning
 from ._typing import LabelType, KeyType, ItemType
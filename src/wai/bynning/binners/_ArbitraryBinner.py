@@ -1,5 +1,5 @@
 from ._Binner import Binner
-from .._typing import KeyType, LabelType, ItemType
+from .._typing import KeyType, LabelType
 from ..extraction import Extractor
 
 
@@ -11,5 +11,9 @@ class ArbitraryBinner(Binner[KeyType, LabelType]):
     def __init__(self, label_extractor: Extractor[KeyType, LabelType]):
         self._label_extractor: Extractor[KeyType, LabelType] = label_extractor
 
-    def _bin(self, item: ItemType) -> LabelType:
-        return self._label_extractor.extract(item.bin_key)
+    @property
+    def _bins_independently(self) -> bool:
+        return True
+
+    def _bin(self, key: KeyType) -> LabelType:
+        return self._label_extractor.extract(key)
@@ -1,9 +1,20 @@
+import os
 from abc import abstractmethod
-from typing import Generic, Iterator, Iterable, Tuple
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, Future
+from itertools import islice
+from typing import Generic, Iterator, Iterable, Tuple, List, Optional, Dict, Callable, Deque
+
+import numpy as np
 
 from .._Bin import Bin
+from .._BinItemBatch import BinItemBatch
+from .._BinView import BinView
 from .._Binning import Binning
+from .._ColumnarBinning import ColumnarBinning
 from .._typing import KeyType, LabelType, ItemType
+from ..util import array_chunks
+from ..instrumentation import BinningRecord, get_recorder, record_phases, timed_phase
 
 
 class Binner(Generic[KeyType, LabelType]):
@@ -11,6 +22,35 @@ class Binner(Generic[KeyType, LabelType]):
     Interface for classes which sort binnable items into bins via their
     bin-keys.
     """
+    @property
+    def _bins_independently(self) -> bool:
+        """
+        Whether this binner (once configured) bins each key independently
+        of any other keys, so that items can be binned in any order/in
+        parallel. Binners which do should override this to return True.
+        """
+        return False
+
+    @property
+    def _bins_incrementally(self) -> bool:
+        """
+        Whether this binner can continue binning further items after a
+        binning, as if they had been appended to the items binned (see
+        IncrementalBinning). By default, only binners which bin keys
+        independently can.
+        """
+        return self._bins_independently
+
+    @property
+    def _bins_array_chunks(self) -> bool:
+        """
+        Whether this binner can bin an array of bin-keys a chunk at a time
+        (see bin_array_chunks), with each call to _bin_array continuing
+        from the state left by the previous chunk. By default, only binners
+        which bin keys independently can.
+        """
+        return self._bins_independently
+
     def _reset(self):
         """
         Resets the binner between binnings.
@@ -50,17 +90,312 @@ class Binner(Generic[KeyType, LabelType]):
 
         return ((self._bin_item(item), item) for item in items)
 
+    def _bin_more_items(self, items: Iterable[ItemType]) -> Iterator[Tuple[LabelType, ItemType]]:
+        """
+        Returns the bin labels for further items, continuing from the state
+        left by the last binning instead of resetting the binner.
+
+        :param items:   The further items to bin.
+        :return:        An iterator over the items and their respective bin-labels.
+        """
+        return ((self._bin_item(item), item) for item in items)
+
+    def _bin_array(self, keys: np.ndarray) -> np.ndarray:
+        """
+        Returns the bin labels for all the given bin-keys in a
+        single vectorised operation. Binners which support array
+        binning should override this method.
+
+        :param keys:    The array of bin-keys to bin.
+        :return:        The array of bin labels.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support array binning")
+
+    def bin_array(self, keys: np.ndarray) -> np.ndarray:
+        """
+        Calculates the bin label for each of the given bin-keys,
+        without wrapping them in binnable items.
+
+        :param keys:    The array of bin-keys.
+        :return:        The array of bin labels, in the same order as the keys.
+        """
+        # Reset the binner
+        self._reset()
+
+        return self._bin_array(np.asarray(keys))
+
+    def bin_array_chunks(self, keys: np.ndarray, chunk_size: int) -> Iterator[np.ndarray]:
+        """
+        Calculates the bin labels for the given bin-keys a chunk at a time,
+        so that only one chunk of keys needs to be in memory at once (e.g.
+        when the keys are a memory-mapped file). Binners which need all
+        keys at once (e.g. exact frequency binning) can't bin a chunk at a
+        time, and raise NotImplementedError.
+
+        :param keys:        The array of bin-keys.
+        :param chunk_size:  The number of keys to bin at a time.
+        :return:            An iterator over the label array for each chunk.
+        """
+        self._check_bins_array_chunks()
+
+        # Chunk size must be positive
+        if chunk_size < 1:
+            raise ValueError(f"Chunk size must be positive, got {chunk_size}")
+
+        # Reset the binner
+        self._reset()
+
+        return map(self._bin_array, array_chunks(keys, chunk_size))
+
+    def _check_bins_array_chunks(self):
+        """
+        Raises an error if this binner can't bin an array of bin-keys a chunk at a time.
+        """
+        if not self._bins_array_chunks:
+            raise NotImplementedError(f"{type(self).__name__} needs all bin-keys at once so can't bin "
+                                      f"them a chunk at a time, use bin_array instead")
+
     def bin(self, items: Iterable[ItemType]) -> Binning[ItemType, LabelType]:
         """
         Creates a binning of the given items.
 
-        :param items:   The items.
+        :param items:   The items, or a batch of bin-items.
+        :return:        The binning.
+        """
+        # Only do the extra work of instrumentation if it is enabled
+        recorder = get_recorder()
+        if recorder is not None:
+            return self._bin_instrumented(items, recorder)
+
+        if isinstance(items, BinItemBatch):
+            return self._bin_batch(items)
+
+        return self._create_binning(self._bin_items(items))
+
+    def _bin_instrumented(self,
+                          items: Iterable[ItemType],
+                          recorder: Callable[[BinningRecord], None]) -> Binning[ItemType, LabelType]:
+        """
+        Creates a binning of the given items as bin does, timing each
+        phase of the binning and passing a record of it to the recorder.
+        Any time not marked as another phase (see timed_phase) counts as
+        binning.
+
+        :param items:       The items, or a batch of bin-items.
+        :param recorder:    The function to pass the record to.
+        :return:            The binning.
+        """
+        with record_phases("bin") as phase_seconds:
+            if isinstance(items, BinItemBatch):
+                binning = self._bin_batch(items)
+            else:
+                binning = self._create_binning(self._bin_items(items))
+
+        recorder(BinningRecord(type(self).__name__,
+                               phase_seconds,
+                               binning.num_items(),
+                               len(binning),
+                               max(map(len, binning), default=0)))
+
+        return binning
+
+    def _bin_batch(self, batch: BinItemBatch) -> Binning[ItemType, LabelType]:
+        """
+        Creates a binning of a batch of bin-items. Bins the batch's key
+        array in a single pass if array binning is supported, creating a
+        columnar binning, otherwise bins the items one at a time.
+
+        :param batch:   The batch of bin-items.
         :return:        The binning.
         """
-        bins = {}
-        for label, item in self._bin_items(items):
-            if label not in bins:
-                bins[label] = Bin(label)
-            bins[label].add_item(item)
+        try:
+            labels = self.bin_array(batch.keys)
+        except NotImplementedError:
+            return self._create_binning(self._bin_items(batch))
+
+        with timed_phase("collect"):
+            return ColumnarBinning.from_labels(batch, labels)
 
-        return Binning(bins.values())
+    def count(self, items: Iterable[ItemType]) -> Dict[LabelType, int]:
+        """
+        Counts the number of items that would go into each bin, without
+        retaining the items (beyond any configuration pass). Batches of
+        bin-items are counted in a single pass over their key array where
+        array binning is supported.
+
+        :param items:   The items, or a batch of bin-items.
+        :return:        The number of items in each bin, by label, in
+                        order of first appearance.
+        """
+        if isinstance(items, BinItemBatch):
+            try:
+                labels = self.bin_array(items.keys)
+            except NotImplementedError:
+                pass
+            else:
+                unique_labels, first_indices, counts = np.unique(labels, return_index=True, return_counts=True)
+                order = np.argsort(first_indices, kind="stable")
+                return dict(zip(unique_labels[order].tolist(), counts[order].tolist()))
+
+        return dict(Counter(label for label, item in self._bin_items(items)))
+
+    def _num_array_labels(self) -> int:
+        """
+        Gets the number of integer labels that array binning (once
+        configured) can produce, so that dense counts include any empty
+        trailing bins. Binners which know this should override this method.
+
+        :return:    The number of labels, or 0 if unknown.
+        """
+        return 0
+
+    def count_array(self, keys: np.ndarray, chunk_size: int = 1_000_000) -> np.ndarray:
+        """
+        Counts the number of bin-keys that go into each bin, for binners
+        which produce non-negative integer labels. Keys are binned a chunk
+        at a time (see bin_array_chunks) where possible, so memory use is
+        bounded by the chunk size, otherwise they are binned all at once.
+
+        :param keys:        The array of bin-keys.
+        :param chunk_size:  The number of keys to bin at a time.
+        :return:            The dense array of counts, indexed by label.
+        """
+        counts = np.zeros(0, dtype=np.int64)
+        keys = np.asarray(keys)
+        label_chunks = self.bin_array_chunks(keys, chunk_size) if self._bins_array_chunks else [self.bin_array(keys)]
+        for labels in label_chunks:
+            # Dense counts are only possible for integer labels
+            if len(labels) > 0 and (labels.dtype.kind not in "iu" or labels.min() < 0):
+                raise ValueError(f"{type(self).__name__} doesn't produce non-negative integer labels")
+
+            chunk_counts = np.bincount(labels, minlength=len(counts))
+            chunk_counts[:len(counts)] += counts
+            counts = chunk_counts
+
+        # Include any empty trailing bins
+        num_labels = self._num_array_labels()
+        if len(counts) < num_labels:
+            counts = np.concatenate((counts, np.zeros(num_labels - len(counts), dtype=np.int64)))
+
+        return counts
+
+    @staticmethod
+    def _create_binning(labelled_items: Iterable[Tuple[LabelType, ItemType]]) -> Binning[ItemType, LabelType]:
+        """
+        Collects a series of labelled items into bins.
+
+        :param labelled_items:  The bin-labels and their respective items.
+        :return:                The binning.
+        """
+        # Group the items by label, so each bin is only extended once
+        groups: Dict[LabelType, List[ItemType]] = {}
+        for label, item in labelled_items:
+            group = groups.get(label)
+            if group is None:
+                group = groups[label] = []
+            group.append(item)
+
+        bins = []
+        for label, items in groups.items():
+            bin = Bin(label)
+            bin.add_items(items)
+            bins.append(bin)
+
+        return Binning(bins)
+
+    def _check_bins_independently(self):
+        """
+        Raises an error if this binner doesn't bin keys independently.
+        """
+        if not self._bins_independently:
+            raise ValueError(f"{type(self).__name__} doesn't bin items independently so can't bin in parallel")
+
+    def bin_parallel(self,
+                     items: Iterable[ItemType],
+                     workers: Optional[int] = None,
+                     chunk_size: int = 10000) -> Binning[ItemType, LabelType]:
+        """
+        Creates a binning of the given items in parallel across a pool of
+        processes. Only supported by binners which bin items independently.
+        The items are read a chunk at a time, and each worker bins whole
+        chunks into partial binnings (of the items' positions in the chunk,
+        so only the bin-keys are sent to the workers, and the items needn't
+        be picklable). The partial binnings are merged in order, so the bins
+        are the same as those of bin.
+
+        :param items:       The items.
+        :param workers:     The number of worker processes (defaults to the number of CPUs).
+        :param chunk_size:  The number of items to send to a worker at a time.
+        :return:            The binning.
+        """
+        self._check_bins_independently()
+
+        # Chunk size must be positive
+        if chunk_size < 1:
+            raise ValueError(f"Chunk size must be positive, got {chunk_size}")
+
+        # Read the items lazily, a chunk at a time
+        items = iter(items)
+        chunks = iter(lambda: list(islice(items, chunk_size)), [])
+
+        # Send ourselves to each worker once, rather than with every chunk
+        self._reset()
+        partial_binnings: List[Binning[ItemType, LabelType]] = []
+        with ProcessPoolExecutor(workers, initializer=_set_worker_binner, initargs=(self,)) as executor:
+            # Limit the number of chunks in flight, so the input isn't all read up-front
+            max_pending = 2 * (workers if workers is not None else os.cpu_count() or 1)
+            pending: Deque[Tuple[List[ItemType], Future]] = deque()
+            for chunk in chunks:
+                pending.append((chunk, executor.submit(_bin_chunk, [item.bin_key for item in chunk])))
+                if len(pending) >= max_pending:
+                    partial_binnings.append(_resolve_partial_binning(*pending.popleft()))
+            partial_binnings.extend(_resolve_partial_binning(*chunk_and_future) for chunk_and_future in pending)
+
+        # Combine the partial binnings in the order of their chunks
+        if len(partial_binnings) == 0:
+            return Binning(())
+
+        return partial_binnings[0].merge(*partial_binnings[1:])
+
+
+# The binner used by a worker process in Binner.bin_parallel
+_worker_binner: Optional[Binner] = None
+
+
+def _set_worker_binner(binner: Binner[KeyType, LabelType]):
+    """
+    Sets the binner used by a worker process in Binner.bin_parallel.
+    Used as the initializer of the process pool.
+
+    :param binner:  The binner.
+    """
+    global _worker_binner
+    _worker_binner = binner
+
+
+def _bin_chunk(keys: List[KeyType]) -> Binning[int, LabelType]:
+    """
+    Bins the bin-keys of a chunk of items into a partial binning of the
+    items' positions in the chunk, using the worker process's binner. Used
+    by worker processes in Binner.bin_parallel. Doesn't configure the binner
+    (which was configured before being sent).
+
+    :param keys:    The bin-keys of the chunk's items.
+    :return:        The partial binning of positions.
+    """
+    binner = _worker_binner
+
+    return Binner._create_binning((binner._bin(key), position) for position, key in enumerate(keys))
+
+
+def _resolve_partial_binning(chunk: List[ItemType], future: 'Future[Binning[int, LabelType]]') \
+        -> Binning[ItemType, LabelType]:
+    """
+    Converts a worker's partial binning of positions into a partial binning
+    of the chunk's items, as views onto the chunk.
+
+    :param chunk:   The chunk of items.
+    :param future:  The future result of binning the chunk's keys.
+    :return:        The partial binning.
+    """
+    return Binning(BinView(bin.label, chunk, list(bin)) for bin in future.result())
@@ -0,0 +1,115 @@
+import json
+from types import MappingProxyType
+from typing import Any, Mapping, Dict
+
+import numpy as np
+
+
+class BinnerConfiguration:
+    """
+    Immutable record of the state a two-pass binner generated when it was
+    fit to a set of items. Can be saved (via pickle or JSON) and used to
+    bin other sets of items with TwoPassBinner.transform, without
+    re-configuring on them.
+    """
+    __slots__ = ("_binner_type", "_values")
+
+    def __init__(self, binner_type: str, values: Mapping[str, Any]):
+        """
+        :param binner_type:     The name of the type of binner that was fit.
+        :param values:          The configuration values, by name.
+        """
+        self._binner_type: str = binner_type
+        self._values: Mapping[str, Any] = MappingProxyType(
+            {name: self._freeze(value) for name, value in values.items()}
+        )
+
+    @staticmethod
+    def _freeze(value: Any) -> Any:
+        """
+        Converts a configuration value to an immutable, plain-Python equivalent.
+
+        :param value:   The configuration value.
+        :return:        The immutable value.
+        """
+        if isinstance(value, np.ndarray):
+            value = value.tolist()
+        elif isinstance(value, np.generic):
+            return value.item()
+
+        if isinstance(value, (list, tuple)):
+            return tuple(BinnerConfiguration._freeze(element) for element in value)
+
+        return value
+
+    @property
+    def binner_type(self) -> str:
+        """
+        Gets the name of the type of binner this configuration is for.
+        """
+        return self._binner_type
+
+    @property
+    def values(self) -> Mapping[str, Any]:
+        """
+        Gets the (read-only) configuration values, by name.
+        """
+        return self._values
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Converts this configuration to a JSON-compatible dictionary.
+
+        :return:    The dictionary.
+        """
+        return {"binner_type": self._binner_type, "values": dict(self._values)}
+
+    @staticmethod
+    def from_dict(dictionary: Dict[str, Any]) -> 'BinnerConfiguration':
+        """
+        Creates a configuration from a dictionary created by to_dict.
+
+        :param dictionary:  The dictionary.
+        :return:            The configuration.
+        """
+        return BinnerConfiguration(dictionary["binner_type"], dictionary["values"])
+
+    def to_json(self) -> str:
+        """
+        Serialises this configuration to a JSON string.
+
+        :return:    The JSON string.
+        """
+        return json.dumps(self.to_dict())
+
+    @staticmethod
+    def from_json(string: str) -> 'BinnerConfiguration':
+        """
+        Deserialises a configuration from a JSON string created by to_json.
+
+        :param string:  The JSON string.
+        :return:        The configuration.
+        """
+        return BinnerConfiguration.from_dict(json.loads(string))
+
+    def __setattr__(self, name: str, value: Any):
+        # Can only set attributes during initialisation
+        if hasattr(self, name) or name not in self.__slots__:
+            raise AttributeError(f"{type(self).__name__} is immutable")
+
+        super().__setattr__(name, value)
+
+    def __reduce__(self):
+        return BinnerConfiguration, (self._binner_type, dict(self._values))
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, BinnerConfiguration):
+            return NotImplemented
+
+        return self._binner_type == other._binner_type and self._values == other._values
+
+    def __hash__(self) -> int:
+        return hash((self._binner_type, tuple(sorted(self._values.items()))))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._binner_type!r}, {dict(self._values)!r})"
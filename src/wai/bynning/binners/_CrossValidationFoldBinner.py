@@ -1,6 +1,7 @@
-from typing import Optional, Iterable, List
+from typing import Optional, Iterable, List, Iterator, Sequence, Union
 
 from ..util import conservatively_cache, frequency_divide
+from .._BinView import BinView
 from .._Binning import Binning
 from .._typing import KeyType, ItemType
 from ._TwoPassBinner import TwoPassBinner
@@ -24,12 +25,16 @@ class CrossValidationFoldBinner(TwoPassBinner[KeyType, str]):
         self._test_range: range = range(0)
         self._item_index: int = 0
 
-    def _configure(self, items: List[ItemType]):
-        # Record the number of items
-        num_items = len(items)
+    def _configure_num_items(self, num_items: int):
+        """
+        Configures the test range for the given number of items.
 
-        # Default to leave-one-out
+        :param num_items:   The number of items being binned.
+        """
+        # Default to leave-one-out, which needs at least one item
         if self._num_folds is None:
+            if num_items == 0:
+                raise ValueError("Can't create leave-one-out folds of no items")
             self._num_folds = num_items
             self._fold = self._fold % num_items
         # Must be more items than there are folds
@@ -39,6 +44,13 @@ class CrossValidationFoldBinner(TwoPassBinner[KeyType, str]):
         # Calculate the index range of the test items
         self._test_range = frequency_divide(num_items, self._num_folds, self._fold)
 
+    def _configure(self, items: List[ItemType]):
+        self._configure_num_items(len(items))
+
+    def _configure_stream(self, keys: Iterator[KeyType]):
+        # Only need to count the items
+        self._configure_num_items(sum(1 for _ in keys))
+
     def _reset(self):
         self._item_index = 0
 
@@ -79,29 +91,69 @@ class CrossValidationFoldBinner(TwoPassBinner[KeyType, str]):
 
     def bin_all_folds(self, items: Iterable[ItemType]) -> List[Binning[ItemType, str]]:
         """
-        Creates a binning for each cross-validation fold of the items.
+        Creates a binning for each cross-validation fold of the items. The
+        fold boundaries are calculated once, and the bins of each fold are
+        read-only views onto a single cached sequence of the items.
 
         :param items:   The items to bin.
         :return:        A binning for each fold.
         """
-        # Make sure we can iterate through items multiple times
+        # Make sure we can index into the items
         items = conservatively_cache(items)
+        num_items = len(items)
+
+        # Default to leave-one-out, which needs at least one item
+        num_folds = self._num_folds if self._num_folds is not None else num_items
+        if num_folds == 0:
+            raise ValueError("Can't create leave-one-out folds of no items")
+
+        # Must be more items than there are folds
+        if num_folds > num_items:
+            raise ValueError(f"{num_folds} requested but only {num_items} provided")
 
-        # Create an empty list to hold the binnings
-        binnings = []
+        return [
+            self._create_fold_binning(items, frequency_divide(num_items, num_folds, fold))
+            for fold in range(num_folds)
+        ]
+
+    @staticmethod
+    def _create_fold_binning(items: Sequence[ItemType], test_range: range) -> Binning[ItemType, str]:
+        """
+        Creates the binning for a single fold, with the bins being
+        views onto the items.
+
+        :param items:       The items being binned.
+        :param test_range:  The range of indices of the test items.
+        :return:            The fold's binning.
+        """
+        train_bin = BinView(CrossValidationFoldBinner.TRAIN_BIN_LABEL, items, _SkipRange(len(items), test_range))
+        test_bin = BinView(CrossValidationFoldBinner.TEST_BIN_LABEL, items, test_range)
+
+        # Bins are in the order their first items appear
+        bins = [test_bin, train_bin] if test_range.start == 0 else [train_bin, test_bin]
+
+        return Binning(bin for bin in bins if len(bin) > 0)
+
+
+class _SkipRange(Sequence[int]):
+    """
+    The indices [0, length), skipping over a sub-range of indices.
+    """
+    def __init__(self, length: int, skipped: range):
+        self._length: int = length
+        self._skipped: range = skipped
 
-        # Save the state of the binner so it can be restored afterwards
-        saved_state = self._fold, self._num_folds
+    def __getitem__(self, index: Union[int, slice]) -> Union[int, List[int]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
 
-        # Go to fold zero
-        self.set_fold(0)
+        index = range(len(self))[index]
 
-        # Create a binning for each fold
-        while len(binnings) == 0 or self._fold != 0:
-            binnings.append(self.bin(items))
-            self.next_fold()
+        return index if index < self._skipped.start else index + len(self._skipped)
 
-        # Restore the saved state
-        self._fold, self._num_folds = saved_state
+    def __iter__(self) -> Iterator[int]:
+        yield from range(self._skipped.start)
+        yield from range(self._skipped.stop, self._length)
 
-        return binnings
+    def __len__(self) -> int:
+        return self._length - len(self._skipped)
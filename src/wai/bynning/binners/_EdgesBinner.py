@@ -0,0 +1,90 @@
+from bisect import bisect_left, bisect_right
+from numbers import Real
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from ._Binner import Binner
+
+
+class EdgesBinner(Binner[Real, int]):
+    """
+    Binner which bins real bin-keys into the intervals between a sorted
+    list of (not necessarily uniform) bin edges. As with np.digitize,
+    label i is the interval ending at edge i, so label 0 is the underflow
+    bin and label len(edges) is the overflow bin. Intervals are closed on
+    the left (edges[i - 1] <= key < edges[i]) unless right is set, in which
+    case they are closed on the right (edges[i - 1] < key <= edges[i]), so
+    e.g. a key equal to the last edge overflows unless right is set.
+    """
+    def __init__(self,
+                 edges: Sequence[Real],
+                 *,
+                 right: bool = False,
+                 underflow: bool = True,
+                 overflow: bool = True):
+        """
+        :param edges:       The bin edges, in strictly increasing order.
+        :param right:       Whether intervals are closed on the right instead of the left.
+        :param underflow:   Whether keys in the underflow bin are allowed (otherwise
+                            they raise an error).
+        :param overflow:    Whether keys in the overflow bin are allowed (otherwise
+                            they raise an error).
+        """
+        # Must have at least one edge
+        if len(edges) < 1:
+            raise ValueError("Must specify at least one edge")
+
+        # Edges must be strictly increasing
+        if any(edge >= next_edge for edge, next_edge in zip(edges, edges[1:])):
+            raise ValueError(f"Edges must be strictly increasing, got {edges}")
+
+        self._edges: Tuple[Real, ...] = tuple(edges)
+        self._right: bool = right
+        self._underflow: bool = underflow
+        self._overflow: bool = overflow
+
+    @property
+    def edges(self) -> Tuple[Real, ...]:
+        """
+        Gets the bin edges.
+        """
+        return self._edges
+
+    @property
+    def _bins_independently(self) -> bool:
+        return True
+
+    def _num_array_labels(self) -> int:
+        return len(self._edges) + 1
+
+    def _check_in_range(self, min_label: int, max_label: int):
+        """
+        Raises an error if a range of labels includes a disabled
+        underflow/overflow bin.
+
+        :param min_label:   The lowest label.
+        :param max_label:   The highest label.
+        """
+        if not self._underflow and min_label == 0:
+            raise ValueError(f"Bin-key underflows the first edge ({self._edges[0]}) with underflow disabled")
+
+        if not self._overflow and max_label == len(self._edges):
+            raise ValueError(f"Bin-key overflows the last edge ({self._edges[-1]}) with overflow disabled")
+
+    def _bin(self, key: Real) -> int:
+        # Find the interval the key is in
+        label = bisect_left(self._edges, key) if self._right else bisect_right(self._edges, key)
+
+        self._check_in_range(label, label)
+
+        return label
+
+    def _bin_array(self, keys: np.ndarray) -> np.ndarray:
+        # Find the interval each key is in
+        labels = np.searchsorted(np.asarray(self._edges), keys, side="left" if self._right else "right").astype(np.int64)
+
+        if len(labels) > 0:
+            self._check_in_range(labels.min().item(), labels.max().item())
+
+        return labels
@@ -1,9 +1,12 @@
 from math import ceil
 from numbers import Real
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Iterator
+
+import numpy as np
 
 from ._TwoPassBinner import TwoPassBinner
 from .._Binnable import Binnable
+from ..util import array_chunks
 
 
 class EqualWidthBinner(TwoPassBinner[Real, int]):
@@ -11,6 +14,8 @@ class EqualWidthBinner(TwoPassBinner[Real, int]):
     Binner which creates bins of equal size. Can be created by specifying the
     number of bins or the width of a bin.
     """
+    _CONFIGURATION_ATTRIBUTES = ("_min", "_max", "_num_bins", "_bin_width")
+
     def __init__(self, *, num_bins: Optional[int] = None, bin_width: Optional[Real] = None):
         # Can only specify one of bin_width and num_bins
         if (bin_width is None) == (num_bins is None):
@@ -30,6 +35,10 @@ class EqualWidthBinner(TwoPassBinner[Real, int]):
         self._num_bins: Optional[int] = num_bins
         self._bin_width: Optional[Real] = bin_width
 
+        # Whether the number of bins (rather than the bin width) was supplied,
+        # so that reconfiguring doesn't depend on previously calculated values
+        self._fixed_num_bins: bool = num_bins is not None
+
     def _find_min_max(self, items: List[Binnable[Real]]) -> Tuple[Real, Real]:
         """
         Finds the minimum and maximum bin key value for the given items.
@@ -37,21 +46,102 @@ class EqualWidthBinner(TwoPassBinner[Real, int]):
         :param items:   The binnable items.
         :return:        The min and max bin-key.
         """
-        return (
-            min(Binnable.map_bin_keys(items), default=0),
-            max(Binnable.map_bin_keys(items), default=0)
-        )
+        # Only map the items to their keys once
+        keys = list(Binnable.map_bin_keys(items))
 
-    def _configure(self, items: List[Binnable[Real]]):
-        # Find the min/max keys
-        self._min, self._max = self._find_min_max(items)
+        return min(keys, default=0), max(keys, default=0)
+
+    def _find_min_max_array(self, keys: np.ndarray) -> Tuple[Real, Real]:
+        """
+        Finds the minimum and maximum value in an array of bin-keys.
+
+        :param keys:    The bin-keys.
+        :return:        The min and max bin-key.
+        """
+        if len(keys) == 0:
+            return 0, 0
+
+        return keys.min().item(), keys.max().item()
+
+    def _find_min_max_array_chunks(self, keys: np.ndarray, chunk_size: int) -> Tuple[Real, Real]:
+        """
+        Finds the minimum and maximum value in an array of bin-keys,
+        reading a chunk of keys at a time.
+
+        :param keys:        The bin-keys.
+        :param chunk_size:  The number of keys to read at a time.
+        :return:            The min and max bin-key.
+        """
+        chunk_min_maxs = [self._find_min_max_array(chunk) for chunk in array_chunks(keys, chunk_size)]
+
+        return min((chunk_min for chunk_min, _ in chunk_min_maxs), default=0), \
+               max((chunk_max for _, chunk_max in chunk_min_maxs), default=0)
+
+    def _set_range(self, min: Real, max: Real):
+        """
+        Sets the range of bin-keys covered by the bins, and calculates
+        whichever of the bin width/number of bins wasn't supplied explicitly.
+
+        :param min:     The minimum bin-key.
+        :param max:     The maximum bin-key.
+        """
+        self._min, self._max = min, max
 
         # Calculate the value that wasn't supplied explicitly
-        if self._bin_width is None:
+        if self._fixed_num_bins:
             self._bin_width = (self._max - self._min) / self._num_bins
         else:
             self._num_bins = ceil((self._max - self._min) / self._bin_width)
 
+    def _configure_num_items(self, num_items: int):
+        """
+        Configures this binner on the number of items being binned.
+        Used by subclasses which calculate the number of bins from
+        the number of items.
+
+        :param num_items:   The number of items.
+        """
+        pass
+
+    def _configure(self, items: List[Binnable[Real]]):
+        self._configure_num_items(len(items))
+
+        # Find the min/max keys
+        self._set_range(*self._find_min_max(items))
+
+    def _configure_array(self, keys: np.ndarray):
+        self._configure_num_items(len(keys))
+
+        # Find the min/max keys
+        self._set_range(*self._find_min_max_array(keys))
+
+    def _configure_array_chunks(self, keys: np.ndarray, chunk_size: int):
+        self._configure_num_items(len(keys))
+
+        # Find the min/max keys
+        self._set_range(*self._find_min_max_array_chunks(keys, chunk_size))
+
+    def _configure_stream(self, keys: Iterator[Real]):
+        # Count the keys and find the min/max in a single pass
+        num_items, min_key, max_key = 0, 0, 0
+        for key in keys:
+            if num_items == 0 or key < min_key:
+                min_key = key
+            if num_items == 0 or key > max_key:
+                max_key = key
+            num_items += 1
+
+        self._configure_num_items(num_items)
+
+        self._set_range(min_key, max_key)
+
+    @property
+    def _bins_independently(self) -> bool:
+        return True
+
+    def _num_array_labels(self) -> int:
+        return self._num_bins
+
     def _bin(self, key: Real) -> int:
         # Hack to make sure items with bin_key == self._max go in the last bin
         if key == self._max:
@@ -59,3 +149,14 @@ class EqualWidthBinner(TwoPassBinner[Real, int]):
 
         # Calculate the bin that the key should go into
         return (key - self._min) // self._bin_width
+
+    def _bin_array(self, keys: np.ndarray) -> np.ndarray:
+        # Calculate the bin that each key should go into (a zero bin-width
+        # only occurs when all keys equal the max, which is handled below)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            labels = np.floor_divide(keys - self._min, self._bin_width)
+
+        # Make sure keys equal to self._max go in the last bin
+        labels = np.where(keys == self._max, self._num_bins - 1, labels)
+
+        return labels.astype(np.int64)
@@ -1,6 +1,7 @@
 from numbers import Real
-from typing import List
+from typing import List, Iterator
 
+import numpy as np
 from wai.common.statistics import interquartile_range
 
 from .._Binnable import Binnable
@@ -18,8 +19,47 @@ class FreedmanDiaconisChoiceBinning(EqualWidthBinner):
         # in _configure
         super().__init__(bin_width=1)
 
+    @staticmethod
+    def _calculate_bin_width(iqr: Real, num_items: int) -> Real:
+        """
+        Calculates the bin width to use for the given key statistics.
+
+        :param iqr:         The inter-quartile range of the bin-keys.
+        :param num_items:   The number of items being binned.
+        :return:            The bin width.
+        """
+        return (2 * iqr) / (num_items ** (1/3))
+
+    @staticmethod
+    def _interquartile_range_array(keys: np.ndarray) -> Real:
+        """
+        Calculates the inter-quartile range of an array of bin-keys, using
+        the same quartile definition as wai.common.statistics.
+
+        :param keys:    The bin-keys.
+        :return:        The inter-quartile range.
+        """
+        ordered = np.sort(keys)
+
+        return (np.median(ordered[-len(ordered) // 2:]) - np.median(ordered[:len(ordered) // 2])).item()
+
     def _configure(self, items: List[Binnable[Real]]):
         iqr: Real = interquartile_range(Binnable.map_bin_keys(items))
-        self._bin_width = (2 * iqr) / (len(items) ** (1/3))
+        self._bin_width = self._calculate_bin_width(iqr, len(items))
 
         super()._configure(items)
+
+    def _configure_array(self, keys: np.ndarray):
+        iqr: Real = self._interquartile_range_array(keys)
+        self._bin_width = self._calculate_bin_width(iqr, len(keys))
+
+        super()._configure_array(keys)
+
+    def _configure_array_chunks(self, keys: np.ndarray, chunk_size: int):
+        # The inter-quartile range can't be combined from those of each chunk
+        raise NotImplementedError(f"{type(self).__name__} needs all bin-keys at once to find their "
+                                  f"inter-quartile range, so can't configure on them a chunk at a time")
+
+    def _configure_stream(self, keys: Iterator[Real]):
+        # The inter-quartile range requires all keys, so retain them (but not the items)
+        self._configure_array(np.asarray(list(keys)))
@@ -1,8 +1,16 @@
+from bisect import bisect_left
 from numbers import Real
-from typing import List
+from random import Random
+from typing import List, Iterator, Optional, Iterable, Dict, Any
 
-from ..util import frequency_divide
+import numpy as np
+
+from ..extraction import Extractor
+from ..instrumentation import timed_phase
+from ..util import frequency_divide, weighted_frequency_divide, QuantileSketch, take
 from .._Binnable import Binnable
+from .._BinItemBatch import BinItemBatch
+from .._Binning import Binning
 from .._typing import ItemType
 from ._TwoPassBinner import TwoPassBinner
 
@@ -12,36 +20,268 @@ class FrequencyBinner(TwoPassBinner[Real, int]):
     Puts items into bins such that all bins have the same number
     of items in them, up to a possible difference of 1. Items are
     ordered by the values of their bin-keys (which are real values).
+
+    If a relative error is given, the bins are instead only approximately
+    equal in size: the bin edges are estimated from a quantile sketch of
+    the bin-keys in bounded memory, and items are binned by comparing their
+    keys to the edges (retaining their original order). This mode supports
+    bin_array and bin_stream.
+
+    If a weight extractor is given, the bins instead have (as near as
+    possible) the same total weight of items, rather than the same number.
+
+    If preserve_order is set, exact binning doesn't reorder the items:
+    each bin's items keep their original order. The bin boundaries are
+    found by selection instead of sorting, and items with keys equal to a
+    boundary are split between bins in their original order (giving the
+    same bins as a stable sort). Exact binning of arrays always works this
+    way, and with preserve_order set also supports bin_stream.
     """
-    def __init__(self, num_bins: int):
+    _CONFIGURATION_ATTRIBUTES = ("_edges",)
+
+    def __init__(self,
+                 num_bins: int,
+                 *,
+                 relative_error: Optional[float] = None,
+                 rand: Optional[Random] = None,
+                 weight_extractor: Optional[Extractor[ItemType, Real]] = None,
+                 preserve_order: bool = False):
         if num_bins < 1:
             raise ValueError("Must specify at least one bin")
 
+        # Relative error must be a proper fraction if given
+        if relative_error is not None and not 0.0 < relative_error < 1.0:
+            raise ValueError(f"Relative error must be in (0, 1), got {relative_error}")
+
+        # The quantile sketch doesn't support weights
+        if relative_error is not None and weight_extractor is not None:
+            raise ValueError("Can't weight items in approximate mode")
+
         self._num_bins: int = num_bins
         self._ranges: List[range] = []
         self._range_index: int = 0
         self._index: int = 0
 
+        # Approximate-mode settings/state
+        self._relative_error: Optional[float] = relative_error
+        self._rand: Optional[Random] = rand
+        self._edges: List[Real] = []
+
+        # Weighted-mode settings
+        self._weight_extractor: Optional[Extractor[ItemType, Real]] = weight_extractor
+
+        # Order-preserving exact-mode settings/state
+        self._preserve_order: bool = preserve_order
+        self._labels: List[int] = []
+
+    @property
+    def is_approximate(self) -> bool:
+        """
+        Whether this binner estimates its bin edges from a quantile sketch.
+        """
+        return self._relative_error is not None
+
+    @property
+    def _bins_independently(self) -> bool:
+        # Only binning by edges is independent of item order
+        return self.is_approximate
+
+    def _get_configuration_values(self) -> Dict[str, Any]:
+        # Exact binning depends on the order of the items, so can't be exported
+        if not self.is_approximate:
+            raise NotImplementedError(f"Only approximate {type(self).__name__}s can export their configuration")
+
+        return super()._get_configuration_values()
+
+    def _configure_edges(self, keys: Iterable[Real]):
+        """
+        Estimates the bin edges from a quantile sketch of the bin-keys.
+
+        :param keys:    The bin-keys.
+        """
+        sketch = QuantileSketch(self._relative_error, self._rand)
+        sketch.update_all(keys)
+
+        self._edges = (
+            sketch.quantiles([bin / self._num_bins for bin in range(1, self._num_bins)])
+            if sketch.count > 0 else
+            []
+        )
+
     def _configure(self, items: List[ItemType]):
+        if self.is_approximate:
+            # The items are already in memory, so sketch their keys as an array
+            self._configure_edges(np.asarray(list(Binnable.map_bin_keys(items))))
+            return
+
+        # Label the items in their original order
+        if self._preserve_order:
+            keys = np.asarray(list(Binnable.map_bin_keys(items)))
+            self._labels = (
+                self.bin_weighted_array(keys, self._weight_extractor.extract_batch(items))
+                if self._weight_extractor is not None else
+                self._select_labels(keys)
+            ).tolist()
+            return
+
         # Sort the items by key
         items.sort(key=Binnable.map_bin_key)
 
         # Create ranges of items for each bin
-        self._ranges = [frequency_divide(len(items), self._num_bins, bin) for bin in range(self._num_bins)]
+        if self._weight_extractor is not None:
+            boundaries = weighted_frequency_divide(self._weight_extractor.extract_batch(items), self._num_bins).tolist()
+            self._ranges = [range(start, end) for start, end in zip(boundaries, boundaries[1:])]
+        else:
+            self._ranges = [frequency_divide(len(items), self._num_bins, bin) for bin in range(self._num_bins)]
+
+    def _configure_array(self, keys: np.ndarray):
+        # Exact binning selects the bin boundaries when binning
+        if not self.is_approximate:
+            # Keys alone don't carry weights
+            if self._weight_extractor is not None:
+                raise NotImplementedError(f"Weighted {type(self).__name__}s bin arrays via bin_weighted_array")
+            return
+
+        self._configure_edges(keys)
+
+    def _configure_stream(self, keys: Iterator[Real]):
+        if not self.is_approximate:
+            # Without reordering, the labels can be calculated from the keys alone
+            if self._preserve_order and self._weight_extractor is None:
+                self._labels = self._select_labels(np.asarray(list(keys))).tolist()
+                return
+
+            raise NotImplementedError(f"{type(self).__name__} reorders the items by key so can't bin a stream")
+
+        self._configure_edges(keys)
 
     def _reset(self):
         self._range_index = 0
         self._index = 0
 
     def _bin(self, key: Real) -> int:
-        # The bin is the range we are in
-        label = self._range_index
+        # Find the first edge the key doesn't exceed
+        if self.is_approximate:
+            return bisect_left(self._edges, key)
+
+        # Hand out the pre-calculated labels in order
+        if self._preserve_order:
+            label = self._labels[self._index]
+            self._index += 1
+            return label
+
+        # Move to the range containing this item (skipping any empty ranges)
+        while self._index not in self._ranges[self._range_index]:
+            self._range_index += 1
 
         # Move to the next item
         self._index += 1
 
-        # If we've completed this range, move to the next range
-        if self._index not in self._ranges[self._range_index]:
-            self._range_index += 1
+        # The bin is the range we are in
+        return self._range_index
+
+    def _select_labels(self, keys: np.ndarray) -> np.ndarray:
+        """
+        Calculates the exact bin label of each of the given bin-keys, without
+        sorting them. The keys at the bin boundaries are found by selection,
+        and keys equal to a boundary key are split between the bins on either
+        side of it in their original order, so the labels are the same as
+        those from stably sorting the keys.
+
+        :param keys:    The array of bin-keys.
+        :return:        The array of bin labels.
+        """
+        num_keys = len(keys)
+        if num_keys == 0:
+            return np.empty(0, dtype=np.int64)
+
+        # Calculate the (sorted) position at which each bin starts
+        starts = np.asarray([frequency_divide(num_keys, self._num_bins, bin).start for bin in range(self._num_bins)])
+
+        # Select the key at the start of each non-empty bin after the first
+        boundary_positions = starts[1:][starts[1:] < num_keys]
+        edges = np.partition(keys, boundary_positions)[boundary_positions]
+
+        # Keys between two edges go in the bin starting at the lower edge
+        labels = np.searchsorted(edges, keys, side="left").astype(np.int64)
+
+        # Keys equal to an edge could go in more than one bin
+        tied_indices = np.flatnonzero(np.searchsorted(edges, keys, side="right") != labels)
+        if len(tied_indices) == 0:
+            return labels
+
+        # Count the keys less than each distinct edge value
+        tie_values = np.unique(edges)
+        tie_indices = np.searchsorted(tie_values, keys[tied_indices])
+        num_equal = np.bincount(tie_indices, minlength=len(tie_values))
+        num_less_or_equal = np.cumsum(np.bincount(np.searchsorted(tie_values, keys), minlength=len(tie_values) + 1))
+        num_less = num_less_or_equal[:-1] - num_equal
+
+        # Calculate the sorted position of each tied key, keeping equal keys in their original order
+        order = np.argsort(tie_indices, kind="stable")
+        ordered_tie_indices = tie_indices[order]
+        rank = np.arange(len(order)) - np.searchsorted(ordered_tie_indices, ordered_tie_indices, side="left")
+        positions = np.empty(len(order), dtype=np.int64)
+        positions[order] = num_less[ordered_tie_indices] + rank
+
+        # Label the tied keys by the bin containing their sorted position
+        labels[tied_indices] = np.searchsorted(starts, positions, side="right") - 1
+
+        return labels
+
+    def bin_weighted_array(self, keys: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        """
+        Calculates the bin label for each of the given bin-keys, such that
+        all bins have (as near as possible) the same total weight of keys.
+        Keys are ordered by value (ties keep their original order), and
+        the labels are returned in the original order of the keys.
+
+        :param keys:        The array of bin-keys.
+        :param weights:     The non-negative weight of each bin-key.
+        :return:            The array of bin labels.
+        """
+        keys, weights = np.asarray(keys), np.asarray(weights)
+
+        # Must have a weight for every key
+        if keys.shape != weights.shape:
+            raise ValueError(f"Got {len(weights)} weights for {len(keys)} bin-keys")
+
+        # Divide the keys, in key order, into bins of equal weight
+        order = np.argsort(keys, kind="stable")
+        boundaries = weighted_frequency_divide(weights[order], self._num_bins)
+
+        # Label the keys in their original order
+        labels = np.empty(len(keys), dtype=np.int64)
+        labels[order] = np.repeat(np.arange(self._num_bins), np.diff(boundaries))
+
+        return labels
+
+    def _num_array_labels(self) -> int:
+        return len(self._edges) + 1
+
+    def _bin_batch(self, batch: BinItemBatch) -> Binning:
+        # Exact binning (without preserve_order) puts the items of each bin in
+        # key order, so order the batch by key first, giving the same binning
+        # as for any other iterable of the items
+        if not self.is_approximate and not self._preserve_order and self._weight_extractor is None:
+            with timed_phase("configure"):
+                order = np.argsort(batch.keys, kind="stable")
+                batch = BinItemBatch(batch.keys[order], list(take(batch.payloads, order)))
+
+        return super()._bin_batch(batch)
+
+    def count(self, items: Iterable[ItemType]) -> Dict[int, int]:
+        counts = super().count(items)
+
+        # Exact binning (without preserve_order) creates the bins in key order,
+        # which is label order, whereas batches are counted in their original order
+        if not self.is_approximate and not self._preserve_order:
+            counts = dict(sorted(counts.items()))
+
+        return counts
+
+    def _bin_array(self, keys: np.ndarray) -> np.ndarray:
+        if not self.is_approximate:
+            return self._select_labels(keys)
 
-        return label
+        return np.searchsorted(np.asarray(self._edges), keys, side="left").astype(np.int64)
@@ -0,0 +1,206 @@
+from math import ceil
+from numbers import Real
+from typing import Optional, Tuple, List, Union, Sequence
+
+import numpy as np
+
+from .._Binnable import Binnable
+from ..util import array_chunks
+from ._TwoPassBinner import TwoPassBinner
+
+
+class GridBinner(TwoPassBinner[Tuple[Real, ...], int]):
+    """
+    Multi-dimensional equal-width binner, which bins items with tuples of
+    real bin-keys into the cells of a grid. Each axis is divided as by an
+    EqualWidthBinner, by specifying the number of bins or the width of a
+    bin (either for all axes, or per axis). Labels are the flattened
+    (row-major) index of each cell, which can be converted back to per-axis
+    bin indices with cell. Only cells containing items get bins, so binning
+    no items gives an empty binning.
+    """
+    _CONFIGURATION_ATTRIBUTES = ("_mins", "_maxs", "_num_bins", "_bin_widths")
+
+    def __init__(self,
+                 *,
+                 num_bins: Optional[Union[int, Sequence[int]]] = None,
+                 bin_width: Optional[Union[Real, Sequence[Real]]] = None):
+        # Can only specify one of bin_width and num_bins
+        if (bin_width is None) == (num_bins is None):
+            raise ValueError("Must specify exactly one of bin_width and num_bins")
+
+        # Make sure at least one bin is specified per axis if at all
+        if num_bins is not None and np.min(num_bins) < 1:
+            raise ValueError(f"Number of bins must be positive, got {num_bins}")
+
+        # Make sure the bin widths are positive if specified at all
+        if bin_width is not None and np.min(bin_width) <= 0.0:
+            raise ValueError(f"Bin width must be positive, got {bin_width}")
+
+        # The requested number of bins/bin width, for all axes or per axis
+        self._requested_num_bins: Optional[Union[int, Sequence[int]]] = num_bins
+        self._requested_bin_width: Optional[Union[Real, Sequence[Real]]] = bin_width
+
+        # Per-axis state generated by configuration
+        self._mins: Tuple[Real, ...] = ()
+        self._maxs: Tuple[Real, ...] = ()
+        self._num_bins: Tuple[int, ...] = ()
+        self._bin_widths: Tuple[Real, ...] = ()
+
+    @property
+    def num_dimensions(self) -> int:
+        """
+        Gets the number of axes of the grid, as of the last configuration.
+        """
+        return len(self._num_bins)
+
+    def cell(self, label: int) -> Tuple[int, ...]:
+        """
+        Gets the per-axis bin indices of the cell with the given label.
+
+        :param label:   The (flattened) cell label.
+        :return:        The bin index on each axis.
+        """
+        return tuple(index.item() for index in np.unravel_index(label, self._num_bins))
+
+    def _per_axis(self, value: Union[Real, Sequence[Real]], num_dimensions: int) -> List[Real]:
+        """
+        Expands a requested value to one value per axis.
+
+        :param value:           The value for all axes, or per axis.
+        :param num_dimensions:  The number of axes.
+        :return:                The value for each axis.
+        """
+        if np.ndim(value) == 0:
+            return [value] * num_dimensions
+
+        # Must have one value per axis
+        if len(value) != num_dimensions:
+            raise ValueError(f"Got {len(value)} per-axis values for {num_dimensions}-dimensional keys")
+
+        return list(value)
+
+    def _set_ranges(self, mins: np.ndarray, maxs: np.ndarray):
+        """
+        Sets the range of bin-keys covered by the grid on each axis, and
+        calculates whichever of the bin widths/numbers of bins weren't
+        supplied explicitly.
+
+        :param mins:    The minimum bin-key on each axis.
+        :param maxs:    The maximum bin-key on each axis.
+        """
+        self._mins, self._maxs = tuple(mins.tolist()), tuple(maxs.tolist())
+
+        if self._requested_num_bins is not None:
+            self._num_bins = tuple(self._per_axis(self._requested_num_bins, len(mins)))
+            self._bin_widths = tuple((axis_max - axis_min) / num_bins
+                                     for axis_min, axis_max, num_bins in zip(self._mins, self._maxs, self._num_bins))
+        else:
+            self._bin_widths = tuple(self._per_axis(self._requested_bin_width, len(mins)))
+            self._num_bins = tuple(max(ceil((axis_max - axis_min) / bin_width), 1)
+                                   for axis_min, axis_max, bin_width in zip(self._mins, self._maxs, self._bin_widths))
+
+    def _check_keys(self, keys: np.ndarray, configured: bool = False):
+        """
+        Checks that an array of keys has one row per item.
+
+        :param keys:        The array of bin-keys.
+        :param configured:  Whether to also check that the rows have one
+                            key per axis of the configured grid.
+        """
+        if keys.ndim != 2:
+            raise ValueError(f"Grid keys must be a 2-D (items x axes) array, got {keys.ndim} dimensions")
+
+        if configured and keys.shape[1] != self.num_dimensions:
+            raise ValueError(f"Got {keys.shape[1]}-dimensional bin-keys for a {self.num_dimensions}-dimensional grid")
+
+    def _configure(self, items: List[Binnable[Tuple[Real, ...]]]):
+        self._configure_array(np.asarray(list(Binnable.map_bin_keys(items))))
+
+    def _configure_empty(self, keys: np.ndarray):
+        """
+        Configures a grid covering only the origin for an empty array of
+        bin-keys, which has no rows to find the range of each axis from.
+        The number of axes is taken from the array if it is 2-D, otherwise
+        from the per-axis values requested (if any).
+
+        :param keys:    The empty array of bin-keys.
+        """
+        if keys.ndim == 2:
+            num_dimensions = keys.shape[1]
+        else:
+            requested = self._requested_num_bins if self._requested_num_bins is not None else self._requested_bin_width
+            num_dimensions = len(requested) if np.ndim(requested) > 0 else 0
+
+        self._set_ranges(np.zeros(num_dimensions), np.zeros(num_dimensions))
+
+    def _configure_array(self, keys: np.ndarray):
+        # Empty keys give no rows to find the ranges from
+        if len(keys) == 0:
+            self._configure_empty(keys)
+            return
+
+        self._check_keys(keys)
+
+        # Find the min/max keys on each axis in a single pass each
+        self._set_ranges(keys.min(axis=0), keys.max(axis=0))
+
+    def _configure_array_chunks(self, keys: np.ndarray, chunk_size: int):
+        # Empty keys give no rows to find the ranges from
+        if len(keys) == 0:
+            self._configure_empty(keys)
+            return
+
+        self._check_keys(keys)
+
+        # Find the min/max keys on each axis of each chunk, then across chunks
+        chunk_mins, chunk_maxs = zip(*((chunk.min(axis=0), chunk.max(axis=0))
+                                       for chunk in array_chunks(keys, chunk_size)))
+        self._set_ranges(np.min(chunk_mins, axis=0), np.max(chunk_maxs, axis=0))
+
+    @property
+    def _bins_independently(self) -> bool:
+        return True
+
+    def _num_array_labels(self) -> int:
+        return int(np.prod(self._num_bins))
+
+    def _bin(self, key: Tuple[Real, ...]) -> int:
+        # Must have a key value for each axis
+        if len(key) != self.num_dimensions:
+            raise ValueError(f"Got {len(key)}-dimensional bin-key {key} for a {self.num_dimensions}-dimensional grid")
+
+        label = 0
+        for value, axis_min, axis_max, num_bins, bin_width in zip(key, self._mins, self._maxs,
+                                                                  self._num_bins, self._bin_widths):
+            # Same calculation as EqualWidthBinner, per axis
+            index = num_bins - 1 if value == axis_max else int((value - axis_min) // bin_width)
+
+            # Keys outside the grid have no cell
+            if not 0 <= index < num_bins:
+                raise ValueError(f"Bin-key {key} is outside the grid")
+
+            label = label * num_bins + index
+
+        return label
+
+    def _bin_array(self, keys: np.ndarray) -> np.ndarray:
+        # No keys to bin (which may not be 2-D)
+        if len(keys) == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        self._check_keys(keys, configured=True)
+
+        # Calculate the bin that each key should go into on each axis
+        mins, maxs = np.asarray(self._mins), np.asarray(self._maxs)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            indices = np.floor_divide(keys - mins, np.asarray(self._bin_widths))
+
+        # Make sure keys equal to the max go in the last bin of each axis
+        indices = np.where(keys == maxs, np.asarray(self._num_bins) - 1, indices).astype(np.int64)
+
+        # Flatten the per-axis indices into cell labels
+        try:
+            return np.ravel_multi_index(tuple(indices.T), self._num_bins).astype(np.int64)
+        except ValueError:
+            raise ValueError("Some bin-keys are outside the grid")
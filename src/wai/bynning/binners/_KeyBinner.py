@@ -1,3 +1,5 @@
+import numpy as np
+
 from .._typing import KeyType
 from ._Binner import Binner
 
@@ -6,5 +8,12 @@ class KeyBinner(Binner[KeyType, KeyType]):
     """
     Binner which just makes a new bin per encountered bin-key.
     """
+    @property
+    def _bins_independently(self) -> bool:
+        return True
+
     def _bin(self, key: KeyType) -> KeyType:
         return key
+
+    def _bin_array(self, keys: np.ndarray) -> np.ndarray:
+        return keys
@@ -1,5 +1,7 @@
 from numbers import Real
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Iterator
+
+import numpy as np
 
 from .._Binnable import Binnable
 from ._EqualWidthBinner import EqualWidthBinner
@@ -22,3 +24,10 @@ class ManualBinner(EqualWidthBinner):
 
     def _find_min_max(self, items: List[Binnable[Real]]) -> Tuple[Real, Real]:
         return self._min, self._max
+
+    def _find_min_max_array(self, keys: np.ndarray) -> Tuple[Real, Real]:
+        return self._min, self._max
+
+    def _configure_stream(self, keys: Iterator[Real]):
+        # No need to look at the keys as the range is fixed
+        self._set_range(self._min, self._max)
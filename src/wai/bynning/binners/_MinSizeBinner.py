@@ -1,6 +1,10 @@
-from typing import List
+from typing import List, Iterator, Optional, Iterable, Tuple
+
+import numpy as np
 
 from .._Binnable import Binnable
+from .._typing import ItemType
+from ..util import array_chunks
 from ._TwoPassBinner import TwoPassBinner
 
 
@@ -9,27 +13,74 @@ class MinSizeBinner(TwoPassBinner[int, int]):
     Binner which bins items by their size, placing items in
     indexed bins until they exceed a certain minimum total
     size.
+
+    If the total size of the items is known in advance, it can be
+    given so that the items are binned in a single pass.
     """
-    def __init__(self, min_size: int):
+    def __init__(self, min_size: int, *, total_size: Optional[int] = None):
         # Minimum size must be positive
         if min_size < 1:
             raise ValueError(f"Min size of bins must be positive, got {min_size}")
 
         self.min_size: int = min_size
+        self.total_size: Optional[int] = total_size
 
         self._bin_index: int = 0
         self._remaining_size: int = 0
         self._current_size: int = 0
 
-    def _configure(self, items: List[Binnable[int]]):
-        # Calculate the total size of all items
-        self._remaining_size = sum(Binnable.map_bin_keys(items))
+    def _set_total_size(self, total_size: int):
+        """
+        Sets the total size of the items being binned.
+
+        :param total_size:  The sum of the sizes of all items.
+        """
+        self._remaining_size = total_size
 
         # Check there is enough size available
         if self._remaining_size < self.min_size:
             raise ValueError(f"Not enough total size in given items ({self._remaining_size}) "
                              f"to meet minimum size requirement of {self.min_size}")
 
+    def _bin_items(self, items: Iterable[ItemType]) -> Iterator[Tuple[int, ItemType]]:
+        # No need for a configuration pass if the total size is known
+        if self.total_size is None:
+            return super()._bin_items(items)
+
+        self._set_total_size(self.total_size)
+
+        return super(TwoPassBinner, self)._bin_items(items)
+
+    def _configure(self, items: List[Binnable[int]]):
+        # Calculate the total size of all items
+        self._set_total_size(sum(Binnable.map_bin_keys(items)) if self.total_size is None else self.total_size)
+
+    def _configure_array(self, keys: np.ndarray):
+        self._set_total_size(keys.sum().item() if self.total_size is None else self.total_size)
+
+    def _configure_array_chunks(self, keys: np.ndarray, chunk_size: int):
+        # Only need a running total of the sizes
+        self._set_total_size(sum(chunk.sum().item() for chunk in array_chunks(keys, chunk_size))
+                             if self.total_size is None else
+                             self.total_size)
+
+    def _configure_stream(self, keys: Iterator[int]):
+        # Only need a running total of the sizes
+        self._set_total_size(sum(keys) if self.total_size is None else self.total_size)
+
+    @property
+    def _bins_incrementally(self) -> bool:
+        return True
+
+    @property
+    def _bins_array_chunks(self) -> bool:
+        return True
+
+    def _configure_more(self, items: List[Binnable[int]]):
+        # Further items continue filling the last bin until it is full and
+        # they can fill another, so only their total size needs to be available
+        self._remaining_size += sum(Binnable.map_bin_keys(items))
+
     def _reset(self):
         self._bin_index = 0
         self._current_size = 0
@@ -46,3 +97,34 @@ class MinSizeBinner(TwoPassBinner[int, int]):
         self._remaining_size -= key
 
         return self._bin_index
+
+    def _bin_array(self, keys: np.ndarray) -> np.ndarray:
+        if len(keys) == 0:
+            return np.empty(0, dtype=np.int64)
+
+        # Calculate the total size of the items before each item
+        preceding_sizes = np.cumsum(keys) - keys
+
+        # Find the first item of each new bin: the first item after the
+        # previous bin started where that bin is full, if the remaining items
+        # can fill another bin. The current bin (continuing from any previous
+        # chunk) notionally starts before the first item by its current size
+        starts = [0]
+        bin_start_size = -self._current_size
+        while True:
+            start = int(np.searchsorted(preceding_sizes, bin_start_size + self.min_size, side="left"))
+            if start >= len(keys) or self._remaining_size - preceding_sizes[start] < self.min_size:
+                break
+            starts.append(start)
+            bin_start_size = preceding_sizes[start].item()
+
+        # The first run of items continue the current bin
+        labels = np.repeat(np.arange(self._bin_index, self._bin_index + len(starts)), np.diff(starts + [len(keys)]))
+
+        # Continue from the last bin for the next chunk
+        chunk_size = preceding_sizes[-1].item() + keys[-1].item()
+        self._bin_index += len(starts) - 1
+        self._current_size = chunk_size - bin_start_size
+        self._remaining_size -= chunk_size
+
+        return labels
@@ -1,3 +1,5 @@
+import numpy as np
+
 from ._Binner import Binner
 from .._typing import KeyType, LabelType
 
@@ -10,5 +12,19 @@ class NoBinner(Binner[KeyType, LabelType]):
     def __init__(self, label: LabelType):
         self._label: LabelType = label
 
+    @property
+    def _bins_independently(self) -> bool:
+        return True
+
     def _bin(self, key: KeyType) -> LabelType:
         return self._label
+
+    def _bin_array(self, keys: np.ndarray) -> np.ndarray:
+        # Fill an object array element-wise so that non-scalar labels
+        # (e.g. tuples) aren't broadcast across it by NumPy
+        if not np.isscalar(self._label):
+            labels = np.empty(len(keys), dtype=object)
+            labels.fill(self._label)
+            return labels
+
+        return np.full(len(keys), self._label)
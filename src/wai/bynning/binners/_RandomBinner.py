@@ -19,5 +19,9 @@ class RandomBinner(Binner[KeyType, LabelType]):
                                               for index in range(num_bins)}
         self._randrange = rand.randrange if rand is not None else default_randrange
 
+    @property
+    def _bins_incrementally(self) -> bool:
+        return True
+
     def _bin(self, key: KeyType) -> LabelType:
         return self._labels[self._randrange(self._num_bins)]
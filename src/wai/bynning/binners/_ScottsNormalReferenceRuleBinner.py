@@ -1,8 +1,12 @@
+from math import sqrt
 from numbers import Real
 from statistics import stdev
-from typing import List
+from typing import List, Iterator
+
+import numpy as np
 
 from .._Binnable import Binnable
+from ..util import array_chunks
 from ._EqualWidthBinner import EqualWidthBinner
 
 
@@ -17,8 +21,73 @@ class ScottsNormalReferenceRuleBinner(EqualWidthBinner):
         # in _configure
         super().__init__(bin_width=1)
 
+    @staticmethod
+    def _calculate_bin_width(standard_deviation: float, num_items: int) -> Real:
+        """
+        Calculates the bin width to use for the given key statistics.
+
+        :param standard_deviation:  The sample standard deviation of the bin-keys.
+        :param num_items:           The number of items being binned.
+        :return:                    The bin width.
+        """
+        return (3.5 * standard_deviation) / (num_items ** (1/3))
+
     def _configure(self, items: List[Binnable[Real]]):
         standard_deviation: float = stdev(map(float, Binnable.map_bin_keys(items)))
-        self._bin_width = (3.5 * standard_deviation) / (len(items) ** (1/3))
+        self._bin_width = self._calculate_bin_width(standard_deviation, len(items))
 
         super()._configure(items)
+
+    def _configure_array(self, keys: np.ndarray):
+        standard_deviation: float = np.std(keys, dtype=np.float64, ddof=1).item()
+        self._bin_width = self._calculate_bin_width(standard_deviation, len(keys))
+
+        super()._configure_array(keys)
+
+    def _configure_array_chunks(self, keys: np.ndarray, chunk_size: int):
+        # Calculate the count, min/max and variance in a single pass, combining
+        # the statistics of each chunk (as in Chan et al.'s parallel algorithm)
+        num_items, min_key, max_key, mean, sum_of_squares = 0, 0, 0, 0.0, 0.0
+        for chunk in array_chunks(keys, chunk_size):
+            chunk_min, chunk_max = self._find_min_max_array(chunk)
+            min_key = chunk_min if num_items == 0 else min(min_key, chunk_min)
+            max_key = chunk_max if num_items == 0 else max(max_key, chunk_max)
+            chunk_mean = chunk.mean(dtype=np.float64).item()
+            chunk_sum_of_squares = np.square(chunk - chunk_mean, dtype=np.float64).sum().item()
+            delta = chunk_mean - mean
+            combined_num_items = num_items + len(chunk)
+            mean += delta * len(chunk) / combined_num_items
+            sum_of_squares += chunk_sum_of_squares + delta * delta * num_items * len(chunk) / combined_num_items
+            num_items = combined_num_items
+
+        # Same requirement as statistics.stdev
+        if num_items < 2:
+            raise ValueError("Scott's normal reference rule requires at least two items")
+
+        standard_deviation: float = sqrt(sum_of_squares / (num_items - 1))
+        self._bin_width = self._calculate_bin_width(standard_deviation, num_items)
+
+        self._set_range(min_key, max_key)
+
+    def _configure_stream(self, keys: Iterator[Real]):
+        # Calculate the count, min/max and variance (via Welford's
+        # algorithm) in a single pass
+        num_items, min_key, max_key, mean, sum_of_squares = 0, 0, 0, 0.0, 0.0
+        for key in keys:
+            if num_items == 0 or key < min_key:
+                min_key = key
+            if num_items == 0 or key > max_key:
+                max_key = key
+            num_items += 1
+            delta = float(key) - mean
+            mean += delta / num_items
+            sum_of_squares += delta * (float(key) - mean)
+
+        # Same requirement as statistics.stdev
+        if num_items < 2:
+            raise ValueError("Scott's normal reference rule requires at least two items")
+
+        standard_deviation: float = sqrt(sum_of_squares / (num_items - 1))
+        self._bin_width = self._calculate_bin_width(standard_deviation, num_items)
+
+        self._set_range(min_key, max_key)
@@ -1,8 +1,8 @@
-from fractions import Fraction
-from typing import Tuple, List
+from typing import Tuple, List, Iterator, Dict
+
+import numpy as np
 
 from ..extraction import Extractor, IdentityExtractor
-from ..util import integer_dot_product
 from .._typing import KeyType, LabelType
 from ._Binner import Binner
 
@@ -31,6 +31,14 @@ class SplitBinner(Binner[KeyType, LabelType]):
         # The current position in the schedule
         self._schedule_index: int = 0
 
+    @property
+    def _bins_incrementally(self) -> bool:
+        return True
+
+    @property
+    def _bins_array_chunks(self) -> bool:
+        return True
+
     def _reset(self):
         self._schedule_index = 0
 
@@ -43,6 +51,43 @@ class SplitBinner(Binner[KeyType, LabelType]):
 
         return label
 
+    def _bin_array(self, keys: np.ndarray) -> np.ndarray:
+        # Repeat the schedule cyclically, continuing from the current position
+        labels = np.resize(np.roll(np.asarray(self._schedule), -self._schedule_index), len(keys))
+
+        # Move to the position in the schedule for the next chunk
+        self._schedule_index = (self._schedule_index + len(keys)) % len(self._schedule)
+
+        return labels
+
+    def bin_indices(self, num_items: int) -> Dict[LabelType, np.ndarray]:
+        """
+        Calculates the indices of the items that would go into each bin if
+        the given number of items were binned, without binning any items.
+
+        :param num_items:   The number of items.
+        :return:            The item indices for each bin, in ascending order,
+                            with bins ordered as they would be in a binning.
+        """
+        # Group the schedule positions by label
+        positions: Dict[LabelType, List[int]] = {}
+        for position, label in enumerate(self._schedule):
+            positions.setdefault(label, []).append(position)
+
+        # The start index of each repeat of the schedule
+        schedule_length = len(self._schedule)
+        cycle_starts = np.arange(0, num_items, schedule_length)
+
+        # Each label takes its schedule positions in every cycle
+        indices: Dict[LabelType, np.ndarray] = {}
+        for label, label_positions in positions.items():
+            label_indices = (cycle_starts[:, np.newaxis] + np.asarray(label_positions)).reshape(-1)
+            label_indices = label_indices[label_indices < num_items]
+            if len(label_indices) > 0:
+                indices[label] = label_indices
+
+        return indices
+
     @staticmethod
     def _calculate_schedule(ratios: Tuple[int]) -> List[int]:
         """
@@ -51,39 +96,64 @@ class SplitBinner(Binner[KeyType, LabelType]):
 
         :return:    The label schedule.
         """
-        # Initialise an empty schedule
-        schedule: List[int] = []
+        return list(SplitBinner._generate_schedule(ratios))
+
+    @staticmethod
+    def _generate_schedule(ratios: Tuple[int]) -> Iterator[int]:
+        """
+        Generates the schedule of labels to return to best split items into
+        the bins. At each step, an item is added to whichever bin results
+        in bin-sizes with the greatest squared cosine-similarity to the ratios
+        (the first such bin in the case of ties).
+
+        The similarity for adding to bin i is (D + r_i)^2 / (S + 2c_i + 1),
+        where D is the dot-product of the ratios r with the current bin-sizes c,
+        and S is the squared magnitude of c. The ratios' magnitude is common to
+        all candidates so is omitted, and candidates are compared by exact
+        integer cross-multiplication.
+
+        Bins with equal ratios are filled in turn (the similarity only
+        differs between them by their size), so only one candidate per
+        distinct ratio needs comparing, making each step O(U) for U
+        distinct ratios.
+
+        :return:    An iterator over the label schedule.
+        """
+        # Group the bins by ratio, in order of their first bin
+        classes: Dict[int, List[int]] = {}
+        for index, ratio in enumerate(ratios):
+            classes.setdefault(ratio, []).append(index)
+        class_ratios: List[int] = list(classes)
+        class_members: List[List[int]] = list(classes.values())
+
+        # The bin of each class which is next to be filled (the first of its smallest bins)
+        next_members: List[int] = [0] * len(class_ratios)
 
-        # The initial best candidate binning is all bins empty
-        best_candidate: Tuple[int] = tuple(0 for _ in range(len(ratios)))
+        # The current bin sizes, their dot-product with the ratios and their squared magnitude
+        sizes: List[int] = [0] * len(ratios)
+        dot_product: int = 0
+        squared_magnitude: int = 0
 
         # The schedule cycle-length is the sum of ratios
-        for schedule_index in range(sum(ratios)):
-            # Create a candidate ratio for each of the possible binnings
-            # (each being a single item added to one of the bins)
-            candidate_ratios: Tuple[Tuple[int, ...]] = tuple(
-                tuple(ratio + 1 if i == candidate_index else ratio
-                      for i, ratio in enumerate(best_candidate))
-                for candidate_index in range(len(ratios))
-            )
-
-            # Calculate the integer dot-product of each candidate ratio
-            # to determine which is closest to the desired ratio
-            candidate_dps: Tuple[Fraction, ...] = tuple(
-                integer_dot_product(ratios, candidate_ratio)
-                for candidate_ratio in candidate_ratios
-            )
-
-            # Select the candidate with the best (greatest) dot-product
-            best_candidate_index = None
-            best_candidate_dp = None
-            for candidate_index, candidate_dp in enumerate(candidate_dps):
-                if best_candidate_index is None or candidate_dp > best_candidate_dp:
-                    best_candidate = candidate_ratios[candidate_index]
-                    best_candidate_index = candidate_index
-                    best_candidate_dp = candidate_dp
-
-            # Add the selected candidate bin to the schedule
-            schedule.append(best_candidate_index)
-
-        return schedule
+        for _ in range(sum(ratios)):
+            # Select the class whose next bin has the best (greatest) similarity,
+            # or the one with the first such bin in the case of ties
+            best_class: int = -1
+            best_index: int = 0
+            best_numerator: int = 0
+            best_denominator: int = 1
+            for class_index, ratio in enumerate(class_ratios):
+                index = class_members[class_index][next_members[class_index]]
+                numerator = (dot_product + ratio) ** 2
+                denominator = squared_magnitude + 2 * sizes[index] + 1
+                comparison = numerator * best_denominator - best_numerator * denominator
+                if best_class < 0 or comparison > 0 or comparison == 0 and index < best_index:
+                    best_class, best_index, best_numerator, best_denominator = class_index, index, numerator, denominator
+
+            # Add an item to the selected bin
+            dot_product += ratios[best_index]
+            squared_magnitude += 2 * sizes[best_index] + 1
+            sizes[best_index] += 1
+            next_members[best_class] = (next_members[best_class] + 1) % len(class_members[best_class])
+
+            yield best_index
@@ -1,8 +1,5 @@
 from math import ceil, sqrt
-from numbers import Real
-from typing import List
 
-from .._Binnable import Binnable
 from ._EqualWidthBinner import EqualWidthBinner
 
 
@@ -13,10 +10,8 @@ class SquareRootChoiceBinner(EqualWidthBinner):
     """
     def __init__(self):
         # Doesn't matter how many bins we set here as it is overridden
-        # in _configure
+        # in _configure_num_items
         super().__init__(num_bins=1)
 
-    def _configure(self, items: List[Binnable[Real]]):
-        self._num_bins = int(ceil(sqrt(len(items))))
-
-        super()._configure(items)
+    def _configure_num_items(self, num_items: int):
+        self._num_bins = int(ceil(sqrt(num_items)))
@@ -1,5 +1,7 @@
 from typing import Dict
 
+import numpy as np
+
 from ..extraction import Extractor, IdentityExtractor
 from .._typing import KeyType, LabelType
 from ._Binner import Binner
@@ -17,6 +19,14 @@ class StratifyingBinner(Binner[KeyType, LabelType]):
                                               for index in range(self._num_folds)}
         self._next: int = 0
 
+    @property
+    def _bins_incrementally(self) -> bool:
+        return True
+
+    @property
+    def _bins_array_chunks(self) -> bool:
+        return True
+
     def _reset(self):
         self._next = 0
 
@@ -29,3 +39,27 @@ class StratifyingBinner(Binner[KeyType, LabelType]):
         self._next %= self._num_folds
 
         return self._labels[label]
+
+    def _bin_array(self, keys: np.ndarray) -> np.ndarray:
+        # Repeat the labels cyclically, continuing from the next label
+        labels = np.resize(np.roll(np.asarray([self._labels[index] for index in range(self._num_folds)]), -self._next),
+                           len(keys))
+
+        # Move to the next label for the next chunk
+        self._next = (self._next + len(keys)) % self._num_folds
+
+        return labels
+
+    def bin_indices(self, num_items: int) -> Dict[LabelType, range]:
+        """
+        Calculates the indices of the items that would go into each bin if
+        the given number of items were binned, without binning any items.
+
+        :param num_items:   The number of items.
+        :return:            The item indices for each bin, with bins ordered
+                            as they would be in a binning.
+        """
+        return {
+            self._labels[stratum]: range(stratum, num_items, self._num_folds)
+            for stratum in range(min(self._num_folds, num_items))
+        }
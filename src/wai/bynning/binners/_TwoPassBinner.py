@@ -1,8 +1,16 @@
+import warnings
 from abc import ABC, abstractmethod
-from typing import Iterable, Tuple, Iterator, List
+from copy import copy
+from typing import Iterable, Tuple, Iterator, List, Callable, Union, Optional, Dict, Any, Mapping
 
+import numpy as np
+
+from .._Binnable import Binnable
+from .._Binning import Binning
 from .._typing import KeyType, LabelType, ItemType
+from ..instrumentation import timed_phase
 from ._Binner import Binner
+from ._BinnerConfiguration import BinnerConfiguration
 
 
 class TwoPassBinner(Binner[KeyType, LabelType], ABC):
@@ -11,12 +19,17 @@ class TwoPassBinner(Binner[KeyType, LabelType], ABC):
     the set of items being binned to generate state (e.g.
     statistics).
     """
+    # The names of the attributes which hold the state generated by configuration,
+    # for binners which can export their configuration
+    _CONFIGURATION_ATTRIBUTES: Tuple[str, ...] = ()
+
     def _bin_items(self, items: Iterable[ItemType]) -> Iterator[Tuple[LabelType, ItemType]]:
-        # Need to cache the items as we're doing two passes
-        items = list(items)
+        with timed_phase("configure"):
+            # Need to cache the items as we're doing two passes
+            items = list(items)
 
-        # Configure ourselves on the items first
-        self._configure(items)
+            # Configure ourselves on the items first
+            self._configure(items)
 
         return super()._bin_items(items)
 
@@ -29,3 +42,264 @@ class TwoPassBinner(Binner[KeyType, LabelType], ABC):
         :param items:   The items to configure ourselves against.
         """
         pass
+
+    def _configure_more(self, items: List[ItemType]):
+        """
+        Updates the configuration of this binner for further items being
+        binned after a binning (see _bin_more_items). By default, keeps
+        the configuration from the last binning.
+
+        :param items:   The further items.
+        """
+        pass
+
+    def _bin_more_items(self, items: Iterable[ItemType]) -> Iterator[Tuple[LabelType, ItemType]]:
+        # Need to cache the items as we're doing two passes
+        items = list(items)
+
+        # Update our configuration for the further items first
+        self._configure_more(items)
+
+        return super()._bin_more_items(items)
+
+    def _configure_array(self, keys: np.ndarray):
+        """
+        Configures this binner on the given array of bin-keys. Binners
+        which support array binning should override this method.
+
+        :param keys:    The bin-keys to configure ourselves against.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support array binning")
+
+    def bin_array(self, keys: np.ndarray) -> np.ndarray:
+        keys = np.asarray(keys)
+
+        # Configure ourselves on the keys first
+        with timed_phase("configure"):
+            self._configure_array(keys)
+
+        return super().bin_array(keys)
+
+    def _configure_array_chunks(self, keys: np.ndarray, chunk_size: int):
+        """
+        Configures this binner on an array of bin-keys (e.g. a memory-mapped
+        file), reading only a chunk of keys into memory at a time (see
+        util.array_chunks). By default, configures against the whole array
+        via _configure_array, so binners whose array configuration reads all
+        keys into memory should override this method.
+
+        :param keys:        The bin-keys to configure ourselves against.
+        :param chunk_size:  The number of keys to read at a time.
+        """
+        self._configure_array(keys)
+
+    def bin_array_chunks(self, keys: np.ndarray, chunk_size: int) -> Iterator[np.ndarray]:
+        self._check_bins_array_chunks()
+
+        # Configure ourselves on all keys first, a chunk at a time
+        self._configure_array_chunks(keys, chunk_size)
+
+        return super().bin_array_chunks(keys, chunk_size)
+
+    def _configure_stream(self, keys: Iterator[KeyType]):
+        """
+        Configures this binner on a single pass over the bin-keys of
+        the items being binned. By default, retains the keys (but not
+        the items) and configures against them as an array. Binners
+        which can configure themselves with bounded memory should
+        override this method.
+
+        :param keys:    An iterator over the bin-keys to configure ourselves against.
+        """
+        self._configure_array(np.asarray(list(keys)))
+
+    def bin_stream(self, source: Union[Callable[[], Iterable[ItemType]], Iterable[ItemType]]) \
+            -> Binning[ItemType, LabelType]:
+        """
+        Creates a binning of the items from a re-iterable source, without
+        holding all items in memory during configuration. The source is
+        iterated once to configure the binner, and again to bin the items.
+
+        :param source:  Either a callable which returns a new iterable of the
+                        items each time it is called, or a re-iterable
+                        collection (not a single-use iterator) of the items.
+        :return:        The binning.
+        """
+        # Get a means of iterating over the items twice
+        if callable(source):
+            iterate = source
+        elif iter(source) is source:
+            raise ValueError("Can't stream from a single-use iterator, provide a "
+                             "factory callable or a re-iterable collection instead")
+        else:
+            def iterate() -> Iterable[ItemType]:
+                return source
+
+        # Configure ourselves on the keys of the first pass
+        self._configure_stream(Binnable.map_bin_keys(iterate()))
+
+        return self._create_binning(super()._bin_items(iterate()))
+
+    def bin_parallel(self,
+                     items: Iterable[ItemType],
+                     workers: Optional[int] = None,
+                     chunk_size: int = 10000) -> Binning[ItemType, LabelType]:
+        self._check_bins_independently()
+
+        # Configure ourselves on the items first, so the configured state
+        # is what is sent to the workers
+        items = list(items)
+        self._configure(items)
+
+        return super().bin_parallel(items, workers, chunk_size)
+
+    def _get_configuration_values(self) -> Dict[str, Any]:
+        """
+        Gets the state generated by the last configuration of this binner,
+        by name. Binners which can't export their configuration in their
+        current state should override this to raise NotImplementedError.
+
+        :return:    The configuration values.
+        """
+        if len(self._CONFIGURATION_ATTRIBUTES) == 0:
+            raise NotImplementedError(f"{type(self).__name__} can't export its configuration")
+
+        return {name.lstrip("_"): getattr(self, name) for name in self._CONFIGURATION_ATTRIBUTES}
+
+    def get_configuration(self) -> Dict[str, Any]:
+        """
+        Gets the state generated by the last configuration of this binner,
+        so that other binners can bin consistently with it via bin_configured.
+
+        Deprecated: use fit and transform, which share the configuration as
+        a BinnerConfiguration.
+
+        :return:    The configuration.
+        """
+        warnings.warn("get_configuration is deprecated, use fit/transform instead", DeprecationWarning, stacklevel=2)
+
+        return dict(self._current_configuration().values)
+
+    def bin_configured(self,
+                       items: Iterable[ItemType],
+                       configuration: Mapping[str, Any]) -> Binning[ItemType, LabelType]:
+        """
+        Creates a binning of the given items using a configuration from
+        get_configuration, instead of configuring on the items. Doesn't
+        modify this binner.
+
+        Deprecated: use fit and transform, which share the configuration as
+        a BinnerConfiguration.
+
+        :param items:           The items.
+        :param configuration:   The configuration to bin with.
+        :return:                The binning.
+        """
+        warnings.warn("bin_configured is deprecated, use fit/transform instead", DeprecationWarning, stacklevel=2)
+
+        return self.transform(items, BinnerConfiguration(type(self).__name__, configuration))
+
+    def _current_configuration(self) -> BinnerConfiguration:
+        """
+        Records the state generated by the last configuration of this binner.
+
+        :return:    The configuration.
+        """
+        return BinnerConfiguration(type(self).__name__, self._get_configuration_values())
+
+    def _configured_copy(self, configuration: BinnerConfiguration) -> 'TwoPassBinner[KeyType, LabelType]':
+        """
+        Creates a copy of this binner with the given configuration applied.
+
+        :param configuration:   The configuration, as from one of the fit methods.
+        :return:                The configured copy.
+        """
+        # Make sure the configuration is for this type of binner
+        if configuration.binner_type != type(self).__name__:
+            raise ValueError(f"Configuration is for {configuration.binner_type}, not {type(self).__name__}")
+        expected = self._get_configuration_values().keys()
+        if configuration.values.keys() != expected:
+            raise ValueError(f"Expected configuration with {sorted(expected)}, "
+                             f"got {sorted(configuration.values.keys())}")
+
+        # Apply the configuration to a copy of ourselves
+        configured = copy(self)
+        for name, value in configuration.values.items():
+            setattr(configured, f"_{name}", value)
+
+        return configured
+
+    def _fit_copy(self, configure: Callable[['TwoPassBinner[KeyType, LabelType]'], None]) -> BinnerConfiguration:
+        """
+        Configures a copy of this binner and records the resulting configuration.
+
+        :param configure:   Function which configures the copy.
+        :return:            The configuration.
+        """
+        # Fail before configuring if we can't export the configuration
+        self._get_configuration_values()
+
+        fitted = copy(self)
+        configure(fitted)
+
+        return fitted._current_configuration()
+
+    def fit(self, items: Iterable[ItemType]) -> BinnerConfiguration:
+        """
+        Configures on the given items without modifying this binner, for
+        later binning of other items via transform.
+
+        :param items:   The items to configure on.
+        :return:        The immutable configuration.
+        """
+        return self._fit_copy(lambda fitted: fitted._configure(list(items)))
+
+    def fit_array(self, keys: np.ndarray) -> BinnerConfiguration:
+        """
+        Configures on the given array of bin-keys without modifying this
+        binner, for later binning via transform/transform_array.
+
+        :param keys:    The bin-keys to configure on.
+        :return:        The immutable configuration.
+        """
+        return self._fit_copy(lambda fitted: fitted._configure_array(np.asarray(keys)))
+
+    def fit_stream(self, items: Iterable[ItemType]) -> BinnerConfiguration:
+        """
+        Configures on a single pass over the given items without modifying
+        this binner, for later binning via transform/transform_array.
+
+        :param items:   The items to configure on. Can be a single-use iterator.
+        :return:        The immutable configuration.
+        """
+        return self._fit_copy(lambda fitted: fitted._configure_stream(Binnable.map_bin_keys(items)))
+
+    def transform(self,
+                  items: Iterable[ItemType],
+                  configuration: BinnerConfiguration) -> Binning[ItemType, LabelType]:
+        """
+        Creates a binning of the given items in a single pass, using a
+        configuration from one of the fit methods. Doesn't modify this binner.
+
+        :param items:           The items.
+        :param configuration:   The configuration to bin with.
+        :return:                The binning.
+        """
+        # Bin the items in a single pass with a configured copy of ourselves
+        configured = self._configured_copy(configuration)
+
+        return self._create_binning(super(TwoPassBinner, configured)._bin_items(items))
+
+    def transform_array(self, keys: np.ndarray, configuration: BinnerConfiguration) -> np.ndarray:
+        """
+        Calculates the bin label of each of the given bin-keys, using a
+        configuration from one of the fit methods. Doesn't modify this binner.
+
+        :param keys:            The bin-keys.
+        :param configuration:   The configuration to bin with.
+        :return:                The array of bin labels.
+        """
+        # Bin the keys without configuring on them
+        configured = self._configured_copy(configuration)
+
+        return super(TwoPassBinner, configured).bin_array(keys)
@@ -1,10 +1,13 @@
 from ._ArbitraryBinner import ArbitraryBinner
 from ._Binner import Binner
+from ._BinnerConfiguration import BinnerConfiguration
 from ._TwoPassBinner import TwoPassBinner
 from ._CrossValidationFoldBinner import CrossValidationFoldBinner
+from ._EdgesBinner import EdgesBinner
 from ._EqualWidthBinner import EqualWidthBinner
 from ._FreedmanDiaconisChoiceBinning import FreedmanDiaconisChoiceBinning
 from ._FrequencyBinner import FrequencyBinner
+from ._GridBinner import GridBinner
 from ._KeyBinner import KeyBinner
 from ._ManualBinner import ManualBinner
 from ._MinSizeBinner import MinSizeBinner
@@ -1,3 +1,8 @@
+from typing import Sequence
+
+import numpy as np
+
+from ..util import faithful_array
 from ._Extractor import Extractor, InputType, OutputType
 
 
@@ -10,3 +15,6 @@ class ConstantExtractor(Extractor[InputType, OutputType]):
 
     def extract(self, item: InputType) -> OutputType:
         return self._constant
+
+    def extract_batch(self, items: Sequence[InputType]) -> np.ndarray:
+        return np.repeat(faithful_array([self._constant]), len(items))
@@ -1,5 +1,9 @@
 from abc import abstractmethod
-from typing import Generic, Iterator, Iterable, TypeVar
+from typing import Generic, Iterator, Iterable, TypeVar, Sequence
+
+import numpy as np
+
+from ..util import faithful_array
 
 InputType = TypeVar("InputType")
 OutputType = TypeVar("OutputType")
@@ -27,3 +31,14 @@ class Extractor(Generic[InputType, OutputType]):
         :return:        An iterator of extracted data.
         """
         return map(self.extract, items)
+
+    def extract_batch(self, items: Sequence[InputType]) -> np.ndarray:
+        """
+        Extracts data from all the given items into an array in a single
+        call. Extractors which can vectorise extraction should override
+        this method, returning the same values as extract_all.
+
+        :param items:   The items to extract from.
+        :return:        An array of the extracted data.
+        """
+        return faithful_array(list(self.extract_all(items)))
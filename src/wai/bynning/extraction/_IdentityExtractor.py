@@ -1,3 +1,8 @@
+from typing import Sequence
+
+import numpy as np
+
+from ..util import faithful_array
 from ._Extractor import Extractor, InputType
 
 
@@ -7,3 +12,6 @@ class IdentityExtractor(Extractor[InputType, InputType]):
     """
     def extract(self, item: InputType) -> InputType:
         return item
+
+    def extract_batch(self, items: Sequence[InputType]) -> np.ndarray:
+        return faithful_array(items)
@@ -1,3 +1,7 @@
+from typing import Sequence
+
+import numpy as np
+
 from ._Extractor import Extractor, InputType
 
 
@@ -17,3 +21,12 @@ class IndexExtractor(Extractor[InputType, int]):
         self._index += 1
 
         return index
+
+    def extract_batch(self, items: Sequence[InputType]) -> np.ndarray:
+        # Continue on from the current index
+        indices = np.arange(self._index, self._index + len(items))
+
+        # Update the index for the next batch
+        self._index += len(items)
+
+        return indices
@@ -1,6 +1,9 @@
-from typing import Tuple
+from typing import Tuple, Sequence
+
+import numpy as np
 
 from .._typing import LabelType
+from ..util import faithful_array
 from ._Extractor import Extractor
 
 
@@ -15,3 +18,6 @@ class LabelExtractor(Extractor[int, LabelType]):
 
     def extract(self, item: int) -> LabelType:
         return self._labels[item]
+
+    def extract_batch(self, items: Sequence[int]) -> np.ndarray:
+        return faithful_array(self._labels)[np.asarray(items, dtype=np.intp)]
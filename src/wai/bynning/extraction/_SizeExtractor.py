@@ -1,4 +1,6 @@
-from typing import Sized
+from typing import Sized, Sequence
+
+import numpy as np
 
 from ._Extractor import Extractor
 
@@ -9,3 +11,6 @@ class SizeExtractor(Extractor[Sized, int]):
     """
     def extract(self, item: Sized) -> int:
         return len(item)
+
+    def extract_batch(self, items: Sequence[Sized]) -> np.ndarray:
+        return np.fromiter(map(len, items), dtype=np.intp, count=len(items))
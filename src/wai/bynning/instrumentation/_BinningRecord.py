@@ -0,0 +1,66 @@
+from typing import Dict, Any
+
+
+class BinningRecord:
+    """
+    Record of the work done by a single call to Binner.bin, made while
+    instrumentation is enabled (see instrument). Phases are:
+
+    - configure:    Any configuration pass over the items (or the key
+                    array of a batch).
+    - bin:          Extracting the bin-key of each item and calculating
+                    its bin label (or binning the key array of a batch).
+                    Items binned one at a time are collected into bins as
+                    they are labelled, so this includes collecting them.
+    - collect:      Collecting the items of a batch into bins by their
+                    array of labels.
+
+    Phases which weren't entered have no timing.
+    """
+    __slots__ = ("binner_type", "phase_seconds", "num_items", "num_bins", "peak_bin_size")
+
+    def __init__(self,
+                 binner_type: str,
+                 phase_seconds: Dict[str, float],
+                 num_items: int,
+                 num_bins: int,
+                 peak_bin_size: int):
+        """
+        :param binner_type:     The name of the type of binner.
+        :param phase_seconds:   The wall time spent in each phase, by phase name.
+        :param num_items:       The number of items binned.
+        :param num_bins:        The number of bins created.
+        :param peak_bin_size:   The number of items in the largest bin.
+        """
+        self.binner_type: str = binner_type
+        self.phase_seconds: Dict[str, float] = phase_seconds
+        self.num_items: int = num_items
+        self.num_bins: int = num_bins
+        self.peak_bin_size: int = peak_bin_size
+
+    @property
+    def total_seconds(self) -> float:
+        """
+        Gets the total wall time spent across all phases.
+        """
+        return sum(self.phase_seconds.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Converts this record to a dictionary.
+
+        :return:    The dictionary.
+        """
+        return {
+            "binner_type": self.binner_type,
+            "phase_seconds": dict(self.phase_seconds),
+            "total_seconds": self.total_seconds,
+            "num_items": self.num_items,
+            "num_bins": self.num_bins,
+            "peak_bin_size": self.peak_bin_size
+        }
+
+    def __str__(self) -> str:
+        phases = ", ".join(f"{phase}={seconds:.6f}s" for phase, seconds in self.phase_seconds.items())
+        return (f"{self.binner_type}.bin: {self.num_items} items into {self.num_bins} bins "
+                f"(peak bin size {self.peak_bin_size}) in {self.total_seconds:.6f}s ({phases})")
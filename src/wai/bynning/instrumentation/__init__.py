@@ -0,0 +1,6 @@
+"""
+Package for opt-in instrumentation of binning.
+"""
+from ._BinningRecord import BinningRecord
+from ._instrument import instrument, get_recorder
+from ._phases import record_phases, timed_phase
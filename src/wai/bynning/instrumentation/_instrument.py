@@ -0,0 +1,63 @@
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Optional, Iterator, List
+
+from ._BinningRecord import BinningRecord
+
+# The function which receives records of binnings, if instrumentation is enabled
+_recorder: ContextVar[Optional[Callable[[BinningRecord], None]]] = ContextVar("recorder", default=None)
+
+
+def get_recorder() -> Optional[Callable[[BinningRecord], None]]:
+    """
+    Gets the function which receives records of binnings in the current
+    context, if instrumentation is enabled.
+
+    :return:    The recorder, or None if instrumentation is disabled.
+    """
+    return _recorder.get()
+
+
+@contextmanager
+def instrument(callback: Optional[Callable[[BinningRecord], None]] = None,
+               logger: Optional[logging.Logger] = None,
+               level: int = logging.INFO) -> Iterator[List[BinningRecord]]:
+    """
+    Context manager which enables instrumentation of Binner.bin within its
+    context, recording the per-phase wall time, number of items, number of
+    bins and peak bin size of each call. When not enabled, bin only checks
+    whether instrumentation is enabled once per call. Contexts can be nested,
+    in which case outer contexts also receive the records of inner ones.
+
+    Only calls to bin are recorded. The other ways of binning (e.g.
+    bin_array, bin_array_chunks, bin_stream, bin_parallel, count/count_array,
+    TwoPassBinner.transform/transform_array and IncrementalBinning) don't
+    produce records.
+
+    :param callback:    Optional function to call with each record.
+    :param logger:      Optional logger to log each record to.
+    :param level:       The level to log records at.
+    :return:            A list which receives the records as they are made.
+    """
+    records: List[BinningRecord] = []
+    outer = _recorder.get()
+
+    def record(binning_record: BinningRecord):
+        records.append(binning_record)
+
+        if callback is not None:
+            callback(binning_record)
+
+        if logger is not None:
+            logger.log(level, "%s", binning_record)
+
+        # Pass the record on to any enclosing context
+        if outer is not None:
+            outer(binning_record)
+
+    token = _recorder.set(record)
+    try:
+        yield records
+    finally:
+        _recorder.reset(token)
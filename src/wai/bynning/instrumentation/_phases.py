@@ -0,0 +1,87 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Dict, Iterator, List, Optional
+
+
+class _PhaseTimer:
+    """
+    Accumulates the wall time spent in each phase of a binning. Phases can
+    be nested, in which case time is only counted against the innermost one.
+    """
+    def __init__(self, phase: str):
+        """
+        :param phase:   The phase to count any time outside other phases against.
+        """
+        self.phase_seconds: Dict[str, float] = {}
+        self._phases: List[str] = [phase]
+        self._start: float = perf_counter()
+
+    def _lap(self):
+        """
+        Counts the time since the last lap against the current phase.
+        """
+        now = perf_counter()
+        phase = self._phases[-1]
+        self.phase_seconds[phase] = self.phase_seconds.get(phase, 0.0) + now - self._start
+        self._start = now
+
+    def enter(self, phase: str):
+        """
+        Starts counting time against a (nested) phase.
+
+        :param phase:   The phase.
+        """
+        self._lap()
+        self._phases.append(phase)
+
+    def exit(self):
+        """
+        Stops counting time against the current phase, resuming the phase it was nested in.
+        """
+        self._lap()
+        self._phases.pop()
+
+
+# The timer of the binning being instrumented in the current context, if any
+_timer: ContextVar[Optional[_PhaseTimer]] = ContextVar("timer", default=None)
+
+
+@contextmanager
+def record_phases(phase: str) -> Iterator[Dict[str, float]]:
+    """
+    Context manager which records the wall time spent in each phase (see
+    timed_phase) within its context.
+
+    :param phase:   The phase to count any time outside other phases against.
+    :return:        The wall time spent in each phase, by phase name,
+                    complete once the context exits.
+    """
+    timer = _PhaseTimer(phase)
+    token = _timer.set(timer)
+    try:
+        yield timer.phase_seconds
+    finally:
+        _timer.reset(token)
+        timer.exit()
+
+
+@contextmanager
+def timed_phase(phase: str) -> Iterator[None]:
+    """
+    Context manager which counts the wall time spent within its context
+    against the given phase, if phases are being recorded (see record_phases).
+    Otherwise does nothing, so binners can mark their phases at little cost.
+
+    :param phase:   The phase.
+    """
+    timer = _timer.get()
+    if timer is None:
+        yield
+        return
+
+    timer.enter(phase)
+    try:
+        yield
+    finally:
+        timer.exit()
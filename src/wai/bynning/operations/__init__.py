@@ -1,7 +1,12 @@
 """
 Package of standard operations performed using binning components.
 """
+from ._bin_key_column import bin_key_column
 from ._group import group
+from ._group_indices import group_indices
+from ._randomised_stratified_cross_validation_fold_indices import randomised_stratified_cross_validation_fold_indices
 from ._randomised_stratified_cross_validation_folds import randomised_stratified_cross_validation_folds
 from ._split import split
+from ._split_indices import split_indices
 from ._stratify import stratify
+from ._stratify_indices import stratify_indices
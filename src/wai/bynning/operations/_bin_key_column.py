@@ -0,0 +1,106 @@
+import json
+import os
+from typing import Dict, List, Union
+
+import numpy as np
+
+from ..binners import Binner
+from .._typing import LabelType
+
+# The names of the files written to the output directory
+CODES_FILENAME = "codes.npy"
+INDICES_FILENAME = "indices.npy"
+OFFSETS_FILENAME = "offsets.npy"
+LABELS_FILENAME = "labels.json"
+
+
+def bin_key_column(binner: Binner[int, LabelType],
+                   keys: np.ndarray,
+                   output_directory: Union[str, os.PathLike],
+                   chunk_size: int = 1_000_000) -> Dict[LabelType, np.ndarray]:
+    """
+    Bins a (typically memory-mapped, see util.load_key_column) column of
+    bin-keys a chunk at a time, writing the results to memory-mapped files
+    in the output directory:
+
+    - codes.npy:    The integer code of the bin of each key.
+    - labels.json:  The label of the bin for each code, in order of first
+                    appearance.
+    - indices.npy:  The indices of the keys in each bin, concatenated in
+                    code order (keys retain their order within each bin).
+    - offsets.npy:  The start of each bin's indices in indices.npy, plus a
+                    final entry for the total number of keys.
+
+    Binners which need all keys at once (e.g. exact frequency binning, see
+    Binner.bin_array_chunks) can't be used, as they would have to read the
+    whole column into memory.
+
+    :param binner:              The binner to bin the keys with.
+    :param keys:                The array of bin-keys.
+    :param output_directory:    The directory to write the output files to.
+    :param chunk_size:          The number of keys to process at a time.
+    :return:                    A dictionary from bin label to the
+                                memory-mapped indices of the keys in that bin.
+    """
+    os.makedirs(output_directory, exist_ok=True)
+
+    # First pass: bin the keys, assigning codes to labels as they are encountered
+    codes = np.lib.format.open_memmap(os.path.join(output_directory, CODES_FILENAME),
+                                      mode="w+", dtype=np.int32, shape=(len(keys),))
+    label_codes: Dict[LabelType, int] = {}
+    counts = np.zeros(0, dtype=np.int64)
+    start = 0
+    for labels in binner.bin_array_chunks(keys, chunk_size):
+        # Find the distinct labels in the chunk, in order of first appearance
+        unique_labels, first_indices, inverse = np.unique(labels, return_index=True, return_inverse=True)
+        order = np.argsort(first_indices, kind="stable")
+        unique_labels = unique_labels.tolist()
+        for index in order.tolist():
+            label_codes.setdefault(unique_labels[index], len(label_codes))
+
+        # Translate the labels to codes
+        lookup = np.asarray([label_codes[label] for label in unique_labels], dtype=np.int32)
+        chunk_codes = lookup[inverse.reshape(-1)]
+        codes[start:start + len(chunk_codes)] = chunk_codes
+        start += len(chunk_codes)
+
+        # Keep a running count of the size of each bin
+        chunk_counts = np.bincount(chunk_codes, minlength=len(label_codes))
+        counts = np.concatenate((counts, np.zeros(len(chunk_counts) - len(counts), dtype=np.int64)))
+        counts += chunk_counts
+
+    codes.flush()
+
+    # Save the bin labels in code order
+    labels: List[LabelType] = list(label_codes)
+    with open(os.path.join(output_directory, LABELS_FILENAME), "w") as file:
+        json.dump(labels, file)
+
+    # Save the offsets of each bin into the concatenated indices
+    offsets = np.lib.format.open_memmap(os.path.join(output_directory, OFFSETS_FILENAME),
+                                        mode="w+", dtype=np.int64, shape=(len(labels) + 1,))
+    offsets[0] = 0
+    np.cumsum(counts, out=offsets[1:])
+    offsets.flush()
+
+    # Second pass: scatter the index of each key to the next free slot in its bin
+    indices = np.lib.format.open_memmap(os.path.join(output_directory, INDICES_FILENAME),
+                                        mode="w+", dtype=np.int64, shape=(len(keys),))
+    next_free = np.array(offsets[:-1])
+    for start in range(0, len(codes), chunk_size):
+        chunk_codes = np.asarray(codes[start:start + chunk_size])
+
+        # Group the chunk by code, keeping the keys in order within each group
+        order = np.argsort(chunk_codes, kind="stable")
+        sorted_codes = chunk_codes[order]
+        rank = np.arange(len(sorted_codes)) - np.searchsorted(sorted_codes, sorted_codes, side="left")
+
+        indices[next_free[sorted_codes] + rank] = order + start
+        next_free += np.bincount(chunk_codes, minlength=len(labels))
+
+    indices.flush()
+
+    return {
+        label: indices[offsets[code]:offsets[code + 1]]
+        for code, label in enumerate(labels)
+    }
@@ -1,9 +1,7 @@
 from typing import TypeVar, Iterator, Iterable
 
-from .._BinItem import BinItem
-from .._Binning import Binning
-from ..binners import MinSizeBinner
-from ..extraction import ConstantExtractor
+from ..util import conservatively_cache, take
+from ._group_indices import group_indices
 
 T = TypeVar("T")
 
@@ -16,12 +14,11 @@ def group(size: int, items: Iterable[T]) -> Iterator[Iterator[T]]:
     :param items:   The items to group.
     :return:        An iterator over the group iterators.
     """
-    # Wrap the items in bin-items all with size 1
-    bin_items: Iterator[BinItem[int, T]] = \
-        BinItem[int, T].extract_from(ConstantExtractor[T, int](1), items)
+    # Make sure we can index into the items
+    items = conservatively_cache(items, indexable=True)
 
-    # Perform min-size binning
-    binning: Binning[BinItem[int, T], int] = MinSizeBinner(size).bin(bin_items)
+    # Find the group boundaries up-front, so that invalid sizes raise immediately
+    offsets = group_indices(size, len(items))
 
-    # Return the iterator over the original items in their new order
-    return (BinItem.unwrapping_iterator(bin) for bin in binning)
+    # Return the iterator over the original items in their groups
+    return (take(items, range(start, end)) for start, end in zip(offsets[:-1].tolist(), offsets[1:].tolist()))
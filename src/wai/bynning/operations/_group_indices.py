@@ -0,0 +1,29 @@
+import numpy as np
+
+
+def group_indices(size: int, num_items: int) -> np.ndarray:
+    """
+    Groups a number of items into groups of at least a certain size.
+    Index-based version of group. As the groups are contiguous runs of
+    items, they are given by the offsets of their boundaries, rather than
+    by an array of indices per group.
+
+    :param size:        The minimum size for each group.
+    :param num_items:   The number of items to group.
+    :return:            The array of group offsets, where group i contains the
+                        items with indices in [offsets[i], offsets[i + 1]).
+    """
+    # Minimum size must be positive
+    if size < 1:
+        raise ValueError(f"Min size of bins must be positive, got {size}")
+
+    # Check there are enough items
+    if num_items < size:
+        raise ValueError(f"Not enough total size in given items ({num_items}) "
+                         f"to meet minimum size requirement of {size}")
+
+    # As with MinSizeBinner on unit-size items, each group has exactly 'size'
+    # items, apart from the last, which also takes any remaining items
+    num_groups = num_items // size
+
+    return np.append(np.arange(num_groups, dtype=np.intp) * size, num_items)
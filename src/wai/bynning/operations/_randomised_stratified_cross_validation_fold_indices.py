@@ -0,0 +1,61 @@
+from random import Random, shuffle
+from typing import Optional, Tuple, Iterator
+
+import numpy as np
+
+from ..util import frequency_divide
+from ._stratify_indices import stratify_indices
+
+
+def randomised_stratified_cross_validation_fold_indices(num_items: int,
+                                                        num_folds: int,
+                                                        rand: Optional[Random] = None) \
+        -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Creates randomised stratified cross-validation folds for a number of items.
+    Index-based version of randomised_stratified_cross_validation_folds. Folds
+    are generated lazily, so only the shuffled item indices and the current
+    fold are held in memory.
+
+    :param num_items:   The number of items to create train/test folds for.
+    :param num_folds:   The number of folds to create.
+    :param rand:        An optional source of randomness.
+    :return:            An iterator over the folds, each containing a train/test
+                        pair of arrays of item indices.
+    """
+    # Must have at least 2 folds
+    if num_folds < 2:
+        raise ValueError(f"Must specify at least 2 folds, got {num_folds}")
+
+    # Must be more items than there are folds
+    if num_folds > num_items:
+        raise ValueError(f"{num_folds} requested but only {num_items} provided")
+
+    # Randomise the item order
+    order = list(range(num_items))
+    if rand is not None:
+        rand.shuffle(order)
+    else:
+        shuffle(order)
+
+    # Stratify
+    stratified = np.asarray(order, dtype=np.intp)[stratify_indices(num_folds, num_items)]
+    del order
+
+    return _generate_folds(stratified, num_folds)
+
+
+def _generate_folds(stratified: np.ndarray, num_folds: int) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Generates the train/test indices of each fold over the stratified indices.
+
+    :param stratified:  The stratified item indices.
+    :param num_folds:   The number of folds.
+    :return:            An iterator over the train/test index arrays of each fold.
+    """
+    for fold in range(num_folds):
+        test_range = frequency_divide(len(stratified), num_folds, fold)
+        yield (
+            np.concatenate((stratified[:test_range.start], stratified[test_range.stop:])),
+            stratified[test_range.start:test_range.stop]
+        )
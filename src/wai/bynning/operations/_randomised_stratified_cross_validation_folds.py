@@ -1,12 +1,8 @@
 from random import Random
-from typing import TypeVar, Iterable, Optional, List, Tuple, Iterator
+from typing import TypeVar, Iterable, Optional, Tuple, Iterator
 
-from wai.common.iterate import random
-
-from .._BinItem import BinItem
-from .._Binning import Binning
-from ..binners import StratifyingBinner, CrossValidationFoldBinner
-from ..extraction import IndexExtractor
+from ..util import conservatively_cache, take
+from ._randomised_stratified_cross_validation_fold_indices import randomised_stratified_cross_validation_fold_indices
 
 T = TypeVar("T")
 
@@ -17,6 +13,8 @@ def randomised_stratified_cross_validation_folds(items: Iterable[T],
         -> Iterator[Tuple[Iterator[T], Iterator[T]]]:
     """
     Creates randomised stratified cross-validation folds from a set of data.
+    Folds are generated lazily, so only the current fold is held in memory
+    (as indices into the items).
 
     :param items:       The items to create train/test folds for.
     :param num_folds:   The number of folds to create.
@@ -24,25 +22,13 @@ def randomised_stratified_cross_validation_folds(items: Iterable[T],
     :return:            A list of folds, each containing a train/test pair
                         of lists of items in the folds.
     """
-    # Wrap the items into bin-items
-    bin_items: Iterator[BinItem[int, T]] = BinItem.extract_from(IndexExtractor[T](), items)
-
-    # Randomise the bin items
-    random_bin_items: Iterator[BinItem[int, T]] = random(bin_items, rand)
-
-    # Stratify
-    stratified: Binning[BinItem[int, T], int] = StratifyingBinner[T, int](num_folds).bin(random_bin_items)
+    # Make sure we can index into the items
+    items = conservatively_cache(items, indexable=True)
 
-    # Create the cross-validation folds
-    fold_binnings: List[Binning[BinItem[int, T], str]] = \
-        CrossValidationFoldBinner[int](num_folds).bin_all_folds(stratified.item_iterator())
+    # Calculate the fold indices up-front so any errors are raised immediately
+    fold_indices = randomised_stratified_cross_validation_fold_indices(len(items), num_folds, rand)
 
-    # Return the folds
     return (
-        tuple(
-            BinItem[int, T].unwrapping_iterator(fold_binning[bin_label])
-            for bin_label in [CrossValidationFoldBinner[int].TRAIN_BIN_LABEL,
-                              CrossValidationFoldBinner[int].TEST_BIN_LABEL]
-        )
-        for fold_binning in fold_binnings
+        (take(items, train_indices), take(items, test_indices))
+        for train_indices, test_indices in fold_indices
     )
@@ -1,11 +1,8 @@
 from random import Random
 from typing import Iterable, TypeVar, Dict, Iterator, Optional
 
-from wai.common.iterate import random
-
-from ..binners import SplitBinner
-from ..extraction import LabelExtractor, IndexExtractor
-from .._BinItem import BinItem
+from ..util import conservatively_cache, take
+from ._split_indices import split_indices
 
 T = TypeVar("T")
 
@@ -21,23 +18,8 @@ def split(items: Iterable[T], rand: Optional[Random] = None, **ratios: int) -> D
     :return:            A dictionary of category name to an iterator of the
                         items in that category.
     """
-    # Extract the proportions and categories into separate lists,
-    # ensuring the paired ordering is preserved
-    ratio_list = []
-    label_list = []
-    for label, ratio in ratios.items():
-        label_list.append(label)
-        ratio_list.append(ratio)
-
-    # Wrap the items in a bin-item
-    bin_items: Iterator[BinItem[int, T]] = BinItem[int, T].extract_from(IndexExtractor[T](), items)
-
-    # Optionally randomise the item order
-    if rand is not None:
-        bin_items = random(bin_items, rand)
-
-    # Use the split-binner to perform the split, with a labeller
-    binning = SplitBinner[int, str](*ratio_list, label_extractor=LabelExtractor[str](*label_list)).bin(bin_items)
+    # Make sure we can index into the items
+    items = conservatively_cache(items, indexable=True)
 
     # Return the iterators over the original items in their split categories
-    return {bin.label: BinItem.unwrapping_iterator(bin) for bin in binning}
+    return {label: take(items, indices) for label, indices in split_indices(len(items), rand, **ratios).items()}
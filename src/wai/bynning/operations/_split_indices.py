@@ -0,0 +1,40 @@
+from random import Random
+from typing import Dict, Optional
+
+import numpy as np
+
+from ..binners import SplitBinner
+from ..extraction import LabelExtractor
+
+
+def split_indices(num_items: int, rand: Optional[Random] = None, **ratios: int) -> Dict[str, np.ndarray]:
+    """
+    Splits a number of items into categories, with a certain proportion of
+    the items going into each category. Index-based version of split.
+
+    :param num_items:   The number of items to split.
+    :param rand:        Optional RNG to randomise the split.
+    :param ratios:      The category proportions, keyed by category name.
+    :return:            A dictionary of category name to an array of the
+                        indices of the items in that category.
+    """
+    # Extract the proportions and categories into separate lists,
+    # ensuring the paired ordering is preserved
+    ratio_list = []
+    label_list = []
+    for label, ratio in ratios.items():
+        label_list.append(label)
+        ratio_list.append(ratio)
+
+    # Use the split-binner to calculate the item indices for each category
+    binner = SplitBinner[int, str](*ratio_list, label_extractor=LabelExtractor[str](*label_list))
+    indices: Dict[str, np.ndarray] = binner.bin_indices(num_items)
+
+    # Optionally randomise the item order
+    if rand is not None:
+        order = list(range(num_items))
+        rand.shuffle(order)
+        order = np.asarray(order, dtype=np.intp)
+        indices = {label: order[category_indices] for label, category_indices in indices.items()}
+
+    return indices
@@ -1,9 +1,8 @@
+from itertools import chain
 from typing import Iterable, TypeVar, Iterator
 
-from .._Binning import Binning
-from .._BinItem import BinItem
 from ..binners import StratifyingBinner
-from ..extraction import IndexExtractor
+from ..util import conservatively_cache
 
 T = TypeVar("T")
 
@@ -17,11 +16,12 @@ def stratify(num_strata: int, items: Iterable[T]) -> Iterator[T]:
     :param items:       The items to stratify.
     :return:            An iterator over the items in stratified order.
     """
-    # Wrap the items in a bin-item
-    bin_items: Iterator[BinItem[int, T]] = BinItem[int, T].extract_from(IndexExtractor[T](), items)
+    # Make sure we can index into the items
+    items = conservatively_cache(items, indexable=True)
 
-    # Perform startified binning on the bin-items
-    stratified_binning: Binning[BinItem[int, T], int] = StratifyingBinner[int, int](num_strata).bin(bin_items)
+    # Calculate the index range of each stratum
+    strata = StratifyingBinner[int, int](num_strata).bin_indices(len(items)).values()
 
-    # Return the iterator over the original items in their new order
-    return BinItem.unwrapping_iterator(stratified_binning.item_iterator())
+    # Return the iterator over the original items in their new order,
+    # slicing out each stratum
+    return chain.from_iterable(items[stratum.start::stratum.step] for stratum in strata)
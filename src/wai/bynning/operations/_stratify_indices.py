@@ -0,0 +1,19 @@
+import numpy as np
+
+from ..binners import StratifyingBinner
+
+
+def stratify_indices(num_strata: int, num_items: int) -> np.ndarray:
+    """
+    Stratifies a number of items. Index-based version of stratify.
+
+    :param num_strata:  The number of strata to produce.
+    :param num_items:   The number of items to stratify.
+    :return:            An array of the item indices in stratified order.
+    """
+    strata = StratifyingBinner[int, int](num_strata).bin_indices(num_items).values()
+
+    return np.concatenate(
+        [np.arange(stratum.start, stratum.stop, stratum.step, dtype=np.intp) for stratum in strata]
+        or [np.empty(0, dtype=np.intp)]
+    )
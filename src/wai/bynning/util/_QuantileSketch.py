@@ -0,0 +1,166 @@
+from math import ceil
+from numbers import Real
+from random import Random
+from typing import Optional, List, Iterable, Sequence
+
+import numpy as np
+
+
+class QuantileSketch:
+    """
+    Mergeable summary of a stream of real values, from which the value at
+    any quantile of the stream can be estimated using bounded memory. Uses
+    a hierarchy of fixed-capacity compactors (as in the KLL sketch), where
+    each compaction sorts a full level and promotes every other value to
+    the next level up, at double the weight.
+    """
+    def __init__(self, relative_error: float = 0.01, rand: Optional[Random] = None):
+        """
+        :param relative_error:  The target error in the rank of estimated quantiles,
+                                as a fraction of the total number of values.
+        :param rand:            An optional source of randomness for compaction.
+        """
+        # Error must be a proper fraction
+        if not 0.0 < relative_error < 1.0:
+            raise ValueError(f"Relative error must be in (0, 1), got {relative_error}")
+
+        # The number of values each level can hold before it is compacted (must be even)
+        self._capacity: int = 2 * ceil(2 / relative_error)
+
+        # The values held at each level, where values at level h have weight 2^h
+        self._levels: List[List[Real]] = [[]]
+
+        # The total number of values summarised
+        self._count: int = 0
+
+        self._rand: Random = rand if rand is not None else Random()
+
+    @property
+    def count(self) -> int:
+        """
+        Gets the number of values that have been added to the sketch.
+        """
+        return self._count
+
+    def update(self, value: Real):
+        """
+        Adds a single value to the sketch.
+
+        :param value:   The value.
+        """
+        level = self._levels[0]
+        level.append(value)
+        self._count += 1
+
+        if len(level) >= self._capacity:
+            self._compact(0)
+
+    def update_all(self, values: Iterable[Real]):
+        """
+        Adds a number of values to the sketch.
+
+        :param values:  The values.
+        """
+        # Compact arrays of values a level at a time, a chunk at a time
+        # so that memory-mapped arrays aren't copied into memory whole
+        if isinstance(values, np.ndarray):
+            values = values.reshape(-1)
+            chunk_size = self._capacity * 4096
+            for start in range(0, len(values), chunk_size):
+                chunk = values[start:start + chunk_size]
+                self._count += len(chunk)
+                self._update_level_array(0, chunk)
+            return
+
+        for value in values:
+            self.update(value)
+
+    def merge(self, other: 'QuantileSketch'):
+        """
+        Merges the values summarised by another sketch into this one.
+
+        :param other:   The other sketch.
+        """
+        for height, values in enumerate(other._levels):
+            self._get_level(height).extend(values)
+        self._count += other._count
+
+        # Compact any levels which are now over capacity
+        for height in range(len(self._levels)):
+            if len(self._levels[height]) >= self._capacity:
+                self._compact(height)
+
+    def quantiles(self, fractions: Sequence[float]) -> List[Real]:
+        """
+        Estimates the values at the given quantiles of the summarised values.
+
+        :param fractions:   The quantiles to estimate, as fractions in [0, 1].
+        :return:            The estimated value at each quantile.
+        """
+        if self._count == 0:
+            raise ValueError("Can't estimate quantiles of an empty sketch")
+
+        # Sort all held values, along with their weights
+        values = np.concatenate([np.asarray(level) for level in self._levels if len(level) > 0])
+        weights = np.concatenate([np.full(len(level), 2 ** height, dtype=np.int64)
+                                  for height, level in enumerate(self._levels) if len(level) > 0])
+        order = np.argsort(values, kind="stable")
+        values, cumulative_weights = values[order], np.cumsum(weights[order])
+
+        # Find the value at which the cumulative weight reaches each quantile's rank
+        ranks = np.asarray(fractions, dtype=np.float64) * cumulative_weights[-1]
+        indices = np.minimum(np.searchsorted(cumulative_weights, ranks, side="left"), len(values) - 1)
+
+        return values[indices].tolist()
+
+    def _get_level(self, height: int) -> List[Real]:
+        """
+        Gets the values held at the given level, creating the level if necessary.
+
+        :param height:  The level.
+        :return:        The level's values.
+        """
+        while len(self._levels) <= height:
+            self._levels.append([])
+
+        return self._levels[height]
+
+    def _compact(self, height: int):
+        """
+        Compacts the given level, promoting every other value (from a random
+        starting offset) to the level above.
+
+        :param height:  The level to compact.
+        """
+        level = self._levels[height]
+        level.sort()
+        promoted = level[self._rand.getrandbits(1)::2]
+        level.clear()
+
+        above = self._get_level(height + 1)
+        above.extend(promoted)
+        if len(above) >= self._capacity:
+            self._compact(height + 1)
+
+    def _update_level_array(self, height: int, values: np.ndarray):
+        """
+        Adds an array of values to the given level, compacting it in
+        blocks of the level capacity using vectorised operations.
+
+        :param height:  The level.
+        :param values:  The values to add.
+        """
+        level = self._get_level(height)
+        if len(level) > 0:
+            values = np.concatenate((np.asarray(level, dtype=values.dtype), values))
+
+        # Compact as many full blocks as possible
+        num_blocks = len(values) // self._capacity
+        if num_blocks > 0:
+            blocks = np.sort(values[:num_blocks * self._capacity].reshape(num_blocks, self._capacity), axis=1)
+            offsets = np.array([self._rand.getrandbits(1) for _ in range(num_blocks)])
+            columns = offsets[:, np.newaxis] + 2 * np.arange(self._capacity // 2)
+            self._update_level_array(height + 1, blocks[np.arange(num_blocks)[:, np.newaxis], columns].reshape(-1))
+
+        # Keep the remaining values at this level
+        self._levels[height] = values[num_blocks * self._capacity:].tolist()
@@ -1,6 +1,13 @@
 """
 Utility functions for binning.
 """
+from ._array_chunks import array_chunks
 from ._conservatively_cache import conservatively_cache
+from ._faithful_array import faithful_array
 from ._frequency_divide import frequency_divide
+# No longer used internally, but kept as part of the public API
 from ._integer_dot_product import integer_dot_product
+from ._load_key_column import load_key_column
+from ._QuantileSketch import QuantileSketch
+from ._take import take
+from ._weighted_frequency_divide import weighted_frequency_divide
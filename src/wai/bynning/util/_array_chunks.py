@@ -0,0 +1,21 @@
+from typing import Iterator
+
+import numpy as np
+
+
+def array_chunks(array: np.ndarray, chunk_size: int) -> Iterator[np.ndarray]:
+    """
+    Iterates over an array a chunk of rows at a time, so that only one
+    chunk needs to be read into memory at once (e.g. when the array is
+    memory-mapped).
+
+    :param array:       The array.
+    :param chunk_size:  The number of rows per chunk.
+    :return:            An iterator over the chunks.
+    """
+    # Chunk size must be positive
+    if chunk_size < 1:
+        raise ValueError(f"Chunk size must be positive, got {chunk_size}")
+
+    for start in range(0, len(array), chunk_size):
+        yield array[start:start + chunk_size]
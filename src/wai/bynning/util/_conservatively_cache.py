@@ -1,14 +1,23 @@
-from typing import Iterable, TypeVar, List
+from typing import Iterable, TypeVar, List, Sequence, Union
+
+import numpy as np
 
 # The type of element in the iterable
 ElementType = TypeVar("ElementType")
 
 
-def conservatively_cache(items: Iterable[ElementType]) -> List[ElementType]:
+def conservatively_cache(items: Iterable[ElementType],
+                         indexable: bool = False) -> Union[List[ElementType], Sequence[ElementType], np.ndarray]:
     """
     Caches the iterable in a list, unless it already is a list.
 
-    :param items:   The iterable of items.
-    :return:        The list of items.
+    :param items:       The iterable of items.
+    :param indexable:   Whether to also return tuples and NumPy arrays as-is,
+                        as (like lists) they can be efficiently indexed and
+                        sliced. Other sequences (e.g. deques) are still cached.
+    :return:            The list (or tuple/array) of items.
     """
-    return items if isinstance(items, list) else list(items)
+    if isinstance(items, list) or indexable and isinstance(items, (tuple, np.ndarray)):
+        return items
+
+    return list(items)
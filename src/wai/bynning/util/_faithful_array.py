@@ -0,0 +1,31 @@
+from typing import Sequence, Union
+
+import numpy as np
+
+
+def faithful_array(values: Union[Sequence, np.ndarray]) -> np.ndarray:
+    """
+    Creates a one-dimensional array of the given values, falling back to an
+    object array of the values themselves wherever NumPy can't represent
+    them as-is (e.g. values of mixed types, which it would coerce to a common
+    type, or tuples, which it would turn into an extra dimension).
+
+    :param values:  The values.
+    :return:        The array, with one element per value.
+    """
+    # One-dimensional arrays already have one element per value
+    if isinstance(values, np.ndarray) and values.ndim == 1:
+        return values
+
+    # Only values of a single type are converted without coercion
+    if len(set(map(type, values))) <= 1:
+        try:
+            array = np.asarray(values)
+        except ValueError:
+            # Ragged sequences
+            pass
+        else:
+            if array.ndim == 1:
+                return array
+
+    return np.fromiter(values, dtype=object, count=len(values))
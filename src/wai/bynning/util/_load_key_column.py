@@ -0,0 +1,29 @@
+import os
+from typing import Optional, Union
+
+import numpy as np
+
+
+def load_key_column(path: Union[str, os.PathLike],
+                    dtype: Optional[Union[str, np.dtype]] = None,
+                    offset: int = 0) -> np.ndarray:
+    """
+    Memory-maps a column of bin-keys stored on disk, so that it can be
+    binned without reading the whole file into memory. The file can either
+    be a NumPy .npy file (if no data-type is given), or a raw binary file
+    of fixed-width values of the given data-type.
+
+    :param path:    The path to the file.
+    :param dtype:   The data-type of the values in a raw binary file, or None
+                    if the file is a .npy file.
+    :param offset:  The number of header bytes to skip in a raw binary file.
+    :return:        A read-only memory-mapped array of the bin-keys.
+    """
+    # .npy files describe their own layout
+    if dtype is None:
+        if offset != 0:
+            raise ValueError("Offset is only valid for raw binary files")
+
+        return np.load(path, mmap_mode="r")
+
+    return np.memmap(path, dtype=dtype, mode="r", offset=offset)
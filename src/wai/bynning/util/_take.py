@@ -0,0 +1,22 @@
+from typing import Sequence, TypeVar, Iterator, Union
+
+import numpy as np
+
+# The type of element in the sequence
+ElementType = TypeVar("ElementType")
+
+
+def take(items: Union[Sequence[ElementType], np.ndarray],
+         indices: Union[Sequence[int], np.ndarray]) -> Iterator[ElementType]:
+    """
+    Creates an iterator over the items at the given indices. NumPy
+    arrays are indexed in a single vectorised operation.
+
+    :param items:       The items.
+    :param indices:     The indices of the items to iterate over.
+    :return:            The iterator.
+    """
+    if isinstance(items, np.ndarray):
+        return iter(items[np.asarray(indices, dtype=np.intp)])
+
+    return map(items.__getitem__, indices.tolist() if isinstance(indices, np.ndarray) else indices)
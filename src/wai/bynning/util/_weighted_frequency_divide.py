@@ -0,0 +1,39 @@
+import numpy as np
+
+
+def weighted_frequency_divide(weights: np.ndarray, num_segments: int) -> np.ndarray:
+    """
+    Divides a sequence of weighted items into a number of contiguous
+    segments, where each segment has (as near as possible) the same
+    total weight. Each item goes into the segment containing the midpoint
+    of its weight, so a segment can be empty if a single heavy item
+    spans it.
+
+    :param weights:         The non-negative weight of each item, in order.
+    :param num_segments:    The total number of segments to produce.
+    :return:                The num_segments + 1 boundaries between the
+                            segments, as item indices (segment i contains
+                            the items from boundary i up to boundary i + 1).
+    """
+    # Make sure there is at least one segment
+    if num_segments < 1:
+        raise ValueError(f"Can't create a non-positive number of segments, got {num_segments}")
+
+    weights = np.asarray(weights)
+
+    # Make sure the weights are non-negative, so the cumulative weights are ordered
+    if len(weights) > 0 and weights.min() < 0:
+        raise ValueError("Can't divide items with negative weights")
+
+    # Calculate (twice) the midpoint of each item's weight
+    cumulative_weights = np.cumsum(weights)
+    double_midpoints = 2 * cumulative_weights - weights
+    total_weight = cumulative_weights[-1] if len(weights) > 0 else 0
+
+    # Find the first item whose midpoint is at or after each segment's share of
+    # the total weight (comparing scaled values keeps integer weights exact)
+    boundaries = np.searchsorted(double_midpoints * num_segments,
+                                 2 * total_weight * np.arange(1, num_segments),
+                                 side="left")
+
+    return np.concatenate(([0], boundaries, [len(weights)])).astype(np.int64)
@@ -0,0 +1,43 @@
+"""
+Tests of BinItemBatch, and of binnings of batches.
+"""
+import unittest
+
+import numpy as np
+
+from wai.bynning import BinItemBatch
+from wai.bynning.binners import EqualWidthBinner, KeyBinner, NoBinner
+
+
+class TestBinItemBatch(unittest.TestCase):
+    def setUp(self):
+        self.batch = BinItemBatch(np.asarray([1, 2, 1, 3]), ["a", "b", "c", "d"])
+
+    def test_items_are_stable(self):
+        self.assertIs(self.batch[1], self.batch[1])
+        self.assertIs(self.batch[-1], self.batch[3])
+        self.assertEqual(list(self.batch), [self.batch[index] for index in range(len(self.batch))])
+        self.assertTrue(all(item is self.batch[index] for index, item in enumerate(self.batch)))
+
+    def test_items_and_keys(self):
+        self.assertEqual([(item.bin_key, item.payload) for item in self.batch],
+                         [(1, "a"), (2, "b"), (1, "c"), (3, "d")])
+        self.assertEqual([item.payload for item in self.batch[1:3]], ["b", "c"])
+
+    def test_binning_contains_own_items(self):
+        for binner in (EqualWidthBinner(num_bins=2), KeyBinner(), NoBinner("all")):
+            with self.subTest(binner=type(binner).__name__):
+                binning = binner.bin(self.batch)
+                first = next(binning.item_iterator())
+                self.assertTrue(binning.contains_item(first))
+                self.assertIn(first, binning[next(iter(binning)).label])
+                self.assertIs(binning.get_item(0), binning.get_item(0))
+                self.assertTrue(all(binning.contains_item(item) for item in self.batch))
+
+    def test_mismatched_lengths(self):
+        with self.assertRaises(ValueError):
+            BinItemBatch(np.arange(3), ["a"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+Tests that binner configurations survive JSON/pickle round-trips, and that
+transforming with a configuration fit on some items bins them as bin does.
+"""
+import json
+import pickle
+import unittest
+from random import Random
+
+import numpy as np
+
+from wai.bynning import BinItem
+from wai.bynning.binners import (
+    BinnerConfiguration, EqualWidthBinner, FrequencyBinner, GridBinner, KeyBinner, RiceRuleBinner
+)
+
+
+def as_lists(binning):
+    """
+    Converts a binning to a list of (label, [payload, ...]) pairs.
+    """
+    return [(bin.label, [item.payload for item in bin]) for bin in binning]
+
+
+def as_dict(binning):
+    """
+    Converts a binning to a dictionary from label to the payloads in the bin.
+    """
+    return {bin.label: [item.payload for item in bin] for bin in binning}
+
+
+class TestBinnerConfiguration(unittest.TestCase):
+    def setUp(self):
+        rand = Random(0)
+        scalar_keys = [rand.uniform(-10, 10) for _ in range(200)]
+        grid_keys = [(rand.randint(0, 9), rand.uniform(0, 1)) for _ in range(200)]
+
+        # Factory for each binner, and the keys to fit it on
+        self.cases = {
+            "EqualWidthBinner(num_bins)": (lambda: EqualWidthBinner(num_bins=7), scalar_keys),
+            "EqualWidthBinner(bin_width)": (lambda: EqualWidthBinner(bin_width=1.5), scalar_keys),
+            "RiceRuleBinner": (RiceRuleBinner, scalar_keys),
+            "FrequencyBinner": (lambda: FrequencyBinner(4, relative_error=0.01, rand=Random(0)), scalar_keys),
+            "GridBinner": (lambda: GridBinner(num_bins=(3, 4)), grid_keys),
+        }
+
+    def test_transform_matches_bin(self):
+        for name, (factory, keys) in self.cases.items():
+            items = [BinItem(key, index) for index, key in enumerate(keys)]
+            with self.subTest(binner=name):
+                configuration = factory().fit(items)
+                self.assertEqual(as_lists(factory().transform(items, configuration)), as_lists(factory().bin(items)))
+
+                # Fitting other ways gives the same configuration
+                self.assertEqual(factory().fit_stream(iter(items)), configuration)
+                if name != "GridBinner":
+                    self.assertEqual(factory().fit_array(np.asarray(keys)), configuration)
+                    np.testing.assert_array_equal(factory().transform_array(np.asarray(keys), configuration),
+                                                  factory().bin_array(np.asarray(keys)))
+
+    def test_round_trips(self):
+        for name, (factory, keys) in self.cases.items():
+            items = [BinItem(key, index) for index, key in enumerate(keys)]
+            configuration = factory().fit(items)
+            expected = as_lists(factory().transform(items, configuration))
+            with self.subTest(binner=name):
+                for restored in (BinnerConfiguration.from_json(configuration.to_json()),
+                                 BinnerConfiguration.from_dict(json.loads(json.dumps(configuration.to_dict()))),
+                                 pickle.loads(pickle.dumps(configuration))):
+                    self.assertEqual(restored, configuration)
+                    self.assertEqual(hash(restored), hash(configuration))
+                    self.assertEqual(as_lists(factory().transform(items, restored)), expected)
+
+    def test_fit_doesnt_modify_binner(self):
+        binner = EqualWidthBinner(num_bins=2)
+        binner.bin([BinItem(0, 0), BinItem(10, 1)])
+        binner.fit([BinItem(0, 0), BinItem(100, 1)])
+        self.assertEqual(binner._get_configuration_values()["max"], 10)
+
+    def test_transform_other_items(self):
+        configuration = EqualWidthBinner(num_bins=2).fit([BinItem(0, 0), BinItem(4, 1)])
+        binning = EqualWidthBinner(num_bins=2).transform([BinItem(1, 0), BinItem(3, 1), BinItem(3.5, 2)],
+                                                         configuration)
+        self.assertEqual(as_dict(binning), {0: [0], 1: [1, 2]})
+
+    def test_immutable(self):
+        configuration = EqualWidthBinner(num_bins=2).fit([BinItem(0, 0), BinItem(4, 1)])
+        with self.assertRaises(AttributeError):
+            configuration._binner_type = "KeyBinner"
+        with self.assertRaises(TypeError):
+            configuration.values["max"] = 10
+
+    def test_wrong_binner_type(self):
+        configuration = EqualWidthBinner(num_bins=2).fit([BinItem(0, 0), BinItem(4, 1)])
+        with self.assertRaises(ValueError):
+            RiceRuleBinner().transform([BinItem(1, 0)], configuration)
+
+    def test_unexportable_configurations(self):
+        with self.assertRaises(NotImplementedError):
+            FrequencyBinner(2).fit([BinItem(0, 0), BinItem(4, 1)])
+        with self.assertRaises(AttributeError):
+            KeyBinner().fit
+
+
+if __name__ == '__main__':
+    unittest.main()
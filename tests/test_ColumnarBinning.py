@@ -0,0 +1,98 @@
+"""
+Tests that ColumnarBinning (and its BinView bins) behave the same as an
+equivalent item-based Binning.
+"""
+import unittest
+from random import Random
+
+import numpy as np
+
+from wai.bynning import BinView, Binning, Bin, ColumnarBinning
+
+
+def item_binning(items, labels):
+    """
+    Creates the equivalent item-based binning: bins in order of first
+    appearance of their label, with items in their original order.
+    """
+    bins = {}
+    for item, label in zip(items, labels):
+        if label not in bins:
+            bins[label] = Bin(label)
+        bins[label].add_item(item)
+
+    return Binning(bins.values())
+
+
+def as_lists(binning):
+    """
+    Converts a binning to a list of (label, [item, ...]) pairs.
+    """
+    return [(bin.label, list(bin)) for bin in binning]
+
+
+class TestColumnarBinning(unittest.TestCase):
+    def setUp(self):
+        rand = Random(42)
+        self.cases = []
+        for _ in range(50):
+            num_items = rand.randint(0, 30)
+            items = [f"item{index}" for index in range(num_items)]
+            labels = [rand.choice([3, 1, 2, 7]) for _ in range(num_items)]
+            self.cases.append((items, labels))
+
+    def test_from_labels_matches_item_binning(self):
+        for items, labels in self.cases:
+            with self.subTest(labels=labels):
+                binning = ColumnarBinning.from_labels(items, np.asarray(labels, dtype=np.int64))
+                expected = item_binning(items, labels)
+                self.assertEqual(as_lists(binning), as_lists(expected))
+                self.assertTrue(all(isinstance(bin, BinView) for bin in binning))
+
+    def test_object_labels(self):
+        items = ["a", "b", "c", "d"]
+        labels = [(1, 2), None, (1, 2), "x"]
+        label_array = np.empty(len(labels), dtype=object)
+        label_array[:] = labels
+        binning = ColumnarBinning.from_labels(items, label_array)
+        self.assertEqual(as_lists(binning), as_lists(item_binning(items, labels)))
+
+    def test_codes_and_views(self):
+        items = ["a", "b", "c", "d", "e"]
+        binning = ColumnarBinning(items, np.asarray([1, 0, 1, 2, 0]), ["x", "y", "z", "empty"])
+
+        # Empty bins are left out, others keep their items in original order
+        self.assertEqual(as_lists(binning), [("x", ["b", "e"]), ("y", ["a", "c"]), ("z", ["d"])])
+        self.assertEqual(binning["y"].indices.tolist(), [0, 2])
+        self.assertEqual(binning["y"][1], "c")
+        self.assertEqual(binning.codes.tolist(), [1, 0, 1, 2, 0])
+
+    def test_queries_match_item_binning(self):
+        for items, labels in self.cases:
+            binning = ColumnarBinning.from_labels(items, np.asarray(labels, dtype=np.int64))
+            expected = item_binning(items, labels)
+            with self.subTest(labels=labels):
+                self.assertEqual(binning.num_items(), expected.num_items())
+                self.assertEqual(len(binning), len(expected))
+                self.assertEqual(list(binning.item_iterator()), list(expected.item_iterator()))
+                for index in range(-len(items), len(items)):
+                    self.assertEqual(binning.get_item(index), expected.get_item(index))
+                indices = list(range(len(items)))[::-1]
+                self.assertEqual(binning.get_items(indices), expected.get_items(indices))
+                for item in items:
+                    self.assertTrue(binning.contains_item(item))
+
+    def test_invalid_codes(self):
+        with self.assertRaises(ValueError):
+            ColumnarBinning(["a", "b"], np.asarray([0]), ["x"])
+        with self.assertRaises(ValueError):
+            ColumnarBinning(["a"], np.asarray([1]), ["x"])
+
+    def test_views_are_read_only(self):
+        binning = ColumnarBinning(["a"], np.asarray([0]), ["x"])
+        with self.assertRaises(TypeError):
+            binning["x"].add_item("b")
+
+
+if __name__ == '__main__':
+    unittest.main()
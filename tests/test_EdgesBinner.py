@@ -0,0 +1,84 @@
+"""
+Tests of EdgesBinner's labelling of keys against its edges, including the
+underflow/overflow bins and right-closed intervals.
+"""
+import unittest
+from random import Random
+
+import numpy as np
+
+from wai.bynning import BinItem
+from wai.bynning.binners import EdgesBinner
+
+
+EDGES = [-1.5, 0, 2, 10]
+
+
+class TestEdgesBinner(unittest.TestCase):
+    def assertLabels(self, binner, keys, expected):
+        """
+        Asserts that the binner labels the keys as expected, both one at a
+        time and as an array.
+        """
+        binning = binner.bin([BinItem(key, index) for index, key in enumerate(keys)])
+        labels = {item.payload: bin.label for bin in binning for item in bin}
+        self.assertEqual([labels[index] for index in range(len(keys))], expected)
+        self.assertEqual(binner.bin_array(np.asarray(keys)).tolist(), expected)
+
+    def test_left_closed(self):
+        self.assertLabels(EdgesBinner(EDGES),
+                          [-5, -1.5, -1, 0, 1, 2, 9.99, 10, 100],
+                          [0, 1, 1, 2, 2, 3, 3, 4, 4])
+
+    def test_right_closed(self):
+        self.assertLabels(EdgesBinner(EDGES, right=True),
+                          [-5, -1.5, -1, 0, 1, 2, 9.99, 10, 100],
+                          [0, 0, 1, 1, 2, 2, 3, 3, 4])
+
+    def test_matches_digitize(self):
+        rand = Random(0)
+        keys = [rand.uniform(-3, 12) for _ in range(500)] + EDGES
+        for right in (False, True):
+            with self.subTest(right=right):
+                self.assertLabels(EdgesBinner(EDGES, right=right), keys,
+                                  np.digitize(keys, EDGES, right=right).tolist())
+
+    def test_single_edge(self):
+        self.assertLabels(EdgesBinner([0]), [-1, 0, 1], [0, 1, 1])
+
+    def test_underflow_disabled(self):
+        binner = EdgesBinner(EDGES, underflow=False)
+        self.assertLabels(binner, [-1.5, 10], [1, 4])
+        with self.assertRaises(ValueError):
+            binner.bin([BinItem(-2, 0)])
+        with self.assertRaises(ValueError):
+            binner.bin_array(np.asarray([0, -2]))
+
+        # Right-closed intervals underflow on the first edge
+        with self.assertRaises(ValueError):
+            EdgesBinner(EDGES, right=True, underflow=False).bin_array(np.asarray([-1.5]))
+
+    def test_overflow_disabled(self):
+        binner = EdgesBinner(EDGES, overflow=False)
+        self.assertLabels(binner, [-5, 9.99], [0, 3])
+        with self.assertRaises(ValueError):
+            binner.bin([BinItem(10, 0)])
+        with self.assertRaises(ValueError):
+            binner.bin_array(np.asarray([0, 10]))
+
+        # Right-closed intervals include the last edge
+        self.assertLabels(EdgesBinner(EDGES, right=True, overflow=False), [10], [3])
+
+    def test_empty(self):
+        self.assertEqual(len(EdgesBinner(EDGES).bin([])), 0)
+        self.assertEqual(EdgesBinner(EDGES, underflow=False).bin_array(np.asarray([])).tolist(), [])
+
+    def test_invalid_edges(self):
+        for edges in ([], [1, 1], [2, 1]):
+            with self.subTest(edges=edges):
+                with self.assertRaises(ValueError):
+                    EdgesBinner(edges)
+
+
+if __name__ == '__main__':
+    unittest.main()
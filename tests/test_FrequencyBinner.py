@@ -0,0 +1,37 @@
+"""
+Tests that FrequencyBinner bins batches of bin-items the same way
+as any other iterable of the items.
+"""
+import unittest
+from random import Random
+
+import numpy as np
+
+from wai.bynning import BinItemBatch
+from wai.bynning.binners import FrequencyBinner
+
+
+def as_lists(binning):
+    """
+    Converts a binning to a list of (label, [(key, payload), ...]) pairs.
+    """
+    return [(bin.label, [(item.bin_key, item.payload) for item in bin]) for bin in binning]
+
+
+class TestFrequencyBinnerBatch(unittest.TestCase):
+    def test_batch_matches_list(self):
+        rand = Random(42)
+        for preserve_order in (False, True):
+            for _ in range(100):
+                num_items = rand.randint(1, 30)
+                num_bins = rand.randint(1, 8)
+                batch = BinItemBatch(np.asarray([rand.randint(0, 5) for _ in range(num_items)]), list(range(num_items)))
+                with self.subTest(preserve_order=preserve_order, keys=batch.keys.tolist(), num_bins=num_bins):
+                    self.assertEqual(
+                        as_lists(FrequencyBinner(num_bins, preserve_order=preserve_order).bin(batch)),
+                        as_lists(FrequencyBinner(num_bins, preserve_order=preserve_order).bin(list(batch)))
+                    )
+
+
+if __name__ == '__main__':
+    unittest.main()
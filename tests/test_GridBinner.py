@@ -0,0 +1,48 @@
+"""
+Tests of GridBinner, including binning no items.
+"""
+import unittest
+
+import numpy as np
+
+from wai.bynning import BinItem
+from wai.bynning.binners import EqualWidthBinner, GridBinner
+
+
+class TestGridBinner(unittest.TestCase):
+    def test_empty(self):
+        for name, factory in (("num_bins", lambda: GridBinner(num_bins=2)),
+                              ("per-axis num_bins", lambda: GridBinner(num_bins=(2, 3))),
+                              ("bin_width", lambda: GridBinner(bin_width=0.5)),
+                              ("per-axis bin_width", lambda: GridBinner(bin_width=(0.5, 1)))):
+            with self.subTest(binner=name):
+                # Same as other binners
+                self.assertEqual(len(factory().bin([])), len(EqualWidthBinner(num_bins=2).bin([])))
+                self.assertEqual(len(factory().bin([])), 0)
+                self.assertEqual(len(factory().bin_stream([])), 0)
+                self.assertEqual(factory().count([]), {})
+                self.assertEqual(factory().bin_array(np.zeros((0, 2))).tolist(), [])
+                self.assertEqual(factory().bin_array(np.asarray([])).tolist(), [])
+                self.assertEqual(list(factory().bin_array_chunks(np.zeros((0, 2)), 10)), [])
+
+    def test_matches_equal_width_per_axis(self):
+        keys = [(x, y) for x in range(5) for y in (0.0, 0.3, 1.0)]
+        binner = GridBinner(num_bins=(2, 3))
+        binning = binner.bin([BinItem(key, index) for index, key in enumerate(keys)])
+        x_labels = EqualWidthBinner(num_bins=2).bin_array(np.asarray([x for x, _ in keys])).tolist()
+        y_labels = EqualWidthBinner(num_bins=3).bin_array(np.asarray([y for _, y in keys])).tolist()
+        for bin in binning:
+            for item in bin:
+                self.assertEqual(binner.cell(bin.label), (x_labels[item.payload], y_labels[item.payload]))
+        np.testing.assert_array_equal(GridBinner(num_bins=(2, 3)).bin_array(np.asarray(keys)),
+                                      [label for label in np.ravel_multi_index((x_labels, y_labels), (2, 3))])
+
+    def test_wrong_dimensions(self):
+        with self.assertRaises(ValueError):
+            GridBinner(num_bins=2).bin_array(np.asarray([1, 2]))
+        with self.assertRaises(ValueError):
+            GridBinner(num_bins=(2, 3, 4)).bin([BinItem((0, 1), 0)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+Tests that IncrementalBinning.extend continues each binner family's state
+from the original binning.
+"""
+import unittest
+from random import Random
+
+from wai.bynning import BinItem, IncrementalBinning
+from wai.bynning.binners import (
+    CrossValidationFoldBinner, EqualWidthBinner, KeyBinner, MinSizeBinner, RandomBinner,
+    SplitBinner, StratifyingBinner
+)
+
+
+def make_items(keys, start=0):
+    """
+    Creates bin-items for the given keys, with their index as payload.
+    """
+    return [BinItem(key, index) for index, key in enumerate(keys, start)]
+
+
+def as_lists(binning):
+    """
+    Converts a binning to a list of (label, [payload, ...]) pairs.
+    """
+    return [(bin.label, [item.payload for item in bin]) for bin in binning]
+
+
+def as_dict(binning):
+    """
+    Converts a binning to a dictionary from label to the payloads in the bin.
+    """
+    return {bin.label: [item.payload for item in bin] for bin in binning}
+
+
+class TestIncrementalBinning(unittest.TestCase):
+    def assertExtendsLikeBin(self, binner, keys, split):
+        """
+        Asserts that binning the keys up to the split and then extending by
+        the rest gives the same bins as binning all the keys at once.
+        """
+        binning = IncrementalBinning(binner, make_items(keys[:split]))
+        binning.extend(make_items(keys[split:], split))
+        self.assertEqual(as_dict(binning), as_dict(binner.bin(make_items(keys))))
+
+    def test_sequential_binners_continue(self):
+        keys = list(range(23))
+        for binner in (SplitBinner(3, 1, 2), StratifyingBinner(4), KeyBinner()):
+            for split in (0, 1, 5, 12, 23):
+                with self.subTest(binner=type(binner).__name__, split=split):
+                    self.assertExtendsLikeBin(binner, keys, split)
+
+    def test_random_binner_continues(self):
+        keys = list(range(30))
+        for split in (0, 7, 30):
+            with self.subTest(split=split):
+                binning = IncrementalBinning(RandomBinner(3, rand=Random(1)), make_items(keys[:split]))
+                binning.extend(make_items(keys[split:], split))
+                expected = RandomBinner(3, rand=Random(1)).bin(make_items(keys))
+                self.assertEqual(as_dict(binning), as_dict(expected))
+
+    def test_multiple_extensions(self):
+        binning = IncrementalBinning(StratifyingBinner(3), make_items(range(2)))
+        binning.extend(make_items(range(2, 4), 2))
+        binning.extend(make_items(range(4, 7), 4))
+        self.assertEqual(as_dict(binning), {0: [0, 3, 6], 1: [1, 4], 2: [2, 5]})
+
+    def test_binner_is_copied(self):
+        binner = StratifyingBinner(2)
+        binning = IncrementalBinning(binner, make_items(range(3)))
+        binner.bin(make_items(range(2)))
+        binning.extend(make_items(range(3, 4), 3))
+        self.assertEqual(as_dict(binning), {0: [0, 2], 1: [1, 3]})
+
+    def test_two_pass_binner_keeps_configuration(self):
+        binning = IncrementalBinning(EqualWidthBinner(num_bins=2), make_items([0, 1, 2, 3]))
+        self.assertEqual(as_dict(binning), {0: [0, 1], 1: [2, 3]})
+
+        # Further keys are binned with the original bin width of 1.5, rather
+        # than reconfigured on the range [-100, 100]
+        binning.extend(make_items([0.5, 2.5, 100, -100], 4))
+        self.assertEqual(as_dict(binning), {0: [0, 1, 4], 1: [2, 3, 5], 66: [6], -67: [7]})
+
+    def test_min_size_binner(self):
+        # The example from IncrementalBinning's docstring
+        binning = IncrementalBinning(MinSizeBinner(5), make_items([3] * 5))
+        binning.extend(make_items([3] * 3, 5))
+        self.assertEqual(as_lists(binning), [(0, [0, 1]), (1, [2, 3, 4]), (2, [5, 6, 7])])
+
+        # Binning all at once gives different bins
+        self.assertEqual(as_lists(MinSizeBinner(5).bin(make_items([3] * 8))),
+                         [(0, [0, 1]), (1, [2, 3]), (2, [4, 5]), (3, [6, 7])])
+
+    def test_min_size_binner_fills_last_bin(self):
+        # Extension too small to fill a new bin goes in the last bin
+        binning = IncrementalBinning(MinSizeBinner(5), make_items([3] * 4))
+        binning.extend(make_items([3], 4))
+        self.assertEqual(as_lists(binning), [(0, [0, 1]), (1, [2, 3, 4])])
+
+    def test_non_incremental_binner(self):
+        with self.assertRaises(ValueError):
+            IncrementalBinning(CrossValidationFoldBinner(2), make_items(range(4)))
+
+
+if __name__ == '__main__':
+    unittest.main()
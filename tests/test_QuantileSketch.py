@@ -0,0 +1,88 @@
+"""
+Tests that QuantileSketch estimates quantiles within its target rank error.
+"""
+import unittest
+from random import Random
+
+import numpy as np
+
+from wai.bynning.util import QuantileSketch
+
+
+FRACTIONS = np.linspace(0.0, 1.0, 101)
+
+
+class TestQuantileSketch(unittest.TestCase):
+    def assertWithinRankError(self, sketch, num_values, relative_error):
+        """
+        Asserts that the sketch of a permutation of range(num_values) estimates
+        each quantile at a rank within the relative error of the true rank
+        (plus one for the discreteness of the ranks).
+        """
+        estimates = np.asarray(sketch.quantiles(FRACTIONS))
+        rank_errors = np.abs(estimates - FRACTIONS * num_values)
+        self.assertLessEqual(rank_errors.max(), relative_error * num_values + 1)
+
+    def shuffled(self, num_values):
+        values = list(range(num_values))
+        Random(0).shuffle(values)
+        return values
+
+    def test_rank_error(self):
+        for relative_error in (0.1, 0.05, 0.01):
+            for num_values in (1, 10, 1000, 100000):
+                with self.subTest(relative_error=relative_error, num_values=num_values):
+                    values = self.shuffled(num_values)
+
+                    sketch = QuantileSketch(relative_error, Random(0))
+                    for value in values:
+                        sketch.update(value)
+                    self.assertEqual(sketch.count, num_values)
+                    self.assertWithinRankError(sketch, num_values, relative_error)
+
+                    sketch = QuantileSketch(relative_error, Random(0))
+                    sketch.update_all(np.asarray(values))
+                    self.assertEqual(sketch.count, num_values)
+                    self.assertWithinRankError(sketch, num_values, relative_error)
+
+    def test_update_all_chunks(self):
+        # Capacity of 8 gives chunks of 8 * 4096 values, so this is 3 full chunks and a partial one
+        relative_error = 0.5
+        num_values = 8 * 4096 * 3 + 1000
+        values = np.asarray(self.shuffled(num_values))
+
+        chunked = QuantileSketch(relative_error, Random(0))
+        chunked.update_all(values)
+        self.assertEqual(chunked.count, num_values)
+        self.assertWithinRankError(chunked, num_values, relative_error)
+
+        # Multi-dimensional arrays are flattened
+        reshaped = QuantileSketch(relative_error, Random(0))
+        reshaped.update_all(values.reshape(-1, 8))
+        self.assertEqual(reshaped.count, num_values)
+        self.assertEqual(reshaped.quantiles(FRACTIONS), chunked.quantiles(FRACTIONS))
+
+        # Compaction conserves the total weight of the held values
+        total_weight = sum(len(level) * 2 ** height for height, level in enumerate(chunked._levels))
+        self.assertEqual(total_weight, num_values)
+
+    def test_merge(self):
+        values = self.shuffled(20000)
+        first, second = QuantileSketch(0.05, Random(0)), QuantileSketch(0.05, Random(1))
+        first.update_all(np.asarray(values[:7000]))
+        second.update_all(np.asarray(values[7000:]))
+        first.merge(second)
+        self.assertEqual(first.count, 20000)
+        self.assertWithinRankError(first, 20000, 0.05)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            QuantileSketch(0.0)
+        with self.assertRaises(ValueError):
+            QuantileSketch(1.0)
+        with self.assertRaises(ValueError):
+            QuantileSketch().quantiles([0.5])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+"""
+Tests of SplitBinner's schedule against the original Fraction-based algorithm.
+"""
+import unittest
+from fractions import Fraction
+from itertools import product
+from typing import List, Tuple
+
+import numpy as np
+
+from wai.bynning.binners import SplitBinner
+from wai.bynning.util import integer_dot_product
+
+
+def reference_schedule(ratios: Tuple[int, ...]) -> List[int]:
+    """
+    Calculates the schedule of labels the way SplitBinner originally did,
+    by comparing the squared cosine-similarity (as a Fraction) of every
+    candidate binning to the ratios.
+
+    :param ratios:  The ratios.
+    :return:        The label schedule.
+    """
+    schedule: List[int] = []
+    best_candidate: Tuple[int, ...] = tuple(0 for _ in range(len(ratios)))
+    for _ in range(sum(ratios)):
+        candidate_ratios = tuple(
+            tuple(ratio + 1 if i == candidate_index else ratio for i, ratio in enumerate(best_candidate))
+            for candidate_index in range(len(ratios))
+        )
+        candidate_dps: Tuple[Fraction, ...] = tuple(
+            integer_dot_product(ratios, candidate_ratio)
+            for candidate_ratio in candidate_ratios
+        )
+
+        # Select the first candidate with the greatest dot-product
+        best_candidate_index = None
+        best_candidate_dp = None
+        for candidate_index, candidate_dp in enumerate(candidate_dps):
+            if best_candidate_index is None or candidate_dp > best_candidate_dp:
+                best_candidate = candidate_ratios[candidate_index]
+                best_candidate_index = candidate_index
+                best_candidate_dp = candidate_dp
+
+        schedule.append(best_candidate_index)
+
+    return schedule
+
+
+class TestSplitBinnerSchedule(unittest.TestCase):
+    def test_schedule_matches_reference(self):
+        for num_ratios in range(1, 5):
+            for ratios in product(range(7), repeat=num_ratios):
+                if sum(ratios) == 0:
+                    continue
+                with self.subTest(ratios=ratios):
+                    self.assertEqual(SplitBinner._calculate_schedule(ratios), reference_schedule(ratios))
+
+    def test_large_ratios_match_reference(self):
+        for ratios in ((100, 1), (97, 89, 3), (50, 50, 50, 1), (1000, 999)):
+            with self.subTest(ratios=ratios):
+                self.assertEqual(SplitBinner._calculate_schedule(ratios), reference_schedule(ratios))
+
+    def test_bin_array_and_indices_match_bin(self):
+        keys = list(range(23))
+        binning = SplitBinner(3, 2, 1).bin_indices(len(keys))
+        labels = SplitBinner(3, 2, 1).bin_array(np.asarray(keys))
+        for label, indices in binning.items():
+            with self.subTest(label=label):
+                self.assertEqual(indices.tolist(), np.flatnonzero(labels == label).tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+"""
+Tests that CrossValidationFoldBinner.bin_all_folds gives the same folds as
+its original implementation, which binned each fold separately.
+"""
+import unittest
+
+from wai.bynning import BinItem
+from wai.bynning.binners import CrossValidationFoldBinner
+
+
+def as_lists(binning):
+    """
+    Converts a binning to a list of (label, [payload, ...]) pairs.
+    """
+    return [(bin.label, [item.payload for item in bin]) for bin in binning]
+
+
+def reference_all_folds(items, num_folds):
+    """
+    Creates the binning of each fold by binning the items once per fold,
+    as bin_all_folds originally did.
+    """
+    return [
+        CrossValidationFoldBinner(num_folds, fold).bin(items)
+        for fold in range(num_folds if num_folds is not None else len(items))
+    ]
+
+
+class TestBinAllFolds(unittest.TestCase):
+    def test_matches_reference(self):
+        for num_items in range(1, 25):
+            items = [BinItem(index % 3, index) for index in range(num_items)]
+            for num_folds in [None] + list(range(2, num_items + 1)):
+                with self.subTest(num_items=num_items, num_folds=num_folds):
+                    binnings = CrossValidationFoldBinner(num_folds).bin_all_folds(iter(items))
+                    expected = reference_all_folds(items, num_folds)
+                    self.assertEqual([as_lists(binning) for binning in binnings],
+                                     [as_lists(binning) for binning in expected])
+
+    def test_doesnt_modify_binner(self):
+        binner = CrossValidationFoldBinner(None, 0)
+        binner.bin_all_folds([BinItem(0, index) for index in range(5)])
+        self.assertIsNone(binner._num_folds)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            CrossValidationFoldBinner(4).bin_all_folds([BinItem(0, index) for index in range(3)])
+        with self.assertRaises(ValueError):
+            CrossValidationFoldBinner().bin_all_folds([])
+        with self.assertRaises(ValueError):
+            CrossValidationFoldBinner().bin([])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+Tests that binning an array of bin-keys a chunk at a time gives the same
+labels as binning it all at once.
+"""
+import unittest
+
+import numpy as np
+
+from wai.bynning.binners import (
+    EqualWidthBinner,
+    FreedmanDiaconisChoiceBinning,
+    FrequencyBinner,
+    GridBinner,
+    MinSizeBinner,
+    ScottsNormalReferenceRuleBinner,
+    SplitBinner,
+    StratifyingBinner,
+    SturgesFormulaBinner
+)
+
+
+class TestBinArrayChunks(unittest.TestCase):
+    def assertChunksMatchWhole(self, binner_factory, keys):
+        """
+        Asserts that bin_array_chunks gives the same labels as bin_array,
+        for a range of chunk sizes.
+
+        :param binner_factory:  Creates the binner to test.
+        :param keys:            The bin-keys to bin.
+        """
+        expected = binner_factory().bin_array(keys).tolist()
+        for chunk_size in (1, 3, 7, len(keys)):
+            with self.subTest(chunk_size=chunk_size):
+                labels = np.concatenate(list(binner_factory().bin_array_chunks(keys, chunk_size)))
+                self.assertEqual(labels.tolist(), expected)
+
+    def test_configured_from_chunks(self):
+        keys = np.random.default_rng(0).normal(size=50)
+        for binner_factory in (lambda: EqualWidthBinner(num_bins=4),
+                               lambda: EqualWidthBinner(bin_width=0.5),
+                               ScottsNormalReferenceRuleBinner,
+                               SturgesFormulaBinner,
+                               lambda: FrequencyBinner(4, relative_error=0.01)):
+            self.assertChunksMatchWhole(binner_factory, keys)
+
+    def test_grid(self):
+        self.assertChunksMatchWhole(lambda: GridBinner(num_bins=3), np.random.default_rng(0).random((50, 2)))
+
+    def test_continues_across_chunks(self):
+        keys = np.random.default_rng(0).integers(0, 7, 50)
+        for binner_factory in (lambda: MinSizeBinner(10), lambda: SplitBinner(3, 1, 2), lambda: StratifyingBinner(3)):
+            self.assertChunksMatchWhole(binner_factory, keys)
+
+    def test_needs_all_keys(self):
+        keys = np.arange(10.0)
+        for binner in (FrequencyBinner(3), FreedmanDiaconisChoiceBinning()):
+            with self.subTest(binner=type(binner).__name__):
+                with self.assertRaises(NotImplementedError):
+                    binner.bin_array_chunks(keys, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
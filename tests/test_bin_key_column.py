@@ -0,0 +1,95 @@
+"""
+Tests that bin_key_column writes the codes, indices and offsets of the
+binning of an on-disk key column (loaded with load_key_column).
+"""
+import json
+import os
+import unittest
+from random import Random
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from wai.bynning import BinItem
+from wai.bynning.binners import EqualWidthBinner, FrequencyBinner, StratifyingBinner
+from wai.bynning.operations import bin_key_column
+from wai.bynning.util import load_key_column
+
+
+class TestBinKeyColumn(unittest.TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.path = self.directory.name
+        rand = Random(0)
+        self.keys = np.asarray([rand.randint(-50, 50) for _ in range(1000)], dtype=np.int64)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def assertWrittenBinning(self, binner_factory, keys, output_directory, chunk_size):
+        """
+        Asserts that bin_key_column writes files describing the same binning
+        as binning the keys as bin-items.
+        """
+        bins = bin_key_column(binner_factory(), keys, output_directory, chunk_size)
+        expected = binner_factory().bin([BinItem(key, index) for index, key in enumerate(self.keys.tolist())])
+
+        # Labels are in order of first appearance, as are the bins of a binning
+        with open(os.path.join(output_directory, "labels.json")) as file:
+            labels = json.load(file)
+        self.assertEqual(labels, [bin.label for bin in expected])
+
+        # Codes index into the labels
+        codes = np.load(os.path.join(output_directory, "codes.npy"))
+        self.assertEqual([labels[code] for code in codes.tolist()],
+                         binner_factory().bin_array(self.keys).tolist())
+
+        # Indices are grouped by code, in order within each bin, delimited by the offsets
+        indices = np.load(os.path.join(output_directory, "indices.npy"))
+        offsets = np.load(os.path.join(output_directory, "offsets.npy"))
+        self.assertEqual(offsets.tolist(), np.cumsum([0] + [len(bin) for bin in expected]).tolist())
+        for code, bin in enumerate(expected):
+            bin_indices = [item.payload for item in bin]
+            self.assertEqual(indices[offsets[code]:offsets[code + 1]].tolist(), bin_indices)
+            self.assertEqual(bins[bin.label].tolist(), bin_indices)
+
+    def test_npy_column(self):
+        column_path = os.path.join(self.path, "keys.npy")
+        np.save(column_path, self.keys)
+        keys = load_key_column(column_path)
+        self.assertIsInstance(keys, np.memmap)
+
+        for name, factory in (("EqualWidthBinner", lambda: EqualWidthBinner(num_bins=7)),
+                              ("FrequencyBinner", lambda: FrequencyBinner(5, relative_error=0.01, rand=Random(0))),
+                              ("StratifyingBinner", lambda: StratifyingBinner(3))):
+            for chunk_size in (1, 64, 1000, 5000):
+                with self.subTest(binner=name, chunk_size=chunk_size):
+                    self.assertWrittenBinning(factory, keys, os.path.join(self.path, f"{name}-{chunk_size}"),
+                                              chunk_size)
+
+    def test_raw_column(self):
+        # Raw little-endian 32-bit keys after an 8-byte header
+        column_path = os.path.join(self.path, "keys.bin")
+        with open(column_path, "wb") as file:
+            file.write(b"HEADER!!")
+            file.write(self.keys.astype("<i4").tobytes())
+        keys = load_key_column(column_path, "<i4", offset=8)
+        self.assertEqual(keys.tolist(), self.keys.tolist())
+
+        self.assertWrittenBinning(lambda: EqualWidthBinner(num_bins=4), keys, os.path.join(self.path, "out"), 100)
+
+    def test_load_errors(self):
+        column_path = os.path.join(self.path, "keys.npy")
+        np.save(column_path, self.keys)
+        with self.assertRaises(ValueError):
+            load_key_column(column_path, offset=8)
+
+    def test_binner_needing_all_keys(self):
+        column_path = os.path.join(self.path, "keys.npy")
+        np.save(column_path, self.keys)
+        with self.assertRaises(NotImplementedError):
+            bin_key_column(FrequencyBinner(5), load_key_column(column_path), os.path.join(self.path, "out"), 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+Tests that TwoPassBinner.bin_stream gives the same binning as bin.
+"""
+import unittest
+from random import Random
+
+from wai.bynning import BinItem
+from wai.bynning.binners import CrossValidationFoldBinner, EqualWidthBinner, MinSizeBinner
+
+
+def as_lists(binning):
+    """
+    Converts a binning to a list of (label, [payload, ...]) pairs.
+    """
+    return [(bin.label, [item.payload for item in bin]) for bin in binning]
+
+
+class TestBinStream(unittest.TestCase):
+    def setUp(self):
+        rand = Random(0)
+        self.key_sets = [
+            [rand.randint(1, 10) for _ in range(num_items)]
+            for num_items in (3, 7, 50, 333)
+        ]
+
+    def binner_factories(self):
+        return {
+            "EqualWidthBinner(num_bins)": lambda: EqualWidthBinner(num_bins=4),
+            "EqualWidthBinner(bin_width)": lambda: EqualWidthBinner(bin_width=2.5),
+            "MinSizeBinner": lambda: MinSizeBinner(12),
+            "CrossValidationFoldBinner": lambda: CrossValidationFoldBinner(3, 1),
+            "CrossValidationFoldBinner(LOO)": lambda: CrossValidationFoldBinner(None, 0),
+        }
+
+    def test_matches_bin(self):
+        for name, factory in self.binner_factories().items():
+            for keys in self.key_sets:
+                items = [BinItem(key, index) for index, key in enumerate(keys)]
+                with self.subTest(binner=name, num_items=len(keys)):
+                    expected = as_lists(factory().bin(items))
+
+                    # From a re-iterable collection
+                    self.assertEqual(as_lists(factory().bin_stream(items)), expected)
+
+                    # From a factory callable
+                    self.assertEqual(as_lists(factory().bin_stream(lambda: iter(items))), expected)
+
+    def test_errors_match_bin(self):
+        items = [BinItem(1, 0), BinItem(2, 1)]
+        for name, factory in (("MinSizeBinner", lambda: MinSizeBinner(12)),
+                              ("CrossValidationFoldBinner", lambda: CrossValidationFoldBinner(3))):
+            with self.subTest(binner=name):
+                with self.assertRaises(ValueError):
+                    factory().bin(items)
+                with self.assertRaises(ValueError):
+                    factory().bin_stream(items)
+
+    def test_single_use_iterator(self):
+        with self.assertRaises(ValueError):
+            EqualWidthBinner(num_bins=2).bin_stream(iter([BinItem(1, 0)]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+Tests that Binner.count and Binner.count_array give the sizes of the bins
+that binning the same items would create.
+"""
+import unittest
+from random import Random
+
+import numpy as np
+
+from wai.bynning import BinItem, BinItemBatch
+from wai.bynning.binners import (
+    EdgesBinner, EqualWidthBinner, FrequencyBinner, KeyBinner, MinSizeBinner, SplitBinner, StratifyingBinner
+)
+
+
+class TestCount(unittest.TestCase):
+    def setUp(self):
+        rand = Random(0)
+        self.keys = [rand.randint(1, 20) for _ in range(500)]
+
+        # Factory for each binner to test
+        self.factories = {
+            "EqualWidthBinner": lambda: EqualWidthBinner(num_bins=6),
+            "FrequencyBinner": lambda: FrequencyBinner(4),
+            "FrequencyBinner(preserve_order)": lambda: FrequencyBinner(4, preserve_order=True),
+            "FrequencyBinner(relative_error)": lambda: FrequencyBinner(4, relative_error=0.01, rand=Random(0)),
+            "EdgesBinner": lambda: EdgesBinner([5, 10, 15]),
+            "MinSizeBinner": lambda: MinSizeBinner(100),
+            "SplitBinner": lambda: SplitBinner(3, 1),
+            "StratifyingBinner": lambda: StratifyingBinner(7),
+            "KeyBinner": KeyBinner,
+        }
+
+    def test_count_matches_bin(self):
+        items = [BinItem(key, index) for index, key in enumerate(self.keys)]
+        batch = BinItemBatch(np.asarray(self.keys), np.arange(len(self.keys)))
+        for name, factory in self.factories.items():
+            with self.subTest(binner=name):
+                expected = {bin.label: len(bin) for bin in factory().bin(items)}
+
+                counts = factory().count(items)
+                self.assertEqual(counts, expected)
+                self.assertEqual(list(counts), list(expected))
+
+                # Batches are counted via bin_array where possible
+                batch_counts = factory().count(batch)
+                self.assertEqual(batch_counts, expected)
+                self.assertEqual(list(batch_counts), list(expected))
+
+    def test_count_array_matches_bin(self):
+        items = [BinItem(key, index) for index, key in enumerate(self.keys)]
+        for name, factory in self.factories.items():
+            if name == "KeyBinner":
+                continue
+            expected = {bin.label: len(bin) for bin in factory().bin(items)}
+            for chunk_size in (1, 37, 1000):
+                with self.subTest(binner=name, chunk_size=chunk_size):
+                    counts = factory().count_array(np.asarray(self.keys), chunk_size)
+                    self.assertEqual(counts.sum(), len(self.keys))
+                    self.assertEqual({label: count for label, count in enumerate(counts.tolist()) if count > 0},
+                                     expected)
+
+    def test_count_array_includes_empty_bins(self):
+        counts = EdgesBinner([0, 10, 20]).count_array(np.asarray([5, 6, 25]))
+        self.assertEqual(counts.tolist(), [0, 2, 0, 1])
+
+    def test_count_array_needs_integer_labels(self):
+        with self.assertRaises(ValueError):
+            KeyBinner().count_array(np.asarray([-1, 2]))
+
+
+if __name__ == '__main__':
+    unittest.main()
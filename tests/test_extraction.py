@@ -0,0 +1,73 @@
+"""
+Tests that each extractor's batch extraction gives the same values as
+extracting from each item in turn.
+"""
+import unittest
+from collections import deque
+
+import numpy as np
+
+from wai.bynning.extraction import (
+    ConstantExtractor,
+    Extractor,
+    IdentityExtractor,
+    IndexExtractor,
+    LabelExtractor,
+    SizeExtractor
+)
+
+
+class NegatingExtractor(Extractor[float, float]):
+    """
+    Extractor which only implements extract, so uses the default extract_batch.
+    """
+    def extract(self, item: float) -> float:
+        return -item
+
+
+class TestExtractBatch(unittest.TestCase):
+    def assertBatchMatchesAll(self, extractor_factory, items):
+        """
+        Asserts that extract_batch gives the same values, in the same order,
+        as extract_all.
+
+        :param extractor_factory:   Creates the extractor (a fresh one for each
+                                    method, as some extractors are stateful).
+        :param items:               The items to extract from.
+        """
+        expected = list(extractor_factory().extract_all(items))
+        batch = extractor_factory().extract_batch(items)
+
+        self.assertIsInstance(batch, np.ndarray)
+        self.assertEqual(batch.shape, (len(items),))
+        self.assertEqual(batch.tolist(), expected)
+        self.assertEqual([type(value) for value in batch.tolist()], [type(value) for value in expected])
+
+    def test_constant(self):
+        for constant in (3, 2.5, "a", None, (1, 2)):
+            with self.subTest(constant=constant):
+                self.assertBatchMatchesAll(lambda: ConstantExtractor(constant), list(range(4)))
+
+    def test_identity(self):
+        for items in ([3, 1, 2], [1.5, 2.5], ["a", "bc"], [1, "a", 2.5],
+                      [(1, 2), (3, 4)], [(1, 2), (3,)], deque([5, 6]), []):
+            with self.subTest(items=items):
+                self.assertBatchMatchesAll(IdentityExtractor, items)
+
+    def test_index(self):
+        self.assertBatchMatchesAll(IndexExtractor, ["a", "b", "c"])
+
+    def test_label(self):
+        for labels in (("a", "b", "c"), (1, "a", 2.5), ((1, 2), (3, 4), (5, 6)), (None, 0, 1)):
+            with self.subTest(labels=labels):
+                self.assertBatchMatchesAll(lambda: LabelExtractor(*labels), [2, 0, 1, 1])
+
+    def test_size(self):
+        self.assertBatchMatchesAll(SizeExtractor, ["", "a", "abc", [1, 2]])
+
+    def test_default(self):
+        self.assertBatchMatchesAll(NegatingExtractor, [1, 2.5, -3])
+
+
+if __name__ == '__main__':
+    unittest.main()
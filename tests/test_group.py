@@ -0,0 +1,41 @@
+"""
+Tests of operations.group and group_indices against min-size binning
+of unit-size items.
+"""
+import unittest
+from collections import deque
+
+import numpy as np
+
+from wai.bynning import BinItem
+from wai.bynning.binners import MinSizeBinner
+from wai.bynning.operations import group, group_indices
+
+
+class TestGroup(unittest.TestCase):
+    def test_matches_min_size_binning(self):
+        for num_items in range(1, 20):
+            for size in range(1, num_items + 1):
+                expected = [[item.payload for item in bin]
+                            for bin in MinSizeBinner(size).bin([BinItem(1, index) for index in range(num_items)])]
+                with self.subTest(num_items=num_items, size=size):
+                    offsets = group_indices(size, num_items)
+                    self.assertEqual([list(range(start, end)) for start, end in zip(offsets[:-1], offsets[1:])],
+                                     expected)
+                    for items in (list(range(num_items)), np.arange(num_items), deque(range(num_items))):
+                        self.assertEqual([list(group_items) for group_items in group(size, items)], expected)
+
+    def test_group_is_lazy(self):
+        groups = group(1, range(10))
+        self.assertEqual(list(next(groups)), [0])
+        self.assertEqual(list(next(groups)), [1])
+
+    def test_invalid_sizes(self):
+        with self.assertRaises(ValueError):
+            group_indices(0, 5)
+        with self.assertRaises(ValueError):
+            group(6, range(5))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Tests of the opt-in instrumentation of Binner.bin.
+"""
+import logging
+import unittest
+
+import numpy as np
+
+from wai.bynning import BinItem, BinItemBatch
+from wai.bynning.binners import EqualWidthBinner, KeyBinner
+from wai.bynning.instrumentation import BinningRecord, get_recorder, instrument
+
+
+def make_items(keys):
+    """
+    Creates bin-items for the given keys, with their index as payload.
+    """
+    return [BinItem(key, index) for index, key in enumerate(keys)]
+
+
+class TestInstrumentation(unittest.TestCase):
+    def test_records_binning(self):
+        with instrument() as records:
+            binning = KeyBinner().bin(make_items([1, 2, 1, 1, 3]))
+
+        self.assertEqual(len(records), 1)
+        record = records[0]
+        self.assertIsInstance(record, BinningRecord)
+        self.assertEqual(record.binner_type, "KeyBinner")
+        self.assertEqual((record.num_items, record.num_bins, record.peak_bin_size), (5, 3, 3))
+        self.assertEqual(record.num_items, binning.num_items())
+        self.assertEqual(set(record.phase_seconds), {"bin"})
+        self.assertAlmostEqual(record.total_seconds, sum(record.phase_seconds.values()))
+        self.assertEqual(record.to_dict()["num_bins"], 3)
+
+    def test_records_phases(self):
+        with instrument() as records:
+            EqualWidthBinner(num_bins=2).bin(make_items([0, 1, 2, 3]))
+            EqualWidthBinner(num_bins=2).bin(BinItemBatch(np.asarray([0, 1, 2, 3]), list("abcd")))
+
+        self.assertEqual([record.num_items for record in records], [4, 4])
+        self.assertEqual(set(records[0].phase_seconds), {"configure", "bin"})
+        self.assertEqual(set(records[1].phase_seconds), {"configure", "bin", "collect"})
+        for record in records:
+            self.assertTrue(all(seconds >= 0 for seconds in record.phase_seconds.values()))
+
+    def test_callback_and_logger(self):
+        received = []
+        logger = logging.getLogger("test_instrumentation")
+        with self.assertLogs(logger, logging.DEBUG) as logs:
+            with instrument(received.append, logger, logging.DEBUG) as records:
+                KeyBinner().bin(make_items([1]))
+
+        self.assertEqual(received, records)
+        self.assertEqual(len(logs.records), 1)
+        self.assertEqual(logs.records[0].getMessage(), str(records[0]))
+
+    def test_nested_contexts(self):
+        with instrument() as outer_records:
+            KeyBinner().bin(make_items([1]))
+            with instrument() as inner_records:
+                KeyBinner().bin(make_items([1, 2]))
+            KeyBinner().bin(make_items([1, 2, 3]))
+
+        self.assertEqual([record.num_items for record in inner_records], [2])
+        self.assertEqual([record.num_items for record in outer_records], [1, 2, 3])
+        self.assertIs(outer_records[1], inner_records[0])
+
+    def test_disabled(self):
+        self.assertIsNone(get_recorder())
+
+        with instrument() as records:
+            self.assertIsNotNone(get_recorder())
+        self.assertIsNone(get_recorder())
+
+        # Binning after the context exits isn't recorded
+        KeyBinner().bin(make_items([1, 2]))
+        self.assertEqual(records, [])
+
+    def test_other_binning_methods_not_recorded(self):
+        binner = EqualWidthBinner(num_bins=2)
+        with instrument() as records:
+            binner.bin_array(np.asarray([0, 1, 2]))
+            binner.count(make_items([0, 1, 2]))
+            binner.transform(make_items([0, 1]), binner.fit(make_items([0, 1, 2])))
+
+        self.assertEqual(records, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
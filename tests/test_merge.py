@@ -0,0 +1,88 @@
+"""
+Tests of Binning.merge/+, and that the deprecated dictionary configuration
+API bins the same as binning with the configuration directly.
+"""
+import unittest
+import warnings
+
+from wai.bynning import Bin, BinItem, Binning
+from wai.bynning.binners import EqualWidthBinner, KeyBinner
+
+
+def make_items(keys, start=0):
+    """
+    Creates bin-items for the given keys, with their index as payload.
+    """
+    return [BinItem(key, index) for index, key in enumerate(keys, start)]
+
+
+def as_lists(binning):
+    """
+    Converts a binning to a list of (label, [payload, ...]) pairs.
+    """
+    return [(bin.label, [item.payload for item in bin]) for bin in binning]
+
+
+class TestMerge(unittest.TestCase):
+    def test_merge(self):
+        first = KeyBinner().bin(make_items(["a", "b", "a"]))
+        second = KeyBinner().bin(make_items(["c", "a"], 3))
+        third = KeyBinner().bin(make_items(["b", "d"], 5))
+
+        merged = first.merge(second, third)
+        self.assertEqual(as_lists(merged), [("a", [0, 2, 4]), ("b", [1, 5]), ("c", [3]), ("d", [6])])
+
+        # Merged binnings aren't modified
+        self.assertEqual(as_lists(first), [("a", [0, 2]), ("b", [1])])
+        self.assertEqual(as_lists(second), [("c", [3]), ("a", [4])])
+
+    def test_merge_matches_binning_whole(self):
+        keys = [3, 1, 3, 2, 1, 1, 4, 2, 3, 0]
+        whole = KeyBinner().bin(make_items(keys))
+        for split in range(len(keys) + 1):
+            with self.subTest(split=split):
+                first = KeyBinner().bin(make_items(keys[:split]))
+                second = KeyBinner().bin(make_items(keys[split:], split))
+                self.assertEqual(as_lists(first.merge(second)), as_lists(whole))
+                self.assertEqual(as_lists(first + second), as_lists(whole))
+
+    def test_merge_nothing(self):
+        binning = KeyBinner().bin(make_items([1, 2, 1]))
+        merged = binning.merge()
+        self.assertIsNot(merged, binning)
+        self.assertEqual(as_lists(merged), as_lists(binning))
+
+    def test_add(self):
+        first, second = Bin("x"), Bin("x")
+        first.add_item(BinItem(0, 0))
+        second.add_item(BinItem(1, 1))
+        self.assertEqual(as_lists(Binning([first]) + Binning([second])), [("x", [0, 1])])
+
+        with self.assertRaises(TypeError):
+            Binning([first]) + [second]
+
+
+class TestDeprecatedConfiguration(unittest.TestCase):
+    def test_bin_configured_matches_transform(self):
+        binner = EqualWidthBinner(num_bins=3)
+        binner.bin(make_items([0, 3, 6, 9]))
+        shard = make_items([-1, 2, 5, 8, 12])
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            configuration = binner.get_configuration()
+            binning = EqualWidthBinner(num_bins=3).bin_configured(shard, configuration)
+        self.assertEqual([warning.category for warning in caught], [DeprecationWarning] * 2)
+
+        expected = EqualWidthBinner(num_bins=3).transform(shard, binner.fit(make_items([0, 3, 6, 9])))
+        self.assertEqual(as_lists(binning), as_lists(expected))
+
+    def test_bin_configured_checks_configuration(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            with self.assertRaises(ValueError):
+                EqualWidthBinner(num_bins=3).bin_configured(make_items([1]), {"min": 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
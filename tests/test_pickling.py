@@ -0,0 +1,74 @@
+"""
+Tests that bin-items, bins and each type of binning survive a pickle
+round-trip with their type and state intact.
+"""
+import pickle
+import unittest
+
+import numpy as np
+
+from wai.bynning import Bin, BinItem, BinItemBatch, Binning, ColumnarBinning, IncrementalBinning
+from wai.bynning.binners import EqualWidthBinner, KeyBinner, MinSizeBinner, SplitBinner
+
+
+def round_trip(obj):
+    """
+    Pickles and unpickles an object.
+    """
+    return pickle.loads(pickle.dumps(obj))
+
+
+def as_lists(binning):
+    """
+    Converts a binning to a list of (label, [(key, payload), ...]) pairs.
+    """
+    return [(bin.label, [(item.bin_key, item.payload) for item in bin]) for bin in binning]
+
+
+class TestPickling(unittest.TestCase):
+    def test_bin_item(self):
+        item = round_trip(BinItem(3, "a"))
+        self.assertEqual((item.bin_key, item.payload), (3, "a"))
+
+    def test_bin(self):
+        bin = Bin("x")
+        bin.add_items([BinItem(1, "a"), BinItem(2, "b")])
+        restored = round_trip(bin)
+        self.assertIs(type(restored), Bin)
+        self.assertEqual(restored.label, "x")
+        self.assertEqual([(item.bin_key, item.payload) for item in restored], [(1, "a"), (2, "b")])
+
+    def test_binning(self):
+        binning = KeyBinner().bin([BinItem(key, index) for index, key in enumerate([1, 2, 1, 3])])
+        restored = round_trip(binning)
+        self.assertIs(type(restored), Binning)
+        self.assertEqual(as_lists(restored), as_lists(binning))
+        self.assertTrue(restored.contains_key(3))
+        self.assertEqual(restored.num_items(), 4)
+
+    def test_columnar_binning(self):
+        batch = BinItemBatch(np.asarray([0, 5, 10, 1]), ["a", "b", "c", "d"])
+        binning = EqualWidthBinner(num_bins=3).bin(batch)
+        restored = round_trip(binning)
+        self.assertIs(type(restored), ColumnarBinning)
+        self.assertEqual(as_lists(restored), as_lists(binning))
+        self.assertEqual(restored.codes.tolist(), binning.codes.tolist())
+        self.assertTrue(all(restored.contains_item(item) for item in restored.item_iterator()))
+
+    def test_incremental_binning(self):
+        for binner in (SplitBinner(1, 2), KeyBinner(), MinSizeBinner(2)):
+            with self.subTest(binner=type(binner).__name__):
+                binning = IncrementalBinning(binner, [BinItem(1, index) for index in range(5)])
+                restored = round_trip(binning)
+                self.assertIs(type(restored), IncrementalBinning)
+                self.assertEqual(as_lists(restored), as_lists(binning))
+
+                # Both should continue binning identically
+                further = [BinItem(1, index) for index in range(5, 9)]
+                binning.extend(further)
+                restored.extend(further)
+                self.assertEqual(as_lists(restored), as_lists(binning))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+Tests that randomised_stratified_cross_validation_folds (and its index-based
+version) give the same folds as the original implementation, which shuffled
+and stratified bin-items.
+"""
+import unittest
+from random import Random
+
+from wai.bynning import BinItem
+from wai.bynning.binners import CrossValidationFoldBinner, StratifyingBinner
+from wai.bynning.operations import (
+    randomised_stratified_cross_validation_folds, randomised_stratified_cross_validation_fold_indices
+)
+
+
+def reference_randomised_folds(items, num_folds, rand):
+    """
+    Creates randomised stratified folds by shuffling and stratifying
+    bin-items, as randomised_stratified_cross_validation_folds originally did.
+    """
+    bin_items = [BinItem(index, item) for index, item in enumerate(items)]
+    rand.shuffle(bin_items)
+    stratified = StratifyingBinner(num_folds).bin(bin_items)
+    fold_binnings = CrossValidationFoldBinner(num_folds).bin_all_folds(list(stratified.item_iterator()))
+    return [
+        tuple([item.payload for item in fold_binning[label]]
+              for label in (CrossValidationFoldBinner.TRAIN_BIN_LABEL, CrossValidationFoldBinner.TEST_BIN_LABEL))
+        for fold_binning in fold_binnings
+    ]
+
+
+class TestRandomisedStratifiedFolds(unittest.TestCase):
+    def test_matches_reference(self):
+        for num_items in (2, 3, 10, 37, 100):
+            items = [f"item{index}" for index in range(num_items)]
+            for num_folds in (2, 3, 10):
+                if num_folds > num_items:
+                    continue
+                for seed in range(3):
+                    with self.subTest(num_items=num_items, num_folds=num_folds, seed=seed):
+                        folds = [
+                            (list(train), list(test))
+                            for train, test in randomised_stratified_cross_validation_folds(
+                                iter(items), num_folds, Random(seed))
+                        ]
+                        self.assertEqual(folds, reference_randomised_folds(items, num_folds, Random(seed)))
+
+                        index_folds = [
+                            ([items[index] for index in train], [items[index] for index in test])
+                            for train, test in randomised_stratified_cross_validation_fold_indices(
+                                num_items, num_folds, Random(seed))
+                        ]
+                        self.assertEqual(index_folds, folds)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            randomised_stratified_cross_validation_folds(range(3), 4)
+        with self.assertRaises(ValueError):
+            randomised_stratified_cross_validation_folds(range(3), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+"""
+Tests of weighted equal-frequency binning, and that MinSizeBinner bins the
+same in a single pass when given the total size as with its two-pass path.
+"""
+import unittest
+from random import Random
+
+import numpy as np
+
+from wai.bynning import BinItem
+from wai.bynning.binners import FrequencyBinner, MinSizeBinner
+from wai.bynning.extraction import Extractor
+from wai.bynning.util import weighted_frequency_divide
+
+
+class PayloadExtractor(Extractor[BinItem, float]):
+    """
+    Extracts the payload of a bin-item (its weight in these tests).
+    """
+    def extract(self, item: BinItem) -> float:
+        return item.payload
+
+
+def as_lists(binning):
+    """
+    Converts a binning to a list of (label, [payload, ...]) pairs.
+    """
+    return [(bin.label, [item.payload for item in bin]) for bin in binning]
+
+
+class TestWeightedFrequencyDivide(unittest.TestCase):
+    def test_balance(self):
+        # Each segment's weight is within the heaviest item's weight of an equal share
+        rand = Random(0)
+        for trial in range(200):
+            weights = np.asarray([rand.choice([0, 1, 2, 5, 10, 0.5]) for _ in range(rand.randint(1, 60))])
+            num_segments = rand.randint(1, 8)
+            with self.subTest(trial=trial):
+                boundaries = weighted_frequency_divide(weights, num_segments)
+                self.assertEqual(len(boundaries), num_segments + 1)
+                self.assertEqual((boundaries[0], boundaries[-1]), (0, len(weights)))
+                self.assertTrue(np.all(np.diff(boundaries) >= 0))
+
+                segment_weights = np.add.reduceat(np.append(weights, 0), boundaries[:-1])
+                segment_weights[np.diff(boundaries) == 0] = 0
+                share = weights.sum() / num_segments
+                self.assertLessEqual(np.abs(segment_weights - share).max(), weights.max() + 1e-9)
+
+    def test_examples(self):
+        self.assertEqual(weighted_frequency_divide(np.asarray([1, 1, 1, 1]), 2).tolist(), [0, 2, 4])
+        self.assertEqual(weighted_frequency_divide(np.asarray([3, 1, 1, 1]), 2).tolist(), [0, 1, 4])
+        # A heavy item spanning a segment leaves it empty
+        self.assertEqual(weighted_frequency_divide(np.asarray([1, 1, 10]), 3).tolist(), [0, 2, 3, 3])
+        self.assertEqual(weighted_frequency_divide(np.asarray([], dtype=int), 2).tolist(), [0, 0, 0])
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            weighted_frequency_divide(np.asarray([1, 2]), 0)
+        with self.assertRaises(ValueError):
+            weighted_frequency_divide(np.asarray([1, -2]), 2)
+
+
+class TestWeightedFrequencyBinner(unittest.TestCase):
+    def test_bins_by_key_with_balanced_weight(self):
+        rand = Random(1)
+        keys = [rand.uniform(0, 100) for _ in range(300)]
+        weights = [rand.randint(1, 10) for _ in range(300)]
+        items = [BinItem(key, weight) for key, weight in zip(keys, weights)]
+        share = sum(weights) / 5
+
+        for preserve_order in (False, True):
+            with self.subTest(preserve_order=preserve_order):
+                binning = FrequencyBinner(5, weight_extractor=PayloadExtractor(),
+                                          preserve_order=preserve_order).bin(items)
+                for bin in binning:
+                    self.assertLessEqual(abs(sum(item.payload for item in bin) - share), max(weights))
+
+                # Bins are contiguous ranges of keys
+                ranges = sorted((min(item.bin_key for item in bin), max(item.bin_key for item in bin))
+                                for bin in binning)
+                for (_, previous_max), (next_min, _) in zip(ranges, ranges[1:]):
+                    self.assertLess(previous_max, next_min)
+
+                # Matches binning the arrays
+                labels = FrequencyBinner(5).bin_weighted_array(np.asarray(keys), np.asarray(weights))
+                self.assertEqual({bin.label: sorted(map(id, bin)) for bin in binning},
+                                 {label: sorted(id(item) for item, item_label in zip(items, labels.tolist())
+                                                if item_label == label)
+                                  for label in set(labels.tolist())})
+
+    def test_unit_weights_balance_counts(self):
+        items = [BinItem(key, 1) for key in range(10)]
+        binning = FrequencyBinner(3, weight_extractor=PayloadExtractor()).bin(items)
+        self.assertEqual([len(bin) for bin in binning], [3, 4, 3])
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            FrequencyBinner(3, weight_extractor=PayloadExtractor(), relative_error=0.1)
+        with self.assertRaises(ValueError):
+            FrequencyBinner(3).bin_weighted_array(np.asarray([1, 2]), np.asarray([1]))
+        with self.assertRaises(NotImplementedError):
+            FrequencyBinner(3, weight_extractor=PayloadExtractor()).bin_array(np.asarray([1, 2, 3]))
+
+
+class TestMinSizeBinnerTotalSize(unittest.TestCase):
+    def test_matches_two_pass(self):
+        rand = Random(2)
+        for trial in range(50):
+            sizes = [rand.randint(1, 10) for _ in range(rand.randint(1, 100))]
+            min_size = rand.randint(1, sum(sizes))
+            items = [BinItem(size, index) for index, size in enumerate(sizes)]
+            with self.subTest(trial=trial):
+                expected = as_lists(MinSizeBinner(min_size).bin(items))
+                single_pass = MinSizeBinner(min_size, total_size=sum(sizes))
+                self.assertEqual(as_lists(single_pass.bin(iter(items))), expected)
+
+                # Array binning agrees with both paths
+                labels = MinSizeBinner(min_size).bin_array(np.asarray(sizes))
+                single_pass_labels = MinSizeBinner(min_size, total_size=sum(sizes)).bin_array(np.asarray(sizes))
+                np.testing.assert_array_equal(single_pass_labels, labels)
+                self.assertEqual([(label, np.flatnonzero(labels == label).tolist()) for label in np.unique(labels)],
+                                 expected)
+
+    def test_not_enough_size(self):
+        with self.assertRaises(ValueError):
+            MinSizeBinner(10, total_size=9).bin([BinItem(9, 0)])
+
+
+if __name__ == '__main__':
+    unittest.main()